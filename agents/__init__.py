@@ -5,6 +5,7 @@ from .orchestrator_agent import OrchestratorAgent
 from .personalize_agent import PersonalizeAgent
 from .query_writer_agent import QueryWriterAgent
 from .searcher_agent import SearcherAgent
+from .query_searcher_agent import QuerySearcherAgent
 from .knowledge_graph_agent import KnowledgeGraphAgent
 from .kg_search_agent import KGSearchAgent
 from .db_constructor_agent import DBConstructorAgent
@@ -21,6 +22,7 @@ __all__ = [
     "PersonalizeAgent",
     "QueryWriterAgent",
     "SearcherAgent",
+    "QuerySearcherAgent",
     "KnowledgeGraphAgent",
     "KGSearchAgent",
     "DBConstructorAgent",
@@ -0,0 +1,195 @@
+"""Streaming WAV sink and chunk-wise post-processing for TTS output."""
+
+import os
+import shutil
+import subprocess
+import wave
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+try:
+    from constants.configuration import AUDIO_POSTPROCESS_CONFIGS, TTS_SYNTHESIS_CONFIGS
+except ImportError:
+    from ..constants.configuration import AUDIO_POSTPROCESS_CONFIGS, TTS_SYNTHESIS_CONFIGS
+
+# 16-bit PCM 기준 최대 진폭
+_FULL_SCALE = 32768.0
+_CODECS = {"mp3": "libmp3lame", "opus": "libopus"}
+
+
+def _to_dbfs(value: float) -> float:
+    """진폭(0 ~ 1)을 dBFS로 변환합니다."""
+    return float(20 * np.log10(max(value, 1e-10)))
+
+
+class AudioSink:
+    """TTS 청크의 PCM을 도착 순서대로 WAV 파일에 바로 이어 쓰는 클래스.
+
+    전체 오디오를 메모리에 모으지 않고 청크마다 무음 제거와 크로스페이드를 적용해 쓰며,
+    WAV 헤더의 길이 정보는 close() 시점에 갱신됩니다. 크로스페이드를 위해
+    직전 청크의 끝부분(crossfade_ms)만 보관하고, 정규화에 쓸 RMS/피크를 함께 집계합니다.
+    """
+
+    def __init__(self, path: str, config: Optional[Dict[str, Any]] = None):
+        self.path = Path(path)
+        self.config = {**AUDIO_POSTPROCESS_CONFIGS, **(config or {})}
+        self.channels = TTS_SYNTHESIS_CONFIGS["channels"]
+        self.rate = TTS_SYNTHESIS_CONFIGS["sample_rate"]
+        if TTS_SYNTHESIS_CONFIGS["sample_width"] != 2:
+            raise ValueError("AudioSink는 16-bit PCM만 지원합니다.")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._wave = wave.open(str(self.path), "wb")
+        self._wave.setnchannels(self.channels)
+        self._wave.setsampwidth(2)
+        self._wave.setframerate(self.rate)
+
+        self._crossfade_frames = int(self.rate * self.config["crossfade_ms"] / 1000)
+        self._tail: Optional[np.ndarray] = None
+        self._frames = 0
+        self._sum_squares = 0.0
+        self._peak = 0.0
+        self.segments = 0
+
+    def _trim_silence(self, samples: np.ndarray) -> np.ndarray:
+        """앞뒤 무음을 keep_silence_ms만 남기고 잘라냅니다. (10ms 창 단위 RMS 기준)"""
+        window = max(1, self.rate // 100)
+        count = len(samples) // window
+        if count == 0:
+            return samples
+
+        windows = samples[:count * window].reshape(count, -1)
+        rms = np.sqrt(np.mean(np.square(windows / _FULL_SCALE), axis=1))
+        threshold = 10 ** (self.config["silence_threshold_dbfs"] / 20)
+        voiced = np.flatnonzero(rms > threshold)
+        if len(voiced) == 0:
+            return samples[:0]
+
+        keep = int(self.rate * self.config["keep_silence_ms"] / 1000)
+        start = max(0, voiced[0] * window - keep)
+        end = min(len(samples), (voiced[-1] + 1) * window + keep)
+        return samples[start:end]
+
+    def _write(self, samples: np.ndarray) -> None:
+        if len(samples) == 0:
+            return
+        pcm = np.clip(np.rint(samples), -_FULL_SCALE, _FULL_SCALE - 1).astype("<i2")
+        normalized = pcm.astype(np.float64) / _FULL_SCALE
+        self._sum_squares += float(np.sum(np.square(normalized)))
+        self._peak = max(self._peak, float(np.max(np.abs(normalized))))
+        self._frames += len(pcm)
+        self._wave.writeframesraw(pcm.tobytes())
+
+    def write_segment(self, pcm: bytes) -> None:
+        """청크 하나의 PCM(16-bit little endian)을 이어 씁니다."""
+        samples = np.frombuffer(pcm, dtype="<i2").reshape(-1, self.channels).astype(np.float32)
+        if self.config["trim_silence"]:
+            samples = self._trim_silence(samples)
+        self.segments += 1
+
+        # 보관해 둔 직전 청크의 끝부분과 이번 청크의 앞부분을 선형으로 겹침
+        if self._tail is not None:
+            overlap = min(len(self._tail), len(samples))
+            self._write(self._tail[:len(self._tail) - overlap])
+            if overlap:
+                ramp = np.linspace(0.0, 1.0, overlap, endpoint=False, dtype=np.float32)[:, None]
+                self._write(self._tail[len(self._tail) - overlap:] * (1 - ramp) + samples[:overlap] * ramp)
+            samples = samples[overlap:]
+
+        hold = min(self._crossfade_frames, len(samples))
+        self._write(samples[:len(samples) - hold])
+        self._tail = samples[len(samples) - hold:] if hold else None
+
+    def close(self) -> Dict[str, Any]:
+        """남은 오디오를 쓰고 WAV 헤더를 갱신한 뒤 통계를 반환합니다."""
+        if self._tail is not None:
+            self._write(self._tail)
+            self._tail = None
+        self._wave.close()
+
+        samples = self._frames * self.channels
+        rms = np.sqrt(self._sum_squares / samples) if samples else 0.0
+        return {
+            "path": str(self.path),
+            "segments": self.segments,
+            "frames": self._frames,
+            "duration_seconds": round(self._frames / self.rate, 2),
+            "rms_dbfs": round(_to_dbfs(rms), 2),
+            "peak_dbfs": round(_to_dbfs(self._peak), 2)
+        }
+
+    def abort(self) -> None:
+        """쓰다 만 파일을 닫고 삭제합니다."""
+        try:
+            self._wave.close()
+        finally:
+            self.path.unlink(missing_ok=True)
+
+
+def normalize_wave(path: str, stats: Dict[str, Any], config: Optional[Dict[str, Any]] = None) -> float:
+    """AudioSink가 집계한 RMS로 게인을 정해 WAV를 블록 단위로 다시 씁니다. (2-pass 정규화)
+
+    목표 RMS에 맞추되 피크가 peak_ceiling_dbfs를 넘지 않도록 게인을 제한하며,
+    적용한 게인(dB)을 반환합니다.
+    """
+    config = {**AUDIO_POSTPROCESS_CONFIGS, **(config or {})}
+    if not stats.get("frames"):
+        return 0.0
+
+    gain_db = config["target_rms_dbfs"] - stats["rms_dbfs"]
+    gain_db = min(gain_db, config["peak_ceiling_dbfs"] - stats["peak_dbfs"])
+    if abs(gain_db) < 0.1:
+        return 0.0
+
+    gain = 10 ** (gain_db / 20)
+    tmp_path = f"{path}.normalizing"
+    with wave.open(path, "rb") as src, wave.open(tmp_path, "wb") as dst:
+        dst.setparams(src.getparams())
+        while True:
+            frames = src.readframes(config["block_frames"])
+            if not frames:
+                break
+            block = np.frombuffer(frames, dtype="<i2").astype(np.float32) * gain
+            dst.writeframesraw(np.clip(np.rint(block), -_FULL_SCALE, _FULL_SCALE - 1).astype("<i2").tobytes())
+    os.replace(tmp_path, path)
+    return round(gain_db, 2)
+
+
+def encode_audio(path: str, audio_format: str, bitrate: Optional[str] = None) -> Optional[str]:
+    """ffmpeg로 WAV를 배포용 포맷(mp3, opus)으로 인코딩합니다. ffmpeg가 없으면 None을 반환합니다."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        print(f"⚠️ ffmpeg가 설치되어 있지 않아 {audio_format} 인코딩을 건너뜁니다.")
+        return None
+    if audio_format not in _CODECS:
+        raise ValueError(f"지원하지 않는 오디오 포맷입니다: {audio_format}")
+
+    bitrate = bitrate or AUDIO_POSTPROCESS_CONFIGS["bitrates"][audio_format]
+    output_path = str(Path(path).with_suffix(f".{audio_format}"))
+    subprocess.run(
+        [ffmpeg, "-y", "-loglevel", "error", "-i", path,
+         "-c:a", _CODECS[audio_format], "-b:a", bitrate, output_path],
+        check=True
+    )
+    return output_path
+
+
+def finalize_audio(path: str, stats: Dict[str, Any], config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """정규화와 배포용 인코딩을 설정에 따라 수행하고 결과를 반환합니다."""
+    config = {**AUDIO_POSTPROCESS_CONFIGS, **(config or {})}
+    result: Dict[str, Any] = {"gain_db": 0.0, "encoded_files": {}}
+
+    if config["normalize"]:
+        result["gain_db"] = normalize_wave(path, stats, config)
+
+    for audio_format in config["encode_formats"]:
+        try:
+            encoded = encode_audio(path, audio_format, config["bitrates"].get(audio_format))
+        except (subprocess.CalledProcessError, ValueError) as e:
+            print(f"⚠️ {audio_format} 인코딩 실패: {e}")
+            continue
+        if encoded:
+            result["encoded_files"][audio_format] = encoded
+    return result
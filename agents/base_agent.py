@@ -1,5 +1,7 @@
 """Base agent class for the multi-agent workflow system."""
 
+import asyncio
+import functools
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
@@ -8,8 +10,12 @@ from langgraph.graph.message import add_messages
 
 try:
     from state import WorkflowState
+    from instrumentation import trace_span, record_event
+    from constants.agents import AGENT_TIMEOUTS, AGENT_RETRY_ATTEMPTS
 except ImportError:
     from ..state import WorkflowState
+    from ..instrumentation import trace_span, record_event
+    from ..constants.agents import AGENT_TIMEOUTS, AGENT_RETRY_ATTEMPTS
 
 
 @dataclass
@@ -22,21 +28,58 @@ class AgentResult:
     metadata: Optional[Dict[str, Any]] = None
 
 
+def _instrument_process(process):
+    """process()를 span으로 감싸 실행 통계를 기록하고 에이전트 타임아웃을 적용합니다."""
+    if getattr(process, "_instrumented", False):
+        return process
+    
+    @functools.wraps(process)
+    async def instrumented(self, state, *args, **kwargs):
+        # AGENT_TIMEOUTS에 등록된 워크플로우 단계에만 타임아웃 적용
+        timeout = self.timeout if self.name in AGENT_TIMEOUTS else None
+        attributes = {"agent.name": self.name, "agent.timeout_s": timeout or 0}
+        with trace_span(self.name, attributes) as span:
+            try:
+                return await asyncio.wait_for(process(self, state, *args, **kwargs), timeout=timeout)
+            except asyncio.TimeoutError:
+                message = f"{timeout}초 타임아웃 초과"
+                span.add_event("timeout", {"timeout_s": timeout})
+                print(f"[{self.name}] ERROR: {message}")
+                raise TimeoutError(f"[{self.name}] {message}") from None
+    
+    instrumented._instrumented = True
+    return instrumented
+
+
 class BaseAgent(ABC):
-    """모든 에이전트의 기본 클래스."""
+    """모든 에이전트의 기본 클래스.
+    
+    하위 클래스의 process()는 자동으로 계측되어 단계별 wall/CPU 시간, 최대 RSS,
+    LLM/HTTP 사용량과 재시도 횟수가 실행 트레이스에 기록되고
+    AGENT_TIMEOUTS의 타임아웃이 적용됩니다.
+    """
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "process" in cls.__dict__ and not getattr(cls.process, "__isabstractmethod__", False):
+            cls.process = _instrument_process(cls.__dict__["process"])
     
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
         self.required_inputs: List[str] = []
         self.output_keys: List[str] = []
-        self.timeout: int = 60
-        self.retry_attempts: int = 1
+        self.timeout: int = AGENT_TIMEOUTS.get(name, 60)
+        self.retry_attempts: int = AGENT_RETRY_ATTEMPTS.get(name, 1)
         self.priority: int = 1
     
     @abstractmethod
-    async def process(self, state: WorkflowState) -> WorkflowState:
-        """에이전트의 주요 처리 로직을 구현합니다."""
+    async def process(self, state: WorkflowState) -> Dict[str, Any]:
+        """에이전트의 주요 처리 로직을 구현합니다.
+        
+        상태 전체를 복사하지 않고 변경된 필드만 담은 부분 업데이트(dict)를 반환합니다.
+        (build_update 참고. 그래프 밖에서는 state.apply_update로 적용)
+        """
         pass
     
     def validate_inputs(self, state: WorkflowState) -> bool:
@@ -54,24 +97,20 @@ class BaseAgent(ABC):
                 output[key] = result.output[key]
         return output
     
-    def update_workflow_status(self, state: WorkflowState, step_name: str) -> WorkflowState:
-        """워크플로우 상태를 업데이트합니다."""
-        if not hasattr(state, 'workflow_status'):
-            return state
-        
-        workflow_status = state.workflow_status.copy()
-        workflow_status["current_step"] = step_name
-        workflow_status["completed_steps"] += 1
+    def build_update(self, step_name: str, **changes: Any) -> Dict[str, Any]:
+        """변경된 필드만 담은 부분 업데이트를 만듭니다.
         
-        # 상태 업데이트
-        return WorkflowState(
-            **{k: v for k, v in state.__dict__.items() if k != 'workflow_status'},
-            workflow_status=workflow_status
-        )
+        workflow_status에는 변경분만 담아 merge_workflow_status 리듀서가 병합하도록 하고,
+        완료 단계 수는 completed_steps_delta로 1 증가시킵니다.
+        """
+        workflow_status = {"current_step": step_name, "completed_steps_delta": 1}
+        workflow_status.update(changes.pop("workflow_status", None) or {})
+        return {**changes, "workflow_status": workflow_status}
     
     def log_execution(self, message: str, level: str = "INFO"):
-        """에이전트 실행 로그를 기록합니다."""
+        """에이전트 실행 로그를 기록합니다. (현재 span의 이벤트로도 남김)"""
         print(f"[{self.name}] {level}: {message}")
+        record_event(message, {"level": level, "agent.name": self.name})
     
     def get_agent_info(self) -> Dict[str, Any]:
         """에이전트 정보를 반환합니다."""
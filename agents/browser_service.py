@@ -0,0 +1,235 @@
+"""Long-lived headless browser service with a pool of reusable tabs."""
+
+import atexit
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+try:
+    from selenium import webdriver
+    from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
+    class WebDriverException(Exception):
+        """selenium이 없을 때 사용하는 대체 예외."""
+
+    class InvalidSessionIdException(WebDriverException):
+        """selenium이 없을 때 사용하는 대체 예외."""
+
+try:
+    from constants.configuration import WEB_CRAWLING_TOOL_CONFIGS
+except ImportError:
+    from ..constants.configuration import WEB_CRAWLING_TOOL_CONFIGS
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+# 이동 전 문서에 남기는 표시 (새 문서가 로드되면 사라짐)
+_STALE_MARKER = "__agentCastStale"
+
+
+class BrowserTab:
+    """BrowserService에서 빌린 탭.
+
+    WebDriver 명령은 브라우저 하나에서 순서대로만 실행되므로, open()은 이동 명령만 보낸 뒤
+    드라이버 잠금을 풀고 로드 완료를 폴링합니다. 그래서 여러 탭의 페이지 로드가 동시에 진행됩니다.
+    """
+
+    def __init__(self, service: "BrowserService", handle: str):
+        self._service = service
+        self.handle = handle
+
+    def run(self, command: Callable[[Any], Any]) -> Any:
+        """이 탭으로 전환한 드라이버로 command를 실행합니다."""
+        return self._service._run_in_tab(self.handle, command)
+
+    def open(self, url: str, wait_selector: Optional[str] = None, timeout: Optional[float] = None) -> str:
+        """페이지로 이동해 로드(wait_selector가 있으면 해당 요소 등장)를 기다린 뒤 HTML을 반환합니다."""
+        timeout = timeout or self._service.config["page_load_timeout"]
+        self.run(lambda driver: driver.execute_script(
+            f"window.{_STALE_MARKER} = true; window.location.href = arguments[0];", url
+        ))
+
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                ready = self.run(lambda driver: driver.execute_script(
+                    f"if (window.{_STALE_MARKER}) return false;"
+                    "return arguments[0] ? document.querySelector(arguments[0]) !== null"
+                    " : document.readyState === 'complete';",
+                    wait_selector
+                ))
+            except InvalidSessionIdException:
+                raise
+            except WebDriverException:
+                # 문서가 바뀌는 중에는 스크립트 실행이 실패할 수 있음
+                ready = False
+            if ready:
+                return self.run(lambda driver: driver.page_source)
+            if time.monotonic() > deadline:
+                target = f"'{wait_selector}'" if wait_selector else "페이지 로드"
+                raise TimeoutError(f"{url}: {target} 대기 시간 초과 ({timeout}초)")
+            time.sleep(self._service.config["poll_interval"])
+
+
+class BrowserService:
+    """프로세스 전체에서 공유하는 headless Chrome 서비스.
+
+    처음 탭을 빌릴 때 한 번만 브라우저를 띄우고(ChromeDriver 경로는 파일에 캐시),
+    실행 간 HTTP 캐시와 쿠키가 남도록 고정 프로필을 사용합니다. 탭은 max_tabs개까지 만들어
+    반납 후 재사용하며, 탭마다 CDP Network.setBlockedURLs로 이미지/폰트/미디어/분석 요청을 차단합니다.
+    driver_factory를 넘기면 Chrome 대신 그 함수가 만든 드라이버를 사용합니다. (테스트용)
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, driver_factory: Optional[Callable[[], Any]] = None):
+        self.config = {**WEB_CRAWLING_TOOL_CONFIGS["browser_service"], **(config or {})}
+        self._driver_factory = driver_factory or self._launch_chrome
+        self._driver: Optional[Any] = None
+        self._current_handle: Optional[str] = None
+        # 드라이버 세대 (브라우저를 다시 띄우면 이전 세대의 탭은 반납하지 않음)
+        self._generation = 0
+        self._driver_lock = threading.RLock()
+        self._idle_tabs: "queue.Queue[str]" = queue.Queue()
+        self._tab_slots = threading.BoundedSemaphore(self.config["max_tabs"])
+        self._atexit_registered = False
+        self.stats = {"launches": 0, "launch_seconds": 0.0, "tabs_created": 0, "borrows": 0}
+
+    def _driver_path(self) -> str:
+        """ChromeDriver 경로를 설정 경로, 캐시 파일, webdriver_manager 설치 순서로 찾습니다."""
+        configured = WEB_CRAWLING_TOOL_CONFIGS["selenium"]["webdriver_path"]
+        if configured and Path(configured).exists():
+            return configured
+
+        cache_file = Path(self.config["driver_path_cache"])
+        if cache_file.exists():
+            cached = cache_file.read_text(encoding="utf-8").strip()
+            if cached and Path(cached).exists():
+                return cached
+
+        # 버전 확인/다운로드로 수 초가 걸리므로 결과 경로를 저장해 다음 실행부터 건너뜀
+        path = ChromeDriverManager().install()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(path, encoding="utf-8")
+        return path
+
+    def _launch_chrome(self) -> Any:
+        """고정 프로필과 요청 차단 옵션으로 headless Chrome을 띄웁니다."""
+        if not SELENIUM_AVAILABLE:
+            raise RuntimeError("selenium이 설치되지 않아 브라우저를 시작할 수 없습니다.")
+        options = Options()
+        for option in WEB_CRAWLING_TOOL_CONFIGS["selenium"]["browser_options"]:
+            options.add_argument(option)
+        profile_dir = Path(self.config["profile_dir"]).resolve()
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        options.add_argument(f"--user-data-dir={profile_dir}")
+        options.add_argument(f"user-agent={DEFAULT_USER_AGENT}")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        # 이동 명령이 로드 완료를 기다리지 않도록 해 탭별 로드를 겹쳐 진행
+        options.page_load_strategy = "none"
+        return webdriver.Chrome(service=Service(self._driver_path()), options=options)
+
+    def _ensure_driver(self) -> None:
+        """브라우저가 없으면 띄웁니다. (드라이버 잠금 안에서 호출)"""
+        if self._driver is not None:
+            return
+
+        started = time.perf_counter()
+        print("🌐 headless 브라우저를 시작합니다...")
+        self._driver = self._driver_factory()
+        self._generation += 1
+        self._current_handle = self._driver.current_window_handle
+        self._configure_tab(self._current_handle)
+        self._idle_tabs.put(self._current_handle)
+
+        self.stats["launches"] += 1
+        self.stats["launch_seconds"] += round(time.perf_counter() - started, 3)
+        if not self._atexit_registered:
+            atexit.register(self.shutdown)
+            self._atexit_registered = True
+
+    def _configure_tab(self, handle: str) -> None:
+        """탭에 요청 차단 규칙을 적용합니다. (CDP 설정은 탭 단위)"""
+        self._driver.execute_cdp_cmd("Network.enable", {})
+        self._driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.config["blocked_url_patterns"]})
+        self.stats["tabs_created"] += 1
+
+    def _open_tab(self) -> str:
+        self._driver.switch_to.new_window("tab")
+        self._current_handle = self._driver.current_window_handle
+        self._configure_tab(self._current_handle)
+        return self._current_handle
+
+    def _run_in_tab(self, handle: str, command: Callable[[Any], Any]) -> Any:
+        with self._driver_lock:
+            if self._driver is None:
+                raise RuntimeError("브라우저가 종료되었습니다.")
+            if self._current_handle != handle:
+                self._driver.switch_to.window(handle)
+                self._current_handle = handle
+            try:
+                return command(self._driver)
+            except InvalidSessionIdException:
+                # 브라우저가 죽었으면 다음 대여 때 다시 띄움
+                self._discard_driver()
+                raise
+
+    @contextmanager
+    def tab(self) -> Iterator[BrowserTab]:
+        """탭을 빌려줍니다. 유휴 탭이 없으면 max_tabs까지 새로 열고, 그 이상은 반납을 기다립니다."""
+        with self._tab_slots:
+            with self._driver_lock:
+                self._ensure_driver()
+                generation = self._generation
+                try:
+                    handle = self._idle_tabs.get_nowait()
+                except queue.Empty:
+                    handle = self._open_tab()
+                self.stats["borrows"] += 1
+
+            try:
+                yield BrowserTab(self, handle)
+            finally:
+                with self._driver_lock:
+                    if generation == self._generation and self._driver is not None:
+                        self._idle_tabs.put(handle)
+
+    def render(self, url: str, wait_selector: Optional[str] = None, timeout: Optional[float] = None) -> str:
+        """탭을 빌려 페이지를 렌더링한 HTML을 반환합니다. (블로킹 호출이므로 비동기 코드에서는 스레드에서 실행)"""
+        with self.tab() as tab:
+            return tab.open(url, wait_selector=wait_selector, timeout=timeout)
+
+    def _discard_driver(self) -> None:
+        driver, self._driver = self._driver, None
+        self._current_handle = None
+        self._idle_tabs = queue.Queue()
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def shutdown(self) -> None:
+        """브라우저를 종료합니다. 이후 탭을 빌리면 다시 띄웁니다."""
+        with self._driver_lock:
+            if self._driver is not None:
+                print("🌐 headless 브라우저를 종료합니다.")
+            self._discard_driver()
+
+
+_service: Optional[BrowserService] = None
+_service_lock = threading.Lock()
+
+
+def get_browser_service() -> BrowserService:
+    """프로세스 전역 BrowserService를 반환합니다. (브라우저는 처음 탭을 빌릴 때 시작)"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = BrowserService()
+        return _service
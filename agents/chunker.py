@@ -0,0 +1,251 @@
+"""Sentence-aware, token-budgeted text chunker."""
+
+import math
+import re
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+try:
+    from constants.configuration import CHUNKING_CONFIGS
+except ImportError:
+    from ..constants.configuration import CHUNKING_CONFIGS
+
+# text-embedding-3 계열 임베딩 모델의 토크나이저
+DEFAULT_ENCODING = "cl100k_base"
+# 스트리밍 입력을 문장 경계에서 끊어 처리하기 전까지 모으는 최소 문자 수
+_STREAM_BUFFER_CHARS = 64 * 1024
+# 구분자/공백 없는 스트림을 자를 때 토큰 한도를 문자 수로 환산하는 비율 (토큰당 평균 문자 수의 상한 근사)
+_CHARS_PER_TOKEN = 4
+_WORD_PATTERN = re.compile(r"\s*\S+\s*")
+
+
+@dataclass
+class TextChunk:
+    """원문에서 잘라낸 청크와 인용용 문자 오프셋."""
+    index: int
+    text: str
+    start: int  # 원문 기준 시작 문자 위치 (포함)
+    end: int  # 원문 기준 끝 문자 위치 (미포함)
+    tokens: int
+
+
+@dataclass
+class _Piece:
+    start: int
+    text: str
+    tokens: int
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.text)
+
+
+@lru_cache(maxsize=None)
+def _load_encoding(name: str):
+    """tiktoken 인코딩을 불러옵니다. 사용할 수 없으면 None을 반환합니다."""
+    if not TIKTOKEN_AVAILABLE:
+        print("⚠️ tiktoken이 설치되어 있지 않아 토큰 수를 근사치로 계산합니다.")
+        return None
+    try:
+        return tiktoken.get_encoding(name)
+    except Exception as e:
+        # 인코딩 파일을 내려받지 못한 오프라인 환경 등
+        print(f"⚠️ tiktoken 인코딩({name})을 불러오지 못해 토큰 수를 근사치로 계산합니다: {e}")
+        return None
+
+
+def _estimate_tokens(text: str) -> int:
+    """tiktoken 없이 토큰 수를 근사합니다. (영문 약 4자당 1토큰, 한글 등은 1자당 1토큰)"""
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+class TokenChunker:
+    """CHUNKING_CONFIGS 프로필에 따라 문장 경계에서 토큰 수 기준으로 텍스트를 나누는 클래스.
+
+    구분자(separators)로 원문을 문장 단위 조각으로 한 번만 나누고 조각마다 토큰 수를 한 번만 센 뒤,
+    chunk_size 토큰까지 채워 청크를 만들고 끝부분 chunk_overlap 토큰 이내의 문장을 다음 청크에 겹칩니다.
+    chunk_size보다 긴 문장은 단어, 그래도 길면 문자 단위로 나누고, 청크는 max_chunk_size를 넘지 않으며
+    min_chunk_size보다 짧은 마지막 청크는 앞 청크에 합칩니다. 모든 청크는 원문의 연속 구간이므로
+    문자 오프셋(start, end)으로 원문 위치를 인용할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        profile: str = "default",
+        config: Optional[Dict[str, Any]] = None,
+        encoding_name: str = DEFAULT_ENCODING
+    ):
+        if profile not in CHUNKING_CONFIGS:
+            raise ValueError(f"알 수 없는 청킹 프로필입니다: {profile}")
+        self.profile = profile
+        self.config = {**CHUNKING_CONFIGS[profile], **(config or {})}
+        self.chunk_size = self.config["chunk_size"]
+        self.chunk_overlap = self.config["chunk_overlap"]
+        self.min_chunk_size = self.config["min_chunk_size"]
+        self.max_chunk_size = max(self.config["max_chunk_size"], self.chunk_size)
+        if self.chunk_overlap >= self.chunk_size:
+            raise ValueError("chunk_overlap은 chunk_size보다 작아야 합니다.")
+
+        # 긴 구분자를 먼저 시도하도록 정렬 (예: "\n\n"이 "\n"보다 먼저)
+        separators = sorted(self.config["separators"], key=len, reverse=True)
+        self._separator_pattern = re.compile("|".join(re.escape(separator) for separator in separators))
+        self._encoding = _load_encoding(encoding_name)
+
+    def count_tokens(self, text: str) -> int:
+        """텍스트의 토큰 수를 반환합니다."""
+        if self._encoding is None:
+            return _estimate_tokens(text)
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+    def split(self, text: str) -> List[TextChunk]:
+        """텍스트 전체를 청크 목록으로 나눕니다."""
+        return list(self.iter_chunks(text))
+
+    def iter_chunks(self, text: str) -> Iterator[TextChunk]:
+        """텍스트를 한 번 훑으면서 청크를 순서대로 생성합니다."""
+        return self._pack(self._pieces(text, 0))
+
+    def split_stream(self, blocks: Iterable[str]) -> Iterator[TextChunk]:
+        """텍스트 블록 스트림(파일 줄, 응답 조각 등)을 문서 전체를 메모리에 올리지 않고 청크로 나눕니다.
+
+        오프셋은 스트림 전체를 이어 붙인 텍스트 기준입니다.
+        """
+        return self._pack(self._stream_pieces(blocks))
+
+    def _stream_pieces(self, blocks: Iterable[str]) -> Iterator[_Piece]:
+        pending: List[str] = []
+        pending_chars = 0
+        base = 0
+        for block in blocks:
+            pending.append(block)
+            pending_chars += len(block)
+            if pending_chars < _STREAM_BUFFER_CHARS:
+                continue
+
+            buffer = "".join(pending)
+            # 마지막 구분자(없으면 마지막 공백)까지만 처리하고 나머지는 다음 블록과 이어 붙임
+            cut = 0
+            for match in self._separator_pattern.finditer(buffer):
+                cut = match.end()
+            if cut == 0:
+                cut = max(buffer.rfind(" ") + 1, 0)
+            if cut == 0:
+                # 구분자도 공백도 없으면 max_chunk_size 토큰 분량씩 문자 단위로 잘라 바로 처리
+                # (버퍼가 계속 커지며 매 블록마다 다시 탐색되는 것을 방지)
+                limit = self.max_chunk_size * _CHARS_PER_TOKEN
+                cut = len(buffer) - len(buffer) % limit
+                for offset in range(0, cut, limit):
+                    yield from self._fit(buffer[offset:offset + limit], base + offset)
+            else:
+                yield from self._pieces(buffer[:cut], base)
+            base += cut
+            pending = [buffer[cut:]]
+            pending_chars = len(pending[0])
+
+        buffer = "".join(pending)
+        if buffer:
+            yield from self._pieces(buffer, base)
+
+    def _pieces(self, text: str, base: int) -> Iterator[_Piece]:
+        """텍스트를 구분자 경계의 문장 조각으로 나눕니다. (구분자는 앞 조각에 포함)"""
+        start = 0
+        for match in self._separator_pattern.finditer(text):
+            yield from self._fit(text[start:match.end()], base + start)
+            start = match.end()
+        if start < len(text):
+            yield from self._fit(text[start:], base + start)
+
+    def _fit(self, text: str, start: int) -> Iterator[_Piece]:
+        """chunk_size 토큰을 넘는 조각을 단어, 그래도 길면 문자 단위로 나눕니다."""
+        tokens = self.count_tokens(text)
+        if tokens <= self.chunk_size:
+            yield _Piece(start, text, tokens)
+            return
+
+        words = [match.group() for match in _WORD_PATTERN.finditer(text)]
+        if len(words) > 1 and "".join(words) == text:
+            offset = 0
+            group: List[str] = []
+            group_tokens = 0
+            for word in words:
+                word_tokens = self.count_tokens(word)
+                if group and group_tokens + word_tokens > self.chunk_size:
+                    group_text = "".join(group)
+                    yield from self._fit(group_text, start + offset)
+                    offset += len(group_text)
+                    group, group_tokens = [], 0
+                group.append(word)
+                group_tokens += word_tokens
+            if group:
+                yield from self._fit("".join(group), start + offset)
+            return
+
+        # 공백 없이 긴 문자열은 토큰 한도에 맞을 때까지 문자 단위로 반씩 나눔
+        middle = len(text) // 2
+        yield from self._fit(text[:middle], start)
+        yield from self._fit(text[middle:], start + middle)
+
+    def _make_chunk(self, index: int, window: Deque[_Piece], tokens: int) -> TextChunk:
+        return TextChunk(
+            index=index,
+            text="".join(piece.text for piece in window),
+            start=window[0].start,
+            end=window[-1].end,
+            tokens=tokens
+        )
+
+    def _merge(self, previous: TextChunk, last: TextChunk) -> Optional[TextChunk]:
+        """짧은 마지막 청크를 앞 청크에 합칩니다. max_chunk_size를 넘으면 None을 반환합니다."""
+        text = previous.text + last.text[previous.end - last.start:]
+        tokens = self.count_tokens(text)
+        if tokens > self.max_chunk_size:
+            return None
+        return TextChunk(previous.index, text, previous.start, last.end, tokens)
+
+    def _pack(self, pieces: Iterable[_Piece]) -> Iterator[TextChunk]:
+        window: Deque[_Piece] = deque()
+        window_tokens = 0
+        has_new_piece = False  # 마지막 청크 이후 겹침이 아닌 새 조각이 추가되었는지
+        held: Optional[TextChunk] = None  # 마지막 청크 병합을 위해 한 개만 늦게 내보냄
+        index = 0
+
+        for piece in pieces:
+            if has_new_piece and window_tokens + piece.tokens > self.chunk_size:
+                chunk = self._make_chunk(index, window, window_tokens)
+                index += 1
+                if held is not None:
+                    yield held
+                held = chunk
+
+                # 끝부분 chunk_overlap 토큰 이내의 조각만 다음 청크로 넘김
+                while window and window_tokens > self.chunk_overlap:
+                    window_tokens -= window.popleft().tokens
+                has_new_piece = False
+
+            # 겹침 조각과 합쳐 max_chunk_size를 넘으면 겹침을 줄임
+            while window and not has_new_piece and window_tokens + piece.tokens > self.max_chunk_size:
+                window_tokens -= window.popleft().tokens
+
+            window.append(piece)
+            window_tokens += piece.tokens
+            has_new_piece = True
+
+        last = self._make_chunk(index, window, window_tokens) if has_new_piece else None
+        if last is not None and held is not None and last.tokens < self.min_chunk_size:
+            merged = self._merge(held, last)
+            if merged is not None:
+                held, last = merged, None
+
+        if held is not None:
+            yield held
+        if last is not None and last.text.strip():
+            yield last
@@ -0,0 +1,145 @@
+"""Persistent crawl ledger for incremental crawling."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..constants import WEB_CRAWLING_TOOL_CONFIGS
+
+
+class CrawlLedger:
+    """URL별 수집 이력(콘텐츠 해시, 수집 시각, ETag/Last-Modified)을 SQLite에 저장하는 클래스.
+
+    이미 수집한 게시글은 변경 여부를 확인한 뒤 캐시된 레코드를 재사용하여
+    매번 전체 기간을 다시 크롤링하지 않도록 합니다.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, revalidate_after_hours: Optional[float] = None):
+        config = WEB_CRAWLING_TOOL_CONFIGS["crawl_ledger"]
+        self.db_path = Path(db_path or config["db_path"])
+        self.revalidate_after = timedelta(
+            hours=config["revalidate_after_hours"] if revalidate_after_hours is None else revalidate_after_hours
+        )
+
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS crawl_ledger (
+                url TEXT PRIMARY KEY,
+                source TEXT,
+                content_hash TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at TEXT NOT NULL,
+                record_json TEXT NOT NULL,
+                version TEXT
+            )
+            """
+        )
+        # version 컬럼이 없던 이전 수집 이력 DB 마이그레이션
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(crawl_ledger)")}
+        if "version" not in columns:
+            self._conn.execute("ALTER TABLE crawl_ledger ADD COLUMN version TEXT")
+        self._conn.commit()
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        """콘텐츠의 SHA-256 해시를 반환합니다."""
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """URL의 수집 이력을 반환합니다. 없으면 None을 반환합니다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, source, content_hash, etag, last_modified, fetched_at, record_json, version "
+                "FROM crawl_ledger WHERE url = ?",
+                (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "url": row[0],
+            "source": row[1],
+            "content_hash": row[2],
+            "etag": row[3],
+            "last_modified": row[4],
+            "fetched_at": row[5],
+            "record": json.loads(row[6]),
+            "version": row[7]
+        }
+
+    def is_fresh(self, entry: Optional[Dict[str, Any]]) -> bool:
+        """재검증 주기 안에 수집된 이력인지 확인합니다."""
+        if not entry:
+            return False
+        fetched_at = datetime.fromisoformat(entry["fetched_at"])
+        return datetime.now() - fetched_at < self.revalidate_after
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """조건부 요청 헤더(If-None-Match / If-Modified-Since)를 만듭니다."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record(
+        self,
+        url: str,
+        record: Dict[str, Any],
+        source: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        version: Optional[str] = None
+    ) -> bool:
+        """수집한 레코드를 저장합니다. 콘텐츠가 바뀌었거나 새 URL이면 True를 반환합니다.
+
+        etag / last_modified는 HTTP 응답 헤더 값만 저장합니다(조건부 요청에 그대로 사용).
+        HTTP 헤더가 아닌 소스 고유의 변경 표시(예: Discourse 토픽의 bumped_at)는 version에 저장합니다.
+        """
+        new_hash = self.content_hash(record.get("content", ""))
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash FROM crawl_ledger WHERE url = ?", (url,)
+            ).fetchone()
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO crawl_ledger
+                    (url, source, content_hash, etag, last_modified, fetched_at, record_json, version)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    url,
+                    source or record.get("source"),
+                    new_hash,
+                    etag,
+                    last_modified,
+                    datetime.now().isoformat(),
+                    json.dumps(record, ensure_ascii=False),
+                    version
+                )
+            )
+            self._conn.commit()
+        return row is None or row[0] != new_hash
+
+    def touch(self, url: str) -> None:
+        """변경이 없음을 확인한 URL의 수집 시각을 갱신합니다."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE crawl_ledger SET fetched_at = ? WHERE url = ?",
+                (datetime.now().isoformat(), url)
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
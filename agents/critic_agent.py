@@ -3,11 +3,13 @@ import json
 import bert_score
 import rouge_scorer
 from datetime import datetime
+from typing import Any, Dict
 from openai import OpenAI
 from dotenv import load_dotenv
 
 from .base_agent import BaseAgent
 from ..state import WorkflowState
+from ..instrumentation import record_llm_response
 
 # --- 환경 변수 로드 ---
 load_dotenv()  # .env 파일에서 환경 변수 로드
@@ -153,6 +155,7 @@ class ResearchCriticAgent:
                 max_tokens=2000
             )
             
+            record_llm_response(self.model, response)
             evaluation_text = response.choices[0].message.content.strip()
             
             # JSON 파싱
@@ -236,7 +239,7 @@ class CriticAgent(BaseAgent):
         self.output_keys = ["evaluation_results", "critic_feedback", "quality_score"]
         self.critic = ResearchCriticAgent(model)
     
-    async def process(self, state: WorkflowState) -> WorkflowState:
+    async def process(self, state: WorkflowState) -> Dict[str, Any]:
         """리서치 결과를 평가하고 피드백을 생성합니다."""
         self.log_execution("리서치 결과 평가 시작")
         
@@ -262,20 +265,15 @@ class CriticAgent(BaseAgent):
             output_filename = f"AgentCast/output/critic/evaluation_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             save_evaluation_results(evaluation_results, output_filename)
             
-            # 워크플로우 상태 업데이트
-            new_state = WorkflowState(
-                **{k: v for k, v in state.__dict__.items()},
+            # 워크플로우 상태 업데이트 (변경된 필드만 반환)
+            self.log_execution(f"리서치 결과 평가 완료: 점수 {evaluation_results.get('overall_score', 0.0)}")
+            return self.build_update(
+                "critic_completed",
                 evaluation_results=evaluation_results,
                 critic_feedback=evaluation_results.get('detailed_feedback', ''),
                 quality_score=evaluation_results.get('overall_score', 0.0)
             )
             
-            # 워크플로우 상태 업데이트
-            new_state = self.update_workflow_status(new_state, "critic_completed")
-            
-            self.log_execution(f"리서치 결과 평가 완료: 점수 {evaluation_results.get('overall_score', 0.0)}")
-            return new_state
-            
         except Exception as e:
             self.log_execution(f"리서치 결과 평가 중 오류 발생: {str(e)}", "ERROR")
             raise
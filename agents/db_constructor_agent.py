@@ -1,10 +1,21 @@
 """DB Constructor Agent for building vector database from collected data."""
 
 import asyncio
-from typing import Any, Dict, List
-from ..constants import AGENT_NAMES, DB_CONSTRUCTOR_SYSTEM_PROMPT
+import os
+import random
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from openai import AsyncOpenAI, RateLimitError, APITimeoutError, APIConnectionError, InternalServerError
+
+from ..constants import AGENT_NAMES, DB_CONSTRUCTOR_SYSTEM_PROMPT, VECTOR_DB_CONFIGS, CHUNKING_PROFILE_BY_SOURCE
 from .base_agent import BaseAgent, AgentResult
+from .chunker import TokenChunker
+from .vector_index import IVFFlatIndex, normalize_rows
 from ..state import WorkflowState
+from ..instrumentation import record_llm_response, record_retry
 
 
 class DBConstructorAgent(BaseAgent):
@@ -17,19 +28,17 @@ class DBConstructorAgent(BaseAgent):
         )
         self.required_inputs = ["data_chunks", "search_scope"]
         self.output_keys = ["vector_db", "embedding_stats", "db_metadata"]
-        self.timeout = 300
         self.retry_attempts = 2
         self.priority = 3
         
-        # 벡터 DB 설정
-        self.vector_db_config = {
-            "dimension": 3072,  # OpenAI text-embedding-3-large 차원
-            "index_type": "IVF_FLAT",
-            "metric_type": "COSINE",
-            "collection_name": "ai_research_data"
-        }
+        # 벡터 DB 설정 (로컬 memmap + IVF 인덱스)
+        self.vector_db_config = dict(VECTOR_DB_CONFIGS["local"])
+        self._embedding_client: Optional[AsyncOpenAI] = None
+        self.index: Optional[IVFFlatIndex] = None
+        self.embedding_records: List[Dict[str, Any]] = []
+        self._chunkers: Dict[str, TokenChunker] = {}
     
-    async def process(self, state: WorkflowState) -> WorkflowState:
+    async def process(self, state: WorkflowState) -> Dict[str, Any]:
         """벡터 데이터베이스 구축을 수행합니다."""
         self.log_execution("벡터 데이터베이스 구축 시작")
         
@@ -41,14 +50,14 @@ class DBConstructorAgent(BaseAgent):
             # 데이터 청킹 최적화
             optimized_chunks = self._optimize_chunking(state.data_chunks)
             
-            # 임베딩 생성 (시뮬레이션)
-            embeddings = await self._generate_embeddings(optimized_chunks)
+            # 임베딩 생성 (배치 단위, 디스크 memmap에 저장)
+            embeddings, matrix = await self._generate_embeddings(optimized_chunks)
             
             # 벡터 DB 구축
-            vector_db = await self._build_vector_database(embeddings)
+            vector_db = await self._build_vector_database(embeddings, matrix)
             
             # 임베딩 통계 생성
-            embedding_stats = self._generate_embedding_stats(embeddings)
+            embedding_stats = self._generate_embedding_stats(embeddings, matrix)
             
             # DB 메타데이터 생성
             db_metadata = self._generate_db_metadata(vector_db, embedding_stats)
@@ -62,20 +71,20 @@ class DBConstructorAgent(BaseAgent):
                     "db_metadata": db_metadata
                 },
                 metadata={
-                    "construction_method": "simulated",
+                    "construction_method": "local_ivf_flat",
                     "total_chunks_processed": len(optimized_chunks),
-                    "embedding_model": "openai/text-embedding-3-large"
+                    "embedding_model": f"openai/{self.vector_db_config['embedding_model']}"
                 }
             )
             
-            # 상태 업데이트
-            updated_state = self.update_workflow_status(state, "db_construction")
-            updated_state.vector_db = vector_db
-            updated_state.embedding_stats = embedding_stats
-            updated_state.db_metadata = db_metadata
-            
+            # 상태 업데이트 (벡터는 디스크 memmap/인덱스 파일에 있고 상태에는 경로와 통계만 전달)
             self.log_execution("벡터 데이터베이스 구축 완료")
-            return updated_state
+            return self.build_update(
+                "db_construction",
+                vector_db=vector_db,
+                embedding_stats=embedding_stats,
+                db_metadata=db_metadata
+            )
             
         except Exception as e:
             self.log_execution(f"벡터 데이터베이스 구축 실패: {str(e)}", "ERROR")
@@ -90,158 +99,242 @@ class DBConstructorAgent(BaseAgent):
             )
             
             # 폴백 데이터로 상태 업데이트
-            updated_state = self.update_workflow_status(state, "db_construction")
-            updated_state.vector_db = fallback_data["vector_db"]
-            updated_state.embedding_stats = fallback_data["embedding_stats"]
-            updated_state.db_metadata = fallback_data["db_metadata"]
-            
             self.log_execution("폴백 데이터 사용으로 계속 진행")
-            return updated_state
+            return self.build_update(
+                "db_construction",
+                vector_db=fallback_data["vector_db"],
+                embedding_stats=fallback_data["embedding_stats"],
+                db_metadata=fallback_data["db_metadata"]
+            )
+    
+    def _get_chunker(self, profile: str) -> TokenChunker:
+        """청킹 프로필별 TokenChunker를 반환합니다. (처음 사용할 때 생성)"""
+        if profile not in self._chunkers:
+            self._chunkers[profile] = TokenChunker(profile)
+        return self._chunkers[profile]
     
     def _optimize_chunking(self, data_chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """데이터 청킹을 최적화합니다."""
+        """데이터 청크를 출처별 프로필에 맞춰 토큰 기준으로 다시 나눕니다."""
         optimized_chunks = []
         
         for chunk in data_chunks:
-            # 청크 크기 최적화
             content = chunk["content"]
-            if len(content) < 50:
+            if len(content.strip()) < 50:
                 # 너무 짧은 청크는 건너뛰기
                 continue
-            elif len(content) > 1000:
-                # 너무 긴 청크는 분할
-                sub_chunks = self._split_large_chunk(chunk)
-                optimized_chunks.extend(sub_chunks)
-            else:
-                # 적절한 크기의 청크는 그대로 사용
-                optimized_chunks.append(chunk)
+            optimized_chunks.extend(self._split_chunk(chunk))
         
         return optimized_chunks
     
-    def _split_large_chunk(self, chunk: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """큰 청크를 작은 청크로 분할합니다."""
-        content = chunk["content"]
-        words = content.split()
-        chunk_size = 100
+    def _split_chunk(self, chunk: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """청크를 문장 경계에서 나누고 하위 청크마다 원문 오프셋을 메타데이터에 기록합니다."""
+        metadata = chunk.get("metadata", {})
+        profile = CHUNKING_PROFILE_BY_SOURCE.get(metadata.get("source"), "default")
+        pieces = self._get_chunker(profile).split(chunk["content"])
         
         sub_chunks = []
-        for i in range(0, len(words), chunk_size):
-            sub_words = words[i:i + chunk_size]
-            sub_content = " ".join(sub_words)
-            
-            sub_chunk = chunk.copy()
-            sub_chunk["content"] = sub_content
-            sub_chunk["chunk_id"] = f"{chunk['chunk_id']}_sub_{i//chunk_size}"
-            sub_chunk["chunk_size"] = len(sub_content)
-            sub_chunk["metadata"]["chunk_part"] = i // chunk_size + 1
-            
+        for piece in pieces:
+            sub_chunk = dict(chunk)
+            if len(pieces) > 1:
+                sub_chunk["chunk_id"] = f"{chunk['chunk_id']}_sub_{piece.index}"
+            sub_chunk["content"] = piece.text
+            sub_chunk["chunk_size"] = len(piece.text)
+            # 하위 청크끼리 메타데이터를 공유하지 않도록 복사
+            sub_chunk["metadata"] = {
+                **metadata,
+                "chunk_part": piece.index + 1,
+                "chunk_parts": len(pieces),
+                "char_start": piece.start,
+                "char_end": piece.end,
+                "token_count": piece.tokens,
+                "chunk_profile": profile
+            }
             sub_chunks.append(sub_chunk)
         
         return sub_chunks
     
-    async def _generate_embeddings(self, chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """청크에 대한 임베딩을 생성합니다."""
-        # 실제 구현에서는 OpenAI API를 호출하여 임베딩을 생성합니다
-        # 현재는 시뮬레이션된 임베딩을 반환합니다
+    def _get_embedding_client(self) -> AsyncOpenAI:
+        """임베딩용 OpenAI 클라이언트를 반환합니다. (처음 사용할 때 생성)"""
+        if self._embedding_client is None:
+            # 재시도는 _embed_texts에서 직접 처리
+            self._embedding_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), max_retries=0)
+        return self._embedding_client
+    
+    async def _embed_texts(self, texts: List[str]) -> np.ndarray:
+        """텍스트 목록을 한 번의 API 호출로 임베딩합니다. (429/5xx/연결 오류는 백오프 후 재시도)"""
+        max_retries = self.vector_db_config["embedding_max_retries"]
+        retry_delay = self.vector_db_config["embedding_retry_delay"]
+        for attempt in range(max_retries + 1):
+            try:
+                response = await self._get_embedding_client().embeddings.create(
+                    model=self.vector_db_config["embedding_model"],
+                    input=texts
+                )
+                break
+            except (RateLimitError, InternalServerError, APITimeoutError, APIConnectionError) as e:
+                if attempt >= max_retries:
+                    raise
+                
+                record_retry("openai")
+                delay = self._retry_after(e)
+                if delay is None:
+                    # 지수 백오프 + 지터 (동시 요청이 한꺼번에 재시도하지 않도록)
+                    delay = retry_delay * (2 ** attempt) + random.uniform(0, retry_delay)
+                self.log_execution(
+                    f"임베딩 요청 재시도 대기 {delay:.1f}초 (시도 {attempt + 1}/{max_retries}): {type(e).__name__}",
+                    "WARNING"
+                )
+                await asyncio.sleep(delay)
+        
+        record_llm_response(self.vector_db_config["embedding_model"], response)
+        vectors = [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        return np.asarray(vectors, dtype=np.float32)
+    
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """Rate limit 응답의 Retry-After 헤더 값을 반환합니다."""
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if not headers:
+            return None
+        try:
+            return float(headers.get('retry-after'))
+        except (TypeError, ValueError):
+            return None
+    
+    async def _generate_embeddings(self, chunks: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+        """청크를 배치 단위로 임베딩해 float32 memmap 행렬에 저장합니다.
         
-        await asyncio.sleep(2)  # 임베딩 생성 시간 시뮬레이션
+        Returns:
+            (행 번호가 포함된 청크 레코드 목록, 정규화된 임베딩 행렬)
+        """
+        storage_dir = Path(self.vector_db_config["storage_dir"])
+        storage_dir.mkdir(parents=True, exist_ok=True)
+        dimension = self.vector_db_config["dimension"]
+        batch_size = self.vector_db_config["embedding_batch_size"]
         
+        matrix = np.lib.format.open_memmap(
+            storage_dir / "embeddings.npy",
+            mode="w+",
+            dtype=np.float32,
+            shape=(len(chunks), dimension)
+        )
+        
+        generated_at = datetime.now().isoformat()
         embeddings = []
-        for i, chunk in enumerate(chunks):
-            # 시뮬레이션된 임베딩 벡터 (3072차원)
-            embedding_vector = [0.1 * (i + 1) + 0.01 * j for j in range(self.vector_db_config["dimension"])]
+        for start in range(0, len(chunks), batch_size):
+            batch = chunks[start:start + batch_size]
+            vectors = await self._embed_texts([chunk["content"] for chunk in batch])
+            matrix[start:start + len(batch)] = normalize_rows(vectors)
             
-            embedding = {
-                "chunk_id": chunk["chunk_id"],
-                "content": chunk["content"],
-                "embedding_vector": embedding_vector,
-                "metadata": chunk["metadata"],
-                "embedding_quality": 0.95,  # 임베딩 품질 점수
-                "generation_timestamp": "2024-08-16T10:00:00Z"
-            }
-            embeddings.append(embedding)
+            for offset, chunk in enumerate(batch):
+                embeddings.append({
+                    "row": start + offset,
+                    "chunk_id": chunk["chunk_id"],
+                    "content": chunk["content"],
+                    "metadata": chunk["metadata"],
+                    "generation_timestamp": generated_at
+                })
+            self.log_execution(f"임베딩 생성 진행: {start + len(batch)}/{len(chunks)}")
         
-        return embeddings
+        matrix.flush()
+        return embeddings, matrix
     
-    async def _build_vector_database(self, embeddings: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """벡터 데이터베이스를 구축합니다."""
-        # 실제 구현에서는 Milvus, Pinecone 등의 벡터 DB에 데이터를 저장합니다
-        # 현재는 시뮬레이션된 DB 구축을 반환합니다
+    async def _build_vector_database(self, embeddings: List[Dict[str, Any]], matrix: np.ndarray) -> Dict[str, Any]:
+        """임베딩 행렬로 로컬 IVF 인덱스를 구축하고 실제 성능을 측정합니다."""
+        index = IVFFlatIndex(nprobe=self.vector_db_config["nprobe"])
+        # k-means는 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        await asyncio.to_thread(index.build, matrix)
+        
+        storage_dir = Path(self.vector_db_config["storage_dir"])
+        index_files = index.save(str(storage_dir / "index"))
+        
+        # 저장된 벡터 일부를 쿼리로 사용해 검색 지연 시간 측정
+        sample_count = min(len(embeddings), self.vector_db_config["latency_sample_queries"])
+        latency = index.measure_latency(np.asarray(matrix[:sample_count]))
         
-        await asyncio.sleep(1)  # DB 구축 시간 시뮬레이션
+        self.index = index
+        self.embedding_records = embeddings
         
         return {
-            "db_type": "milvus",
+            "db_type": "local_ivf_flat",
             "collection_name": self.vector_db_config["collection_name"],
-            "total_vectors": len(embeddings),
+            "total_vectors": index.size,
             "dimension": self.vector_db_config["dimension"],
             "index_type": self.vector_db_config["index_type"],
             "metric_type": self.vector_db_config["metric_type"],
             "index_status": "built",
-            "search_ready": True,
-            "connection_info": {
-                "host": "localhost",
-                "port": 19530,
-                "status": "connected"
-            }
+            "search_ready": index.size > 0,
+            "storage": {
+                "embeddings": str(storage_dir / "embeddings.npy"),
+                **index_files
+            },
+            "index_params": {
+                "nlist": len(index.inverted_lists),
+                "nprobe": index.nprobe
+            },
+            "build_time_seconds": index.build_time,
+            "index_size_bytes": index.nbytes(),
+            "query_latency": latency
         }
     
-    def _generate_embedding_stats(self, embeddings: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def search(self, query_vector: List[float], top_k: int = 5) -> List[Dict[str, Any]]:
+        """구축된 인덱스에서 코사인 유사도 상위 k개 청크를 검색합니다."""
+        if self.index is None:
+            raise RuntimeError("벡터 인덱스가 아직 구축되지 않았습니다.")
+        
+        results = []
+        for row, score in self.index.search(np.asarray(query_vector, dtype=np.float32), top_k=top_k):
+            record = self.embedding_records[row]
+            results.append({**record, "score": score})
+        return results
+    
+    async def search_text(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
+        """쿼리 텍스트를 임베딩해 유사한 청크를 검색합니다."""
+        query_vector = await self._embed_texts([query])
+        return self.search(query_vector[0], top_k=top_k)
+    
+    def _generate_embedding_stats(self, embeddings: List[Dict[str, Any]], matrix: np.ndarray) -> Dict[str, Any]:
         """임베딩 통계를 생성합니다."""
         if not embeddings:
             return {"error": "No embeddings available"}
         
-        total_chunks = len(embeddings)
-        avg_quality = sum(emb["embedding_quality"] for emb in embeddings) / total_chunks
-        
         # 소스별 통계
         source_stats = {}
         for emb in embeddings:
-            source = emb["metadata"]["source"]
+            source = emb["metadata"].get("source", "unknown")
             if source not in source_stats:
-                source_stats[source] = {"count": 0, "avg_quality": 0.0}
-            
+                source_stats[source] = {"count": 0}
             source_stats[source]["count"] += 1
-            source_stats[source]["avg_quality"] += emb["embedding_quality"]
         
-        # 평균 품질 계산
-        for source in source_stats:
-            source_stats[source]["avg_quality"] /= source_stats[source]["count"]
+        norms = np.linalg.norm(np.asarray(matrix), axis=1)
         
         return {
-            "total_embeddings": total_chunks,
-            "average_quality": avg_quality,
-            "dimension": self.vector_db_config["dimension"],
+            "total_embeddings": len(embeddings),
+            "dimension": int(matrix.shape[1]),
+            "embedding_model": self.vector_db_config["embedding_model"],
             "source_distribution": source_stats,
-            "quality_distribution": {
-                "excellent": len([e for e in embeddings if e["embedding_quality"] >= 0.9]),
-                "good": len([e for e in embeddings if 0.7 <= e["embedding_quality"] < 0.9]),
-                "fair": len([e for e in embeddings if 0.5 <= e["embedding_quality"] < 0.7]),
-                "poor": len([e for e in embeddings if e["embedding_quality"] < 0.5])
-            }
+            "empty_vectors": int(np.sum(norms == 0)),
+            "matrix_size_bytes": int(matrix.nbytes)
         }
     
     def _generate_db_metadata(self, vector_db: Dict[str, Any], embedding_stats: Dict[str, Any]) -> Dict[str, Any]:
-        """데이터베이스 메타데이터를 생성합니다."""
+        """데이터베이스 메타데이터를 생성합니다. (측정된 성능 지표 사용)"""
+        latency = vector_db.get("query_latency", {})
         return {
-            "creation_timestamp": "2024-08-16T10:00:00Z",
+            "creation_timestamp": datetime.now().isoformat(),
             "version": "1.0.0",
             "configuration": self.vector_db_config,
             "performance_metrics": {
-                "build_time": "2.5 seconds",
-                "index_size": "15.2 MB",
-                "search_latency": "5ms",
-                "throughput": "1000 queries/second"
-            },
-            "maintenance_info": {
-                "last_backup": "2024-08-16T10:00:00Z",
+                "build_time": f"{vector_db.get('build_time_seconds', 0.0):.3f} seconds",
+                "index_size": f"{vector_db.get('index_size_bytes', 0) / (1024 * 1024):.2f} MB",
+                "search_latency": f"p50 {latency.get('p50_ms', 0.0):.2f}ms / p95 {latency.get('p95_ms', 0.0):.2f}ms",
+                "throughput": f"{latency.get('qps', 0.0):.0f} queries/second",
+                "measured_queries": latency.get("queries", 0)
             },
             "search_optimization": {
-                "recommended_batch_size": 100,
-                "optimal_search_params": {
-                    "nprobe": 16,
-                    "ef": 64
-                }
+                "recommended_batch_size": self.vector_db_config["embedding_batch_size"],
+                "optimal_search_params": vector_db.get("index_params", {})
             }
         }
     
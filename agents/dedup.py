@@ -0,0 +1,175 @@
+"""Near-duplicate detection for crawled documents using MinHash and LSH."""
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from constants.configuration import DEDUP_CONFIGS
+except ImportError:
+    from ..constants.configuration import DEDUP_CONFIGS
+
+# MinHash 해시 함수 (a * h + b) mod p 에 사용하는 메르센 소수
+# (a, b < 2^31, h < 2^32 이므로 a * h + b가 uint64 범위를 넘지 않음)
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+def normalize_text(text: str) -> str:
+    """대소문자와 공백 차이를 없앤 비교용 텍스트를 반환합니다."""
+    return re.sub(r"\s+", " ", (text or "").lower()).strip()
+
+
+class _UnionFind:
+    """중복 후보 문서를 묶는 서로소 집합."""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+class NearDuplicateDetector:
+    """문자 shingle의 MinHash 서명과 LSH 밴딩으로 유사 문서를 묶는 클래스.
+
+    문서마다 서명을 한 번 계산하고 밴드별 버킷에 넣기만 하므로 문서 수에 선형인 시간이 걸리며,
+    같은 버킷에 들어간 후보 쌍만 서명 일치율(추정 Jaccard 유사도)로 확인합니다.
+    """
+
+    def __init__(
+        self,
+        shingle_size: Optional[int] = None,
+        num_perm: Optional[int] = None,
+        bands: Optional[int] = None,
+        similarity_threshold: Optional[float] = None,
+        seed: Optional[int] = None
+    ):
+        self.shingle_size = shingle_size or DEDUP_CONFIGS["shingle_size"]
+        self.num_perm = num_perm or DEDUP_CONFIGS["num_perm"]
+        self.bands = bands or DEDUP_CONFIGS["bands"]
+        self.similarity_threshold = similarity_threshold or DEDUP_CONFIGS["similarity_threshold"]
+        if self.num_perm % self.bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+        self.rows = self.num_perm // self.bands
+
+        rng = np.random.default_rng(DEDUP_CONFIGS["seed"] if seed is None else seed)
+        self._a = rng.integers(1, _MERSENNE_PRIME, size=self.num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=self.num_perm, dtype=np.uint64)
+
+    def _shingle_hashes(self, text: str) -> np.ndarray:
+        normalized = normalize_text(text)
+        k = self.shingle_size
+        if len(normalized) <= k:
+            shingles = {normalized}
+        else:
+            shingles = {normalized[i:i + k] for i in range(len(normalized) - k + 1)}
+        return np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+
+    def signature(self, text: str) -> np.ndarray:
+        """텍스트의 MinHash 서명(num_perm 길이)을 계산합니다."""
+        hashes = self._shingle_hashes(text)
+        # (num_perm, shingle 수) 행렬에서 해시 함수별 최솟값
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % np.uint64(_MERSENNE_PRIME)
+        return permuted.min(axis=1)
+
+    def cluster(self, texts: List[str]) -> List[List[int]]:
+        """유사 문서끼리 묶은 인덱스 목록을 반환합니다. (각 묶음은 오름차순, 묶음은 첫 문서 순)"""
+        signatures = [self.signature(text) for text in texts]
+        union_find = _UnionFind(len(texts))
+
+        for band in range(self.bands):
+            start = band * self.rows
+            buckets: Dict[bytes, List[int]] = defaultdict(list)
+            for index, signature in enumerate(signatures):
+                buckets[signature[start:start + self.rows].tobytes()].append(index)
+
+            # 버킷 안에서는 대표 문서들과만 비교 (버킷은 대부분 1~2개 문서)
+            for members in buckets.values():
+                representatives: List[int] = []
+                for index in members:
+                    for representative in representatives:
+                        similarity = float(np.mean(signatures[index] == signatures[representative]))
+                        if similarity >= self.similarity_threshold:
+                            union_find.union(representative, index)
+                            break
+                    else:
+                        representatives.append(index)
+
+        clusters: Dict[int, List[int]] = defaultdict(list)
+        for index in range(len(texts)):
+            clusters[union_find.find(index)].append(index)
+        return sorted(clusters.values(), key=lambda members: members[0])
+
+
+def _canonical_rank(document: Dict[str, Any], source_priority: List[str]) -> Tuple[int, int]:
+    source = document.get("source", "")
+    priority = source_priority.index(source) if source in source_priority else len(source_priority)
+    return priority, -len(document.get("content", ""))
+
+
+def deduplicate_documents(
+    documents: List[Dict[str, Any]],
+    config: Optional[Dict[str, Any]] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """유사 중복 문서를 묶어 묶음마다 대표 문서 하나만 남깁니다.
+
+    대표 문서에는 묶음 전체의 출처(sources)와 URL(urls)을 합쳐 기록하고,
+    (중복 제거된 문서 목록, 통계)를 반환합니다.
+    """
+    config = {**DEDUP_CONFIGS, **(config or {})}
+    if not config["enabled"] or len(documents) < 2:
+        return list(documents), {
+            "input": len(documents), "output": len(documents), "duplicates_removed": 0, "clusters_merged": 0
+        }
+
+    detector = NearDuplicateDetector(
+        shingle_size=config["shingle_size"],
+        num_perm=config["num_perm"],
+        bands=config["bands"],
+        similarity_threshold=config["similarity_threshold"],
+        seed=config["seed"]
+    )
+    texts = [f"{document.get('title', '')}\n{document.get('content', '')}" for document in documents]
+    # 제목과 본문이 모두 빈 문서는 같은 shingle 하나로 모두 묶이므로 비교하지 않고 그대로 통과
+    indexed = [index for index, text in enumerate(texts) if normalize_text(text)]
+    clusters = [[indexed[position] for position in members] for members in detector.cluster([texts[index] for index in indexed])]
+    clusters += [[index] for index in sorted(set(range(len(documents))) - set(indexed))]
+    clusters.sort(key=lambda members: members[0])
+
+    unique_documents = []
+    for members in clusters:
+        group = [documents[index] for index in members]
+        canonical = dict(min(group, key=lambda document: _canonical_rank(document, config["source_priority"])))
+        if len(group) > 1:
+            # 이미 중복 제거된 문서를 다시 합쳐도 이전에 병합한 출처/URL이 유지되도록 함께 합침
+            canonical["sources"] = list(dict.fromkeys(
+                source for document in group for source in document.get("sources") or [document.get("source", "")]
+            ))
+            canonical["urls"] = list(dict.fromkeys(
+                url for document in group for url in document.get("urls") or [document.get("url", "")]
+            ))
+            canonical["duplicate_count"] = sum(document.get("duplicate_count", 0) + 1 for document in group) - 1
+        unique_documents.append(canonical)
+
+    stats = {
+        "input": len(documents),
+        "output": len(unique_documents),
+        "duplicates_removed": len(documents) - len(unique_documents),
+        "clusters_merged": sum(1 for members in clusters if len(members) > 1)
+    }
+    return unique_documents, stats
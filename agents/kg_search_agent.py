@@ -33,7 +33,7 @@ class KGSearchAgent(BaseAgent):
             logger.error(f"Failed to initialize KG Search Agent: {e}")
             raise
     
-    async def process(self, state: WorkflowState) -> WorkflowState:
+    async def process(self, state: WorkflowState) -> Dict[str, Any]:
         """Process query and search knowledge graph."""
         try:
             if not self.knowledge_graph_agent:
@@ -45,7 +45,7 @@ class KGSearchAgent(BaseAgent):
             
             if not queries:
                 logger.warning("No queries found from query_writer")
-                return state
+                return {}
             
             # Search knowledge graph for each query
             search_results = []
@@ -67,11 +67,11 @@ class KGSearchAgent(BaseAgent):
             self.search_results = search_results
             
             logger.info(f"KG Search completed with {len(search_results)} query results")
-            return state
+            return {}
             
         except Exception as e:
             logger.error(f"Error in KG Search Agent: {e}")
-            return state
+            return {}
     
     async def _search_knowledge_graph(self, query: str, query_type: str = "general") -> List[Dict[str, Any]]:
         """Search knowledge graph using HippoRAG."""
@@ -57,7 +57,7 @@ class KnowledgeGraphAgent(BaseAgent):
             logger.error(f"Failed to initialize Knowledge Graph Agent: {e}")
             raise
     
-    async def process(self, state: WorkflowState) -> WorkflowState:
+    async def process(self, state: WorkflowState) -> Dict[str, Any]:
         """Process documents and build knowledge graph."""
         try:
             if not self.hipporag:
@@ -67,7 +67,7 @@ class KnowledgeGraphAgent(BaseAgent):
             crawled_documents = state.get("crawled_documents", [])
             if not crawled_documents:
                 logger.warning("No crawled documents found in state")
-                return state
+                return {}
             
             # Process each document and build knowledge graph
             knowledge_graph = await self._build_knowledge_graph(crawled_documents)
@@ -77,11 +77,11 @@ class KnowledgeGraphAgent(BaseAgent):
             state.set("document_store", self.document_store)
             
             logger.info(f"Knowledge graph built with {len(knowledge_graph)} entities")
-            return state
+            return {}
             
         except Exception as e:
             logger.error(f"Error in Knowledge Graph Agent: {e}")
-            return state
+            return {}
     
     async def _build_knowledge_graph(self, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Build knowledge graph from documents using HippoRAG."""
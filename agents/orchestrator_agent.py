@@ -16,11 +16,10 @@ class OrchestratorAgent(BaseAgent):
         )
         self.required_inputs = ["user_query"]
         self.output_keys = ["workflow_status", "next_agents"]
-        self.timeout = 30
         self.retry_attempts = 1
         self.priority = 1
     
-    async def process(self, state: WorkflowState) -> WorkflowState:
+    async def process(self, state: WorkflowState) -> Dict[str, Any]:
         """워크플로우 오케스트레이션을 수행합니다."""
         self.log_execution("워크플로우 오케스트레이션 시작")
         
@@ -55,13 +54,13 @@ class OrchestratorAgent(BaseAgent):
                 }
             )
             
-            # 상태 업데이트
-            updated_state = self.update_workflow_status(state, "orchestration")
-            updated_state.workflow_status = workflow_status
-            updated_state.next_agents = next_agents
-            
+            # 상태 업데이트 (변경된 필드만 반환)
             self.log_execution(f"오케스트레이션 완료. 다음 에이전트: {next_agents}")
-            return updated_state
+            return self.build_update(
+                "orchestration",
+                workflow_status=workflow_status,
+                next_agents=next_agents
+            )
             
         except Exception as e:
             self.log_execution(f"오케스트레이션 실패: {str(e)}", "ERROR")
@@ -72,13 +71,10 @@ class OrchestratorAgent(BaseAgent):
             )
             
             # 에러 상태로 업데이트
-            workflow_status = state.workflow_status.copy()
-            workflow_status["status"] = "failed"
-            workflow_status["error"] = str(e)
-            
-            updated_state = self.update_workflow_status(state, "orchestration")
-            updated_state.workflow_status = workflow_status
-            return updated_state
+            return self.build_update(
+                "orchestration",
+                workflow_status={"status": "failed", "error": str(e)}
+            )
     
     def _determine_next_agents(self, state: WorkflowState) -> List[str]:
         """다음에 실행할 에이전트들을 결정합니다."""
@@ -26,7 +26,6 @@ class PersonalizeAgent(BaseAgent):
         )
         self.required_inputs = ["workflow_status"]
         self.output_keys = ["personal_info", "research_context", "current_progress"]
-        self.timeout = 120
         self.retry_attempts = 3
         self.priority = 2
         
@@ -44,7 +43,7 @@ class PersonalizeAgent(BaseAgent):
             self.log_execution(f"LLM 클라이언트 초기화 실패: {str(e)}", "WARNING")
             self.llm_client = None
     
-    async def process(self, state: WorkflowState) -> WorkflowState:
+    async def process(self, state: WorkflowState) -> Dict[str, Any]:
         """개인화된 정보 수집을 수행합니다."""
         self.log_execution("개인화 정보 수집 시작")
         
@@ -111,14 +110,14 @@ class PersonalizeAgent(BaseAgent):
                 }
             )
             
-            # 상태 업데이트
-            updated_state = self.update_workflow_status(state, "personalization")
-            updated_state.personal_info = personal_info
-            updated_state.research_context = research_context
-            updated_state.current_progress = current_progress
-            
+            # 상태 업데이트 (변경된 필드만 반환)
             self.log_execution("개인화 정보 수집 및 분석 완료")
-            return updated_state
+            return self.build_update(
+                "personalization",
+                personal_info=personal_info,
+                research_context=research_context,
+                current_progress=current_progress
+            )
             
         except Exception as e:
             self.log_execution(f"개인화 정보 수집 실패: {str(e)}", "ERROR")
@@ -133,13 +132,13 @@ class PersonalizeAgent(BaseAgent):
             )
             
             # 폴백 데이터로 상태 업데이트
-            updated_state = self.update_workflow_status(state, "personalization")
-            updated_state.personal_info = fallback_data["personal_info"]
-            updated_state.research_context = fallback_data["research_context"]
-            updated_state.current_progress = fallback_data["current_progress"]
-            
             self.log_execution("폴백 데이터 사용으로 계속 진행")
-            return updated_state
+            return self.build_update(
+                "personalization",
+                personal_info=fallback_data["personal_info"],
+                research_context=fallback_data["research_context"],
+                current_progress=fallback_data["current_progress"]
+            )
     
     async def _ensure_mcp_connections(self):
         """MCP 연결을 확인하고 필요시 연결합니다."""
@@ -0,0 +1,83 @@
+"""Query Searcher Agent for searching with the generated queries."""
+
+from typing import Any, Dict
+from datetime import datetime
+
+from .base_agent import BaseAgent
+from .dedup import deduplicate_documents
+from .searcher_agent import WebSearcher, save_search_results, summarize_outcomes
+from .sources import PerplexitySource
+from ..constants import WEB_CRAWLING_TOOL_CONFIGS
+from ..state import WorkflowState
+from ..artifact_store import put_artifact, load_artifact
+
+
+class QuerySearcherAgent(BaseAgent):
+    """생성된 쿼리로 검색하는 에이전트
+
+    QueryWriterAgent가 만든 쿼리가 필요한 소스(Perplexity)만 수집하고,
+    SearcherAgent가 먼저 크롤링한 결과와 합쳐 다시 중복 제거합니다.
+    """
+
+    def __init__(self, perplexity_api_key: str = None):
+        super().__init__(
+            name="query_searcher",
+            description="생성된 검색 쿼리로 최신 AI 연구 정보를 검색하는 에이전트"
+        )
+        self.required_inputs = ["search_query"]
+        self.output_keys = ["search_results", "search_metadata"]
+        self.web_searcher = WebSearcher(perplexity_api_key)
+
+    async def process(self, state: WorkflowState) -> Dict[str, Any]:
+        """생성된 쿼리로 검색하고 크롤링 결과와 합칩니다."""
+        self.log_execution("쿼리 기반 검색 시작")
+
+        try:
+            # 입력 검증
+            if not self.validate_inputs(state):
+                raise ValueError("필수 입력이 누락되었습니다.")
+
+            # QueryWriterAgent가 만든 쿼리도 함께 검색
+            search_query = getattr(state, 'search_query', '최신 AI 트렌드')
+            queries = [search_query, state.primary_query, state.secondary_query, state.third_query]
+
+            budget = max(self.timeout - WEB_CRAWLING_TOOL_CONFIGS["source_budget_margin"], 1)
+            outcomes = await self.web_searcher.collect(queries, budget, needs_queries=True)
+            for name, outcome in outcomes.items():
+                self.log_execution(
+                    f"{name}: {outcome['status']} ({len(outcome['records'])}개, {outcome['elapsed_seconds']}초)",
+                    "INFO" if outcome["status"] == "ok" else "WARNING"
+                )
+
+            # SearcherAgent의 크롤링 결과 뒤에 검색 결과를 붙여 출처 간 유사 중복 제거
+            crawled_results = load_artifact(state, "search_results", [])
+            all_results, dedup_stats = deduplicate_documents(
+                crawled_results + [record for outcome in outcomes.values() for record in outcome["records"]]
+            )
+            self.log_execution(f"중복 제거: {dedup_stats['input']}개 -> {dedup_stats['output']}개")
+
+            # 결과 저장
+            output_filename = f"AgentCast/output/searcher/search_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            save_search_results(all_results, output_filename)
+
+            # 크롤링 단계의 메타데이터에 검색 소스 결과를 더함
+            search_metadata = dict(state.search_metadata)
+            self.log_execution(f"쿼리 기반 검색 완료: {len(all_results)}개 결과")
+            return self.build_update(
+                "query_searcher_completed",
+                artifacts={"search_results": put_artifact(all_results)},
+                search_metadata={
+                    **search_metadata,
+                    "total_results": len(all_results),
+                    "perplexity_results": len(outcomes[PerplexitySource.name]["records"]),
+                    "source_status": {**search_metadata.get("source_status", {}), **summarize_outcomes(outcomes)},
+                    "query_budget_seconds": budget,
+                    "crawl_stats": {**search_metadata.get("crawl_stats", {}), **self.web_searcher.crawl_stats},
+                    "dedup_stats": dedup_stats,
+                    "output_file": output_filename
+                }
+            )
+
+        except Exception as e:
+            self.log_execution(f"쿼리 기반 검색 중 오류 발생: {str(e)}", "ERROR")
+            raise
@@ -23,7 +23,6 @@ class QueryWriterAgent(BaseAgent):
         )
         self.required_inputs = ["current_progress", "personal_info", "research_context"]
         self.output_keys = ["primary_query", "secondary_query", "third_query", "search_scope", "research_priorities"]
-        self.timeout = 60
         self.retry_attempts = 2
         self.priority = 3
         
@@ -34,7 +33,7 @@ class QueryWriterAgent(BaseAgent):
             self.log_execution(f"LLM 클라이언트 초기화 실패: {str(e)}", "WARNING")
             self.llm_client = None
     
-    async def process(self, state: WorkflowState) -> WorkflowState:
+    async def process(self, state: WorkflowState) -> Dict[str, Any]:
         """RAG 검색 쿼리 생성을 수행합니다."""
         self.log_execution("RAG 검색 쿼리 생성 시작")
         
@@ -95,16 +94,16 @@ class QueryWriterAgent(BaseAgent):
                 }
             )
             
-            # 상태 업데이트
-            updated_state = self.update_workflow_status(state, "query_writing")
-            updated_state.primary_query = primary_query
-            updated_state.secondary_query = secondary_query
-            updated_state.third_query = third_query
-            updated_state.search_scope = search_scope
-            updated_state.research_priorities = research_priorities
-            
+            # 상태 업데이트 (변경된 필드만 반환)
             self.log_execution("RAG 검색 쿼리 생성 완료")
-            return updated_state
+            return self.build_update(
+                "query_writing",
+                primary_query=primary_query,
+                secondary_query=secondary_query,
+                third_query=third_query,
+                search_scope=search_scope,
+                research_priorities=research_priorities
+            )
             
         except Exception as e:
             self.log_execution(f"RAG 검색 쿼리 생성 실패: {str(e)}", "ERROR")
@@ -119,15 +118,15 @@ class QueryWriterAgent(BaseAgent):
             )
             
             # 폴백 쿼리로 상태 업데이트
-            updated_state = self.update_workflow_status(state, "query_writing")
-            updated_state.primary_query = fallback_query["primary_query"]
-            updated_state.secondary_query = fallback_query["secondary_query"]
-            updated_state.third_query = fallback_query["third_query"]
-            updated_state.search_scope = fallback_query["search_scope"]
-            updated_state.research_priorities = fallback_query["research_priorities"]
-            
             self.log_execution("기본 쿼리 사용으로 계속 진행")
-            return updated_state
+            return self.build_update(
+                "query_writing",
+                primary_query=fallback_query["primary_query"],
+                secondary_query=fallback_query["secondary_query"],
+                third_query=fallback_query["third_query"],
+                search_scope=fallback_query["search_scope"],
+                research_priorities=fallback_query["research_priorities"]
+            )
     
     def _extract_rag_query(self, rag_query_data: Dict[str, Any], key_name: str) -> str:
         """LLM 응답에서 특정 타입의 RAG 쿼리를 추출합니다."""
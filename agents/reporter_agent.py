@@ -12,7 +12,9 @@ import anthropic
 from dotenv import load_dotenv
 
 from .base_agent import BaseAgent, AgentResult
-from ..state import WorkflowState
+from ..state import WorkflowState, apply_update
+from ..artifact_store import put_artifact, load_artifact
+from ..instrumentation import record_llm_response
 from ..constants.ai_models import ANTHROPIC_MODELS
 
 # 환경 변수 로드
@@ -59,7 +61,7 @@ class ReporterAgent(BaseAgent):
         # 기본 리포트 설정
         self.default_config = ReportConfig()
     
-    async def process(self, state: WorkflowState) -> WorkflowState:
+    async def process(self, state: WorkflowState) -> Dict[str, Any]:
         """리서치 결과를 바탕으로 인터랙티브 리포트를 생성합니다."""
         try:
             self.log_execution("리포트 생성 시작")
@@ -113,18 +115,16 @@ class ReporterAgent(BaseAgent):
                 metadata=metadata
             )
             
-            # 상태 업데이트
+            # 상태 업데이트 (HTML 본문은 아티팩트 저장소에 두고 참조 ID만 전달)
             output_data = self.prepare_output(result)
-            updated_state = WorkflowState(
-                **{k: v for k, v in state.__dict__.items()},
-                **output_data
-            )
-            
-            # 워크플로우 상태 업데이트
-            updated_state = self.update_workflow_status(updated_state, "report_generation")
+            html_report = output_data.pop("html_report")
             
             self.log_execution("리포트 생성 완료")
-            return updated_state
+            return self.build_update(
+                "report_generation",
+                artifacts={"html_report": put_artifact(html_report)},
+                **output_data
+            )
             
         except Exception as e:
             self.log_execution(f"리포트 생성 실패: {str(e)}", "ERROR")
@@ -154,6 +154,8 @@ class ReporterAgent(BaseAgent):
                     ]
                 )
                 
+                record_llm_response(self.model, response)
+                
                 # 응답 검증
                 if not response.content or len(response.content) == 0:
                     raise ValueError("API 응답이 비어있습니다.")
@@ -204,6 +206,7 @@ class ReporterAgent(BaseAgent):
                 ]
             )
             
+            record_llm_response(self.model, response)
             if not response.content or len(response.content) == 0:
                 raise ValueError("API 응답이 비어있습니다.")
             
@@ -617,10 +620,10 @@ def main():
         
         # 리포트 생성
         import asyncio
-        result_state = asyncio.run(agent.process(temp_state))
+        result_state = apply_update(temp_state, asyncio.run(agent.process(temp_state)))
         
         # 결과 저장
-        html_content = result_state.html_report
+        html_content = load_artifact(result_state, "html_report", "")
         filename = result_state.report_filename
         
         # 파일 저장
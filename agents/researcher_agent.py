@@ -1,17 +1,39 @@
 """Researcher Agent for generating concise article reports."""
 
+import asyncio
 import json
 import os
+import random
 from datetime import datetime
-from typing import Any, Dict, List
-from openai import OpenAI
+from typing import Any, Dict, List, Optional
+from openai import OpenAI, AsyncOpenAI, RateLimitError, APITimeoutError, APIConnectionError
 from dotenv import load_dotenv
 
+try:
+    from ..instrumentation import record_llm_response, record_retry, trace_span
+except ImportError:
+    from instrumentation import record_llm_response, record_retry, trace_span
+
 class ResearcherAgent:
     """기사의 핵심 내용을 압축하여 보고서를 생성하는 에이전트."""
     
-    def __init__(self):
-        """Initialize the ResearcherAgent with OpenAI client."""
+    def __init__(
+        self,
+        max_concurrency: int = 5,
+        request_timeout: float = 60.0,
+        report_timeout: float = 300.0,
+        max_retries: int = 3,
+        retry_delay: float = 1.0
+    ):
+        """Initialize the ResearcherAgent with OpenAI clients.
+
+        Args:
+            max_concurrency: 동시에 실행할 기사 요약 요청 수
+            request_timeout: 기사 요약 요청별 타임아웃(초)
+            report_timeout: 통합 보고서 생성 요청의 타임아웃(초)
+            max_retries: 요청별 최대 재시도 횟수 (rate limit/타임아웃)
+            retry_delay: 지수 백오프의 기본 대기 시간(초)
+        """
         load_dotenv()
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
@@ -38,44 +60,127 @@ class ResearcherAgent:
 - 주요 기술용어는 영문 병기
 - 섹션별 명확한 소제목 사용"""
 
+        self.max_concurrency = max_concurrency
+        self.request_timeout = request_timeout
+        self.report_timeout = report_timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
         try:
             self.client = OpenAI(api_key=api_key)
+            # 재시도는 _create_completion에서 직접 처리
+            self.async_client = AsyncOpenAI(api_key=api_key, max_retries=0)
         except Exception as e:
             print(f"OpenAI 클라이언트 초기화 실패: {str(e)}")
             raise
     
+    def _summary_messages(self, article: Dict[str, Any]) -> List[Dict[str, str]]:
+        """기사 요약 요청 메시지를 생성합니다."""
+        return [
+            {
+                "role": "system",
+                "content": "기술 전문 에디터로서, 아래 기사의 핵심 내용을 500자 내외로 요약해주세요."
+            },
+            {
+                "role": "user",
+                "content": article.get('content', '')
+            }
+        ]
+
+    def _summary_record(self, article: Dict[str, Any], summarized: str) -> Dict[str, Any]:
+        """요약 결과를 기사 메타데이터와 합칩니다."""
+        return {
+            'title': article.get('title', '제목 없음'),
+            'date': article.get('date', '날짜 없음'),
+            'source': article.get('source', '출처 없음'),
+            'url': article.get('url', ''),
+            'content': summarized
+        }
+
     def summarize_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
         """개별 기사를 500자 내외로 요약"""
         try:
-            content = article.get('content', '')
             response = self.client.chat.completions.create(
                 model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "기술 전문 에디터로서, 아래 기사의 핵심 내용을 500자 내외로 요약해주세요."
-                    },
-                    {
-                        "role": "user",
-                        "content": content
-                    }
-                ],
+                messages=self._summary_messages(article),
                 temperature=0.3
             )
+            record_llm_response("gpt-4", response)
             summarized = response.choices[0].message.content.strip()
-            return {
-                'title': article.get('title', '제목 없음'),
-                'date': article.get('date', '날짜 없음'),
-                'source': article.get('source', '출처 없음'),
-                'url': article.get('url', ''),
-                'content': summarized
-            }
+            return self._summary_record(article, summarized)
         except Exception as e:
             print(f"[ERROR] 기사 요약 중 오류 발생: {str(e)}")
             raise
 
+    async def _create_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.3,
+        timeout: Optional[float] = None
+    ) -> str:
+        """타임아웃과 rate limit 백오프를 적용해 비동기로 응답을 생성합니다."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await asyncio.wait_for(
+                    self.async_client.chat.completions.create(
+                        model="gpt-4",
+                        messages=messages,
+                        temperature=temperature
+                    ),
+                    timeout=timeout or self.request_timeout
+                )
+                record_llm_response("gpt-4", response)
+                return response.choices[0].message.content.strip()
+
+            except (RateLimitError, APITimeoutError, APIConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= self.max_retries:
+                    raise
+
+                record_retry("openai")
+                delay = self._retry_after(e)
+                if delay is None:
+                    # 지수 백오프 + 지터 (동시 요청이 한꺼번에 재시도하지 않도록)
+                    delay = self.retry_delay * (2 ** attempt) + random.uniform(0, self.retry_delay)
+                print(f"[DEBUG] 요청 재시도 대기 {delay:.1f}초 (시도 {attempt + 1}/{self.max_retries}): {type(e).__name__}")
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """Rate limit 응답의 Retry-After 헤더 값을 반환합니다."""
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if not headers:
+            return None
+        try:
+            return float(headers.get('retry-after'))
+        except (TypeError, ValueError):
+            return None
+
+    async def summarize_article_async(self, article: Dict[str, Any], semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """세마포어로 동시 실행 수를 제한하며 개별 기사를 비동기로 요약"""
+        async with semaphore:
+            try:
+                summarized = await self._create_completion(self._summary_messages(article))
+                print(f"[DEBUG] 기사 요약 완료 (길이: {len(summarized)}자)")
+                return self._summary_record(article, summarized)
+            except Exception as e:
+                print(f"[ERROR] 기사 요약 중 오류 발생: {str(e)}")
+                raise
+
+    async def summarize_articles(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """여러 기사를 동시에 요약합니다. 결과는 입력 순서를 유지합니다."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await asyncio.gather(
+            *(self.summarize_article_async(article, semaphore) for article in documents)
+        )
+
     def process(self, json_path: str) -> str:
         """Process articles from JSON file and generate a report."""
+        with trace_span("researcher"):
+            return asyncio.run(self.process_async(json_path))
+
+    async def process_async(self, json_path: str) -> str:
+        """Process articles from JSON file concurrently and generate a report."""
         try:
             print(f"\n[DEBUG] 파일 읽기 시작: {json_path}")
             if not os.path.exists(json_path):
@@ -86,13 +191,9 @@ class ResearcherAgent:
             documents = data[0].get('documents', []) if data else []
             print(f"[DEBUG] 파일 읽기 완료. 기사 {len(documents)}개 발견")
             
-            # 각 기사 요약
-            print("[DEBUG] 기사 요약 시작...")
-            summarized_articles = []
-            for article in documents:
-                summarized = self.summarize_article(article)
-                summarized_articles.append(summarized)
-                print(f"[DEBUG] 기사 요약 완료 (길이: {len(summarized['content'])}자)")
+            # 각 기사 요약 (동시 실행, 순서 유지)
+            print(f"[DEBUG] 기사 요약 시작... (동시 실행 {self.max_concurrency}개)")
+            summarized_articles = await self.summarize_articles(documents)
             
             # 기사 정보를 마크다운 리스트로 변환
             articles_md = []
@@ -102,9 +203,8 @@ class ResearcherAgent:
             print("[DEBUG] GPT-4 API 통합 보고서 생성 프롬프트 준비 완료")
             
             # 최종 보고서 생성
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
+            result = await self._create_completion(
+                [
                     {
                         "role": "system",
                         "content": """AI 기술 전문 애널리스트로서, 제공된 기사들을 바탕으로 심층적인 기술 동향 분석 보고서를 작성해주세요.
@@ -128,9 +228,9 @@ class ResearcherAgent:
                         "content": self.report_template.format(articles=articles_str)
                     }
                 ],
-                temperature=0.3
+                temperature=0.3,
+                timeout=self.report_timeout
             )
-            result = response.choices[0].message.content.strip()
             print(f"[DEBUG] 통합 보고서 생성 완료 (길이: {len(result)}자)")
             return result
             
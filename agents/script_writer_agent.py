@@ -4,10 +4,12 @@ import os
 import anthropic
 import argparse
 from datetime import datetime
+from typing import Any, Dict
 from dotenv import load_dotenv
 
 from .base_agent import BaseAgent
 from ..state import WorkflowState
+from ..instrumentation import record_llm_response
 
 # --- 환경 변수 로드 ---
 load_dotenv()  # .env 파일에서 환경 변수 로드
@@ -78,6 +80,7 @@ def generate_podcast_script(research_content, api_key):
             ]
         )
         
+        record_llm_response("claude-sonnet-4-20250514", response)
         if response.content and len(response.content) > 0:
             return response.content[0].text
         else:
@@ -111,7 +114,7 @@ class ScriptWriterAgent(BaseAgent):
         self.output_keys = ["podcast_script", "script_metadata"]
         self.api_key = api_key
     
-    async def process(self, state: WorkflowState) -> WorkflowState:
+    async def process(self, state: WorkflowState) -> Dict[str, Any]:
         """리서치 결과를 바탕으로 팟캐스트 대본을 생성합니다."""
         self.log_execution("팟캐스트 대본 생성 시작")
         
@@ -141,9 +144,10 @@ class ScriptWriterAgent(BaseAgent):
             output_filename = f"AgentCast/output/script_writer/podcast_script_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
             save_script_to_file(podcast_script, output_filename)
             
-            # 워크플로우 상태 업데이트
-            new_state = WorkflowState(
-                **{k: v for k, v in state.__dict__.items()},
+            # 워크플로우 상태 업데이트 (변경된 필드만 반환)
+            self.log_execution(f"팟캐스트 대본 생성 완료: {len(podcast_script)}자")
+            return self.build_update(
+                "script_writer_completed",
                 podcast_script=podcast_script,
                 script_metadata={
                     "script_length": len(podcast_script),
@@ -152,12 +156,6 @@ class ScriptWriterAgent(BaseAgent):
                 }
             )
             
-            # 워크플로우 상태 업데이트
-            new_state = self.update_workflow_status(new_state, "script_writer_completed")
-            
-            self.log_execution(f"팟캐스트 대본 생성 완료: {len(podcast_script)}자")
-            return new_state
-            
         except Exception as e:
             self.log_execution(f"팟캐스트 대본 생성 중 오류 발생: {str(e)}", "ERROR")
             raise
@@ -1,272 +1,84 @@
 """Searcher Agent for web crawling and information collection."""
 
-import time
+import asyncio
 import json
-import re
-import requests
 import os
-from datetime import datetime, timedelta, timezone
-from urllib.parse import urljoin
+from typing import Any, Dict, List, Optional
+from datetime import datetime
 from dotenv import load_dotenv
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import StaleElementReferenceException, NoSuchElementException, TimeoutException
-from selenium.webdriver.support.ui import WebDriverWait, Select
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
-
-from bs4 import BeautifulSoup
-
 from .base_agent import BaseAgent
+from .crawl_ledger import CrawlLedger
+from .dedup import deduplicate_documents
+from .sources import (
+    SOURCE_REGISTRY,
+    AITimesSource,
+    BaseSource,
+    DiscourseSource,
+    PerplexitySource,
+    run_sources
+)
+from ..constants import AGENT_TIMEOUTS, WEB_CRAWLING_TOOL_CONFIGS
 from ..state import WorkflowState
+from ..artifact_store import put_artifact
 
 # --- 환경 변수 로드 ---
 load_dotenv()  # .env 파일에서 환경 변수 로드
 
 class WebSearcher:
     def __init__(self, perplexity_api_key: str = None):
-        self.driver = None
         # API 키는 환경 변수에서 안전하게 로드합니다.
         self.perplexity_api_key = perplexity_api_key or os.environ.get('PERPLEXITY_API_KEY')
         if not self.perplexity_api_key:
             print("⚠️ PERPLEXITY_API_KEY 환경 변수가 설정되지 않았습니다.")
-        self.setup_driver()
-    
-    def setup_driver(self):
-        """WebDriver 설정"""
-        print("WebDriver 설정을 시작합니다...")
-        chrome_options = Options()
-        # chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        print("WebDriver 설정이 완료되었습니다.")
+        # 증분 크롤링을 위한 URL 수집 이력
+        self.ledger = CrawlLedger()
+        self.crawl_stats = {}
     
-    def close_driver(self):
-        """WebDriver 종료"""
-        if self.driver:
-            self.driver.quit()
-            print("WebDriver를 종료합니다.")
-    
-    def crawl_pytorch_kr(self):
-        """파이토치 한국 사용자 모임 크롤링"""
-        print("\n=== 파이토치 한국 사용자 모임 크롤링 시작 ===")
-        
-        URL = "https://discuss.pytorch.kr/c/news"
-        self.driver.get(URL)
-        print(f"'{URL}' 페이지로 이동합니다.")
-        time.sleep(3)
-
-        one_week_ago = datetime.now() - timedelta(days=7)
-        post_info = {}
-
-        print("\n최신 게시글 수집을 시작합니다 (스크롤 다운)...")
-        while True:
-            topic_list_items = self.driver.find_elements(By.CSS_SELECTOR, "tbody.topic-list-body tr.topic-list-item")
-            
-            if not topic_list_items:
-                print("게시글을 찾을 수 없습니다.")
-                break
-
-            last_post_date = None
-            
-            for item in topic_list_items:
-                try:
-                    date_span = item.find_element(By.CSS_SELECTOR, "span.relative-date")
-                    post_timestamp_ms = int(date_span.get_attribute("data-time"))
-                    post_date = datetime.fromtimestamp(post_timestamp_ms / 1000)
-                    
-                    last_post_date = post_date
-                    
-                    if post_date >= one_week_ago:
-                        link_element = item.find_element(By.CSS_SELECTOR, "a.title")
-                        link = link_element.get_attribute("href")
-                        if link not in post_info:
-                            post_info[link] = post_date
-                    
-                except (StaleElementReferenceException, NoSuchElementException):
-                    continue
-            
-            # 마지막 게시글이 1주일 이전이면 중단
-            if last_post_date and last_post_date < one_week_ago:
-                print(f"마지막 게시글 날짜: {last_post_date.strftime('%Y-%m-%d')} - 1주일 이전이므로 수집을 중단합니다.")
-                break
-            
-            # 페이지 하단으로 스크롤
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            
-            # 새로운 게시글이 로드될 때까지 대기
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    lambda driver: len(driver.find_elements(By.CSS_SELECTOR, "tbody.topic-list-body tr.topic-list-item")) > len(topic_list_items)
-                )
-            except TimeoutException:
-                print("새로운 게시글이 로드되지 않아 스크롤을 중단합니다.")
-                break
-
-        print(f"총 {len(post_info)}개의 최신 게시글을 찾았습니다.")
-        
-        # 게시글 내용 수집
-        posts_data = []
-        for link, post_date in post_info.items():
-            try:
-                self.driver.get(link)
-                time.sleep(2)
-                
-                # 제목 추출
-                title_element = self.driver.find_element(By.CSS_SELECTOR, "h1.fancy-title")
-                title = title_element.text.strip()
-                
-                # 내용 추출
-                content_element = self.driver.find_element(By.CSS_SELECTOR, "div.cooked")
-                content = content_element.text.strip()
-                
-                # 작성자 추출
-                try:
-                    author_element = self.driver.find_element(By.CSS_SELECTOR, "span.username")
-                    author = author_element.text.strip()
-                except NoSuchElementException:
-                    author = "Unknown"
-                
-                post_data = {
-                    "title": title,
-                    "content": content,
-                    "author": author,
-                    "url": link,
-                    "date": post_date.isoformat(),
-                    "source": "pytorch_kr"
-                }
-                posts_data.append(post_data)
-                print(f"✅ '{title}' 수집 완료")
-                
-            except Exception as e:
-                print(f"⚠️ 게시글 수집 중 오류 발생: {e}")
+    def build_sources(self, queries: List[str], needs_queries: Optional[bool] = None) -> List[BaseSource]:
+        """등록된 소스 어댑터를 등록 순서대로 생성합니다.
+        
+        needs_queries를 지정하면 검색 쿼리가 필요한(True) / 필요 없는(False) 소스만 생성합니다.
+        """
+        sources = []
+        for name, source_cls in SOURCE_REGISTRY.items():
+            if needs_queries is not None and source_cls.needs_queries != needs_queries:
                 continue
-        
-        return posts_data
-
-    def crawl_aitimes_kr(self):
-        """AI타임스 크롤링"""
-        print("\n=== AI타임스 크롤링 시작 ===")
-        
-        URL = "https://www.aitimes.kr/news/articleList.html?page=1&total=0&box_idxno=&view_type=sm"
-        self.driver.get(URL)
-        print(f"'{URL}' 페이지로 이동합니다.")
-        time.sleep(3)
-
-        one_week_ago = datetime.now() - timedelta(days=7)
-        posts_data = []
-
-        # 최신 기사 수집
-        article_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.list-titles")
-        
-        for article in article_elements[:20]:  # 최신 20개 기사만 수집
-            try:
-                # 제목과 링크 추출
-                title_element = article.find_element(By.CSS_SELECTOR, "a")
-                title = title_element.text.strip()
-                link = title_element.get_attribute("href")
-                
-                # 기사 페이지로 이동
-                self.driver.get(link)
-                time.sleep(2)
-                
-                # 날짜 추출
-                try:
-                    date_element = self.driver.find_element(By.CSS_SELECTOR, "div.view-date")
-                    date_text = date_element.text.strip()
-                    # 날짜 파싱 (예: "2024.01.15 14:30")
-                    post_date = datetime.strptime(date_text, "%Y.%m.%d %H:%M")
-                except:
-                    post_date = datetime.now()
-                
-                # 1주일 이전 기사는 건너뛰기
-                if post_date < one_week_ago:
-                    continue
-                
-                # 내용 추출
-                try:
-                    content_element = self.driver.find_element(By.CSS_SELECTOR, "div.article-content")
-                    content = content_element.text.strip()
-                except NoSuchElementException:
-                    content = "내용을 추출할 수 없습니다."
-                
-                post_data = {
-                    "title": title,
-                    "content": content,
-                    "author": "AI타임스",
-                    "url": link,
-                    "date": post_date.isoformat(),
-                    "source": "aitimes_kr"
-                }
-                posts_data.append(post_data)
-                print(f"✅ '{title}' 수집 완료")
-                
-            except Exception as e:
-                print(f"⚠️ 기사 수집 중 오류 발생: {e}")
-                continue
-        
-        return posts_data
-
-    def search_perplexity(self, query: str, max_results: int = 10):
-        """Perplexity API를 사용한 검색"""
-        if not self.perplexity_api_key:
-            print("❌ Perplexity API 키가 설정되지 않았습니다.")
-            return []
-        
-        print(f"\n=== Perplexity 검색 시작: '{query}' ===")
-        
-        url = "https://api.perplexity.ai/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self.perplexity_api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        data = {
-            "model": "llama-3.1-sonar-small-128k-online",
-            "messages": [
-                {
-                    "role": "user",
-                    "content": f"최신 AI 트렌드와 관련된 정보를 검색해주세요: {query}"
-                }
-            ],
-            "max_tokens": 1000,
-            "temperature": 0.1
+            kwargs = {"api_key": self.perplexity_api_key} if name == PerplexitySource.name else {}
+            sources.append(source_cls(ledger=self.ledger, queries=queries, **kwargs))
+        return sources
+    
+    async def collect(
+        self,
+        queries: List[str],
+        budget: float,
+        needs_queries: Optional[bool] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """소스를 동시에 수집합니다. (needs_queries는 build_sources 참고)
+        
+        소스마다 설정의 deadline을 적용하고 전체는 budget(초) 안에 끝나며,
+        느리거나 실패한 소스가 있어도 끝난 소스의 결과는 그대로 반환합니다.
+        
+        Returns:
+            {소스 이름: {"status", "records", "elapsed_seconds", "stats", ("error")}}
+        """
+        sources = self.build_sources(queries, needs_queries)
+        print(f"\n=== 소스 {len(sources)}개 동시 수집 시작 (예산 {budget:.0f}초) ===")
+        outcomes = await run_sources(sources, budget)
+        self.crawl_stats = {name: outcome["stats"] for name, outcome in outcomes.items()}
+        return outcomes
+
+def summarize_outcomes(outcomes: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """소스별 수집 결과를 search_metadata["source_status"] 형식으로 요약합니다."""
+    return {
+        name: {
+            "status": outcome["status"],
+            "results": len(outcome["records"]),
+            "elapsed_seconds": outcome["elapsed_seconds"],
+            **({"error": outcome["error"]} if "error" in outcome else {})
         }
-        
-        try:
-            response = requests.post(url, headers=headers, json=data)
-            response.raise_for_status()
-            
-            result = response.json()
-            content = result['choices'][0]['message']['content']
-            
-            # 검색 결과를 구조화된 형태로 변환
-            search_result = {
-                "title": f"Perplexity 검색 결과: {query}",
-                "content": content,
-                "author": "Perplexity AI",
-                "url": "https://www.perplexity.ai",
-                "date": datetime.now().isoformat(),
-                "source": "perplexity"
-            }
-            
-            print("✅ Perplexity 검색 완료")
-            return [search_result]
-            
-        except Exception as e:
-            print(f"❌ Perplexity 검색 중 오류 발생: {e}")
-            return []
+        for name, outcome in outcomes.items()
+    }
 
 def save_search_results(data, filename=None):
     """검색 결과를 JSON 파일로 저장합니다."""
@@ -284,7 +96,12 @@ def save_search_results(data, filename=None):
         return None
 
 class SearcherAgent(BaseAgent):
-    """웹 크롤링 및 정보 수집 에이전트"""
+    """웹 크롤링 및 정보 수집 에이전트
+    
+    검색 쿼리가 필요 없는 크롤링 소스(파이토치 한국 사용자 모임, AI타임스)만 수집하므로
+    PersonalizeAgent와 병렬로 실행됩니다. 생성된 쿼리로 검색하는 소스(Perplexity)는
+    쿼리 작성 후 QuerySearcherAgent가 수집하여 이 결과와 합칩니다.
+    """
     
     def __init__(self, perplexity_api_key: str = None):
         super().__init__(
@@ -295,7 +112,7 @@ class SearcherAgent(BaseAgent):
         self.output_keys = ["search_results", "search_metadata"]
         self.web_searcher = WebSearcher(perplexity_api_key)
     
-    async def process(self, state: WorkflowState) -> WorkflowState:
+    async def process(self, state: WorkflowState) -> Dict[str, Any]:
         """웹 크롤링을 통한 정보 수집을 수행합니다."""
         self.log_execution("웹 크롤링 정보 수집 시작")
         
@@ -304,46 +121,47 @@ class SearcherAgent(BaseAgent):
             if not self.validate_inputs(state):
                 raise ValueError("필수 입력이 누락되었습니다.")
             
-            # 검색 쿼리 가져오기
             search_query = getattr(state, 'search_query', '최신 AI 트렌드')
             
-            # 웹 크롤링 수행
-            pytorch_posts = self.web_searcher.crawl_pytorch_kr()
-            aitimes_posts = self.web_searcher.crawl_aitimes_kr()
-            perplexity_results = self.web_searcher.search_perplexity(search_query)
+            # 크롤링 소스를 동시에 수집 (중복 제거/저장할 시간을 남기도록 단계 타임아웃보다 짧은 예산 사용)
+            budget = max(self.timeout - WEB_CRAWLING_TOOL_CONFIGS["source_budget_margin"], 1)
+            outcomes = await self.web_searcher.collect([search_query], budget, needs_queries=False)
+            for name, outcome in outcomes.items():
+                self.log_execution(
+                    f"{name}: {outcome['status']} ({len(outcome['records'])}개, {outcome['elapsed_seconds']}초)",
+                    "INFO" if outcome["status"] == "ok" else "WARNING"
+                )
             
-            # 모든 결과 합치기
-            all_results = pytorch_posts + aitimes_posts + perplexity_results
+            # 모든 결과 합치고 출처 간 유사 중복 제거 (대표 문서에 출처 병합)
+            all_results, dedup_stats = deduplicate_documents(
+                [record for outcome in outcomes.values() for record in outcome["records"]]
+            )
+            self.log_execution(f"중복 제거: {dedup_stats['input']}개 -> {dedup_stats['output']}개")
             
             # 결과 저장
             output_filename = f"AgentCast/output/searcher/search_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             save_search_results(all_results, output_filename)
             
-            # 워크플로우 상태 업데이트
-            new_state = WorkflowState(
-                **{k: v for k, v in state.__dict__.items()},
-                search_results=all_results,
+            # 크롤링한 문서는 아티팩트 저장소에 두고 상태에는 참조 ID만 전달
+            self.log_execution(f"웹 크롤링 정보 수집 완료: {len(all_results)}개 결과")
+            return self.build_update(
+                "searcher_completed",
+                artifacts={"search_results": put_artifact(all_results)},
                 search_metadata={
                     "total_results": len(all_results),
-                    "pytorch_posts": len(pytorch_posts),
-                    "aitimes_posts": len(aitimes_posts),
-                    "perplexity_results": len(perplexity_results),
+                    "pytorch_posts": len(outcomes[DiscourseSource.name]["records"]),
+                    "aitimes_posts": len(outcomes[AITimesSource.name]["records"]),
+                    "source_status": summarize_outcomes(outcomes),
+                    "source_budget_seconds": budget,
+                    "crawl_stats": self.web_searcher.crawl_stats,
+                    "dedup_stats": dedup_stats,
                     "output_file": output_filename
                 }
             )
             
-            # 워크플로우 상태 업데이트
-            new_state = self.update_workflow_status(new_state, "searcher_completed")
-            
-            self.log_execution(f"웹 크롤링 정보 수집 완료: {len(all_results)}개 결과")
-            return new_state
-            
         except Exception as e:
             self.log_execution(f"웹 크롤링 정보 수집 중 오류 발생: {str(e)}", "ERROR")
             raise
-        finally:
-            # WebDriver 종료
-            self.web_searcher.close_driver()
 
 def main():
     """
@@ -357,24 +175,20 @@ def main():
     searcher = WebSearcher()
     
     try:
-        # 2. 파이토치 한국 사용자 모임 크롤링
-        print("\n2️⃣ 파이토치 한국 사용자 모임 크롤링 중...")
-        pytorch_posts = searcher.crawl_pytorch_kr()
-        
-        # 3. AI타임스 크롤링
-        print("\n3️⃣ AI타임스 크롤링 중...")
-        aitimes_posts = searcher.crawl_aitimes_kr()
-        
-        # 4. Perplexity 검색
-        print("\n4️⃣ Perplexity 검색 중...")
-        perplexity_results = searcher.search_perplexity("최신 AI 트렌드")
-        
-        # 5. 결과 합치기
-        print("\n5️⃣ 결과 합치기 중...")
-        all_results = pytorch_posts + aitimes_posts + perplexity_results
-        
-        # 6. 결과 저장
-        print("\n6️⃣ 결과 저장 중...")
+        # 2. 모든 소스 동시 수집 (파이토치 한국 사용자 모임, AI타임스, Perplexity)
+        print("\n2️⃣ 소스 동시 수집 중...")
+        outcomes = asyncio.run(searcher.collect(["최신 AI 트렌드"], budget=AGENT_TIMEOUTS["searcher"]))
+        pytorch_posts = outcomes[DiscourseSource.name]["records"]
+        aitimes_posts = outcomes[AITimesSource.name]["records"]
+        perplexity_results = outcomes[PerplexitySource.name]["records"]
+        
+        # 3. 결과 합치기 (유사 중복 제거)
+        print("\n3️⃣ 결과 합치기 중...")
+        all_results, dedup_stats = deduplicate_documents(pytorch_posts + aitimes_posts + perplexity_results)
+        print(f"   중복 제거: {dedup_stats['duplicates_removed']}개")
+        
+        # 4. 결과 저장
+        print("\n4️⃣ 결과 저장 중...")
         saved_filename = save_search_results(all_results)
         
         if saved_filename:
@@ -398,9 +212,6 @@ def main():
             
     except Exception as e:
         print(f"❌ 웹 크롤링 중 오류 발생: {e}")
-    finally:
-        # WebDriver 종료
-        searcher.close_driver()
 
 if __name__ == "__main__":
     main()
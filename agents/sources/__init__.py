@@ -0,0 +1,20 @@
+"""HTTP-only crawl source adapters."""
+
+from .base import BaseSource, HostRateLimiter, SourceRequestError, get_host_limiter
+from .registry import SOURCE_REGISTRY, register_source, run_sources
+from .discourse_source import DiscourseSource
+from .aitimes_source import AITimesSource
+from .perplexity_source import PerplexitySource
+
+__all__ = [
+    "BaseSource",
+    "HostRateLimiter",
+    "get_host_limiter",
+    "SourceRequestError",
+    "SOURCE_REGISTRY",
+    "register_source",
+    "run_sources",
+    "DiscourseSource",
+    "AITimesSource",
+    "PerplexitySource"
+]
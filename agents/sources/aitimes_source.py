@@ -0,0 +1,249 @@
+"""AI Times (aitimes.kr) source adapter driven by RSS and sitemap feeds."""
+
+import asyncio
+import re
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+from .base import HTML_PARSER, BaseSource, SourceRequestError
+from .registry import register_source
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as etree
+    LXML_AVAILABLE = False
+
+# (기사 URL, 제목, 발행 시각) - 피드에 없는 값은 None
+FeedItem = Tuple[str, Optional[str], Optional[datetime]]
+
+
+def _local_name(tag: Any) -> str:
+    """네임스페이스를 뗀 XML 태그 이름을 반환합니다."""
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _parse_feed_time(value: Optional[str]) -> Optional[datetime]:
+    """RSS(RFC 822)나 사이트맵(W3C/ISO 8601) 시각을 로컬 naive datetime으로 변환합니다."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def _child_text(element: Any, name: str) -> Optional[str]:
+    """네임스페이스와 관계없이 이름이 name인 첫 하위 요소의 텍스트를 반환합니다."""
+    for child in element.iter():
+        if child is not element and _local_name(child.tag) == name and child.text:
+            return child.text.strip()
+    return None
+
+
+def parse_feed(content: bytes) -> Tuple[List[FeedItem], List[Tuple[str, Optional[datetime]]]]:
+    """RSS 또는 사이트맵을 파싱합니다.
+
+    Returns:
+        (기사 항목 목록, 하위 사이트맵 (URL, 수정 시각) 목록)
+    """
+    if LXML_AVAILABLE:
+        root = etree.fromstring(content, parser=etree.XMLParser(recover=True))
+    else:
+        root = etree.fromstring(content)
+    if root is None:
+        return [], []
+
+    items: List[FeedItem] = []
+    sitemaps: List[Tuple[str, Optional[datetime]]] = []
+    for element in root.iter():
+        name = _local_name(element.tag)
+        if name == "item":
+            # RSS 2.0
+            link = _child_text(element, "link")
+            if link:
+                items.append((link, _child_text(element, "title"), _parse_feed_time(_child_text(element, "pubDate"))))
+        elif name == "url":
+            # 사이트맵 (Google News 확장이 있으면 발행 시각과 제목 사용)
+            loc = _child_text(element, "loc")
+            if loc:
+                published = _child_text(element, "publication_date") or _child_text(element, "lastmod")
+                items.append((loc, _child_text(element, "title"), _parse_feed_time(published)))
+        elif name == "sitemap":
+            loc = _child_text(element, "loc")
+            if loc:
+                sitemaps.append((loc, _parse_feed_time(_child_text(element, "lastmod"))))
+    return items, sitemaps
+
+
+@register_source
+class AITimesSource(BaseSource):
+    """AI타임스 기사를 RSS/사이트맵으로 찾아 HTTP로 동시에 수집하는 소스.
+
+    피드에 있는 발행 시각으로 기간(max_age_days) 밖의 기사를 요청 전에 제외하고,
+    남은 기사 HTML만 동시에 받아 div.article-content를 추출합니다. 피드는 설정 순서대로 읽으며
+    앞 피드가 이미 기간 전체를 덮으면(cutoff 이전 기사가 있으면) 다음 피드는 읽지 않습니다.
+    수집 이력은 재검증 주기 안이면 그대로 재사용하고, 그 밖이면 조건부 요청(ETag/Last-Modified)을 보냅니다.
+    """
+
+    name = "aitimes_kr"
+
+    async def fetch(self) -> List[Dict[str, Any]]:
+        """기간 안의 기사를 수집합니다."""
+        cutoff = datetime.now() - timedelta(days=self.config["max_age_days"])
+        semaphore = asyncio.Semaphore(self.config["concurrency"])
+        cached_posts = []
+        tasks = []
+
+        async with self._new_session() as session:
+            items = await self._collect_feed_items(session, cutoff)
+            for url, title, published in items:
+                entry = self.ledger.get(url) if self.ledger else None
+                if self.ledger and self.ledger.is_fresh(entry):
+                    # 재검증 주기 안에 수집한 기사는 요청 없이 재사용
+                    cached_posts.append(entry["record"])
+                    self._count("cached")
+                    continue
+                headers = self.ledger.conditional_headers(entry) if self.ledger else {}
+                tasks.append(self._fetch_article(session, semaphore, url, title, published, cutoff, headers))
+
+            print(f"피드에서 기간 내 기사 {len(items)}개를 찾았습니다. (새로 수집 {len(tasks)}개, 캐시 {len(cached_posts)}개)")
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        posts = []
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"⚠️ 기사 수집 중 오류 발생: {result}")
+            elif result:
+                posts.append(result)
+        return posts + cached_posts
+
+    async def _collect_feed_items(self, session: aiohttp.ClientSession, cutoff: datetime) -> List[FeedItem]:
+        """피드에서 기간 안의 기사 항목을 URL 기준으로 중복 없이 모읍니다. (발행 시각을 모르는 항목 포함)"""
+        items: Dict[str, FeedItem] = {}
+        for feed_url in self.config["feeds"]:
+            try:
+                covered = await self._read_feed(session, feed_url, cutoff, items, depth=0)
+            except (SourceRequestError, aiohttp.ClientError, asyncio.TimeoutError, etree.ParseError) as e:
+                print(f"⚠️ 피드 수집 실패: {feed_url} ({e})")
+                continue
+            if covered:
+                break
+        return list(items.values())
+
+    async def _read_feed(
+        self,
+        session: aiohttp.ClientSession,
+        feed_url: str,
+        cutoff: datetime,
+        items: Dict[str, FeedItem],
+        depth: int
+    ) -> bool:
+        """피드 하나를 읽어 items에 추가합니다. cutoff 이전 항목이 있었으면 True를 반환합니다."""
+        _, content, _ = await self._request(session, feed_url, body_type="bytes")
+        feed_items, sitemaps = parse_feed(content)
+
+        covered = False
+        for url, title, published in feed_items:
+            if published is not None and published < cutoff:
+                covered = True
+                continue
+            previous = items.get(url)
+            # 같은 기사가 여러 피드에 있으면 제목/발행 시각이 있는 쪽을 유지
+            if previous is None or (previous[2] is None and published is not None):
+                items[url] = (url, title or (previous[1] if previous else None), published)
+
+        # 사이트맵 인덱스는 기간 안에 수정된 하위 사이트맵만 한 단계 더 읽음
+        if depth == 0:
+            recent = [loc for loc, modified in sitemaps if modified is None or modified >= cutoff]
+            for loc in recent:
+                covered = await self._read_feed(session, loc, cutoff, items, depth + 1) or covered
+            covered = covered or len(recent) < len(sitemaps)
+        return covered
+
+    async def _fetch_article(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        url: str,
+        title: Optional[str],
+        published: Optional[datetime],
+        cutoff: datetime,
+        headers: Dict[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        """기사 HTML을 받아 레코드로 변환합니다. 304 응답이면 수집 이력의 레코드를 사용합니다."""
+        async with semaphore:
+            status, html, response_headers = await self._request(session, url, headers=headers)
+
+        if status == 304:
+            entry = self.ledger.get(url) if self.ledger else None
+            if entry:
+                self.ledger.touch(url)
+                self._count("not_modified")
+                return entry["record"]
+            # 재사용할 이력이 없으면(그 사이 이력이 지워진 경우 등) 조건부 헤더 없이 다시 요청
+            async with semaphore:
+                status, html, response_headers = await self._request(session, url)
+
+        post_data = self._parse_article(html, url, title, published)
+        if post_data is None or datetime.fromisoformat(post_data["date"]) < cutoff:
+            return None
+
+        self._count("fetched")
+        if self.ledger is None or self.ledger.record(
+            url,
+            post_data,
+            etag=response_headers.get("ETag"),
+            last_modified=response_headers.get("Last-Modified")
+        ):
+            self._count("changed")
+        print(f"✅ '{post_data['title']}' 수집 완료")
+        return post_data
+
+    def _parse_article(
+        self,
+        html: str,
+        url: str,
+        title: Optional[str],
+        published: Optional[datetime]
+    ) -> Optional[Dict[str, Any]]:
+        """기사 페이지에서 본문을 추출합니다. 피드에 없던 제목/날짜는 페이지에서 읽습니다."""
+        soup = BeautifulSoup(html, HTML_PARSER)
+
+        if published is None:
+            # 날짜 추출 (예: "2024.01.15 14:30")
+            published = datetime.now()
+            date_element = soup.select_one("div.view-date")
+            if date_element:
+                match = re.search(r"\d{4}\.\d{2}\.\d{2} \d{2}:\d{2}", date_element.get_text(" ", strip=True))
+                if match:
+                    published = datetime.strptime(match.group(), "%Y.%m.%d %H:%M")
+
+        if not title:
+            title_element = soup.select_one("meta[property='og:title']")
+            title = title_element.get("content", "").strip() if title_element else ""
+        if not title:
+            print(f"⚠️ 기사 제목을 찾을 수 없습니다: {url}")
+            return None
+
+        content_element = soup.select_one("div.article-content")
+        return {
+            "title": title,
+            "content": content_element.get_text("\n", strip=True) if content_element else "내용을 추출할 수 없습니다.",
+            "author": "AI타임스",
+            "url": url,
+            "date": published.isoformat(),
+            "source": self.name
+        }
@@ -0,0 +1,170 @@
+"""Base class for HTTP-only crawl source adapters."""
+
+import asyncio
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import aiohttp
+
+try:
+    import lxml  # noqa: F401
+    # lxml이 있으면 BeautifulSoup도 lxml 파서를 사용 (html.parser보다 수 배 빠름)
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+try:
+    from constants.configuration import WEB_CRAWLING_TOOL_CONFIGS
+    from instrumentation import record_http_request, record_retry
+except ImportError:
+    from ...constants.configuration import WEB_CRAWLING_TOOL_CONFIGS
+    from ...instrumentation import record_http_request, record_retry
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+# 재시도할 HTTP 상태 코드 (요청 한도 초과, 일시적 서버 오류)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class SourceRequestError(Exception):
+    """소스 요청이 재시도 후에도 실패했을 때 발생하는 예외."""
+
+    def __init__(self, url: str, status: int, message: str = ""):
+        self.url = url
+        self.status = status
+        super().__init__(f"{url} 요청 실패 (status {status}) {message}".strip())
+
+
+class HostRateLimiter:
+    """호스트별 동시 요청 수와 최소 요청 간격을 제한하는 클래스.
+
+    같은 이벤트 루프에서 실행되는 모든 소스가 하나를 공유하므로(get_host_limiter)
+    여러 소스가 같은 사이트를 요청해도 합쳐서 제한됩니다. 호스트의 동시 요청 수는
+    그 호스트를 처음 요청한 소스의 설정을 따르고, 최소 간격은 요청마다 적용합니다.
+    """
+
+    def __init__(self):
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._next_allowed: Dict[str, float] = defaultdict(float)
+
+    @asynccontextmanager
+    async def slot(self, url: str, concurrency: int, min_interval: float) -> AsyncIterator[None]:
+        """요청 슬롯을 확보하고 같은 호스트의 이전 요청 이후 min_interval만큼 기다립니다."""
+        host = urlparse(url).netloc
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(concurrency))
+        async with semaphore:
+            now = asyncio.get_running_loop().time()
+            wait_time = max(0.0, self._next_allowed[host] - now)
+            self._next_allowed[host] = max(now, self._next_allowed[host]) + min_interval
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+            yield
+
+
+# asyncio 세마포어는 이벤트 루프에 묶이므로 루프마다 제한기를 하나씩 둠
+_HOST_LIMITERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, HostRateLimiter]" = weakref.WeakKeyDictionary()
+
+
+def get_host_limiter() -> HostRateLimiter:
+    """현재 이벤트 루프에서 모든 소스가 공유하는 호스트별 요청 제한기를 반환합니다."""
+    loop = asyncio.get_running_loop()
+    limiter = _HOST_LIMITERS.get(loop)
+    if limiter is None:
+        limiter = _HOST_LIMITERS[loop] = HostRateLimiter()
+    return limiter
+
+
+class BaseSource(ABC):
+    """브라우저 없이 HTTP로 수집하는 소스 어댑터의 기본 클래스.
+
+    fetch()는 {title, content, author, url, date, source} 형식의 레코드 목록을 반환합니다.
+    설정은 WEB_CRAWLING_TOOL_CONFIGS["sources"][name]에서 읽고, ledger(CrawlLedger)를 넘기면
+    이미 수집한 게시글을 재사용하는 증분 수집을 합니다. queries는 검색형(needs_queries) 소스만 사용합니다.
+    register_source로 등록하면 SearcherAgent(쿼리가 필요 없는 소스) 또는
+    QuerySearcherAgent(needs_queries 소스)가 같은 종류의 다른 소스와 동시에 실행합니다.
+    """
+
+    name: str = ""
+    # True면 QueryWriterAgent가 만든 검색 쿼리가 필요한 소스 (쿼리 작성 후 QuerySearcherAgent가 수집)
+    needs_queries: bool = False
+
+    def __init__(
+        self,
+        ledger: Optional[Any] = None,
+        config: Optional[Dict[str, Any]] = None,
+        queries: Optional[List[str]] = None
+    ):
+        self.config = {
+            **WEB_CRAWLING_TOOL_CONFIGS["host_limits"],
+            **WEB_CRAWLING_TOOL_CONFIGS["sources"].get(self.name, {}),
+            **(config or {})
+        }
+        self.ledger = ledger
+        self.queries = queries or []
+        self.stats = {"fetched": 0, "changed": 0, "not_modified": 0, "cached": 0}
+        # 파싱/브라우저 작업을 워커 스레드에서 처리해도 집계가 누락되지 않도록 잠금 사용
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        """수집 통계를 스레드 안전하게 증가시킵니다."""
+        with self._stats_lock:
+            self.stats[key] = self.stats.get(key, 0) + amount
+
+    @abstractmethod
+    async def fetch(self) -> List[Dict[str, Any]]:
+        """소스에서 레코드를 수집합니다."""
+
+    def _new_session(self) -> aiohttp.ClientSession:
+        """keep-alive 연결을 재사용하는 HTTP 세션을 만듭니다."""
+        return aiohttp.ClientSession(
+            headers={"User-Agent": DEFAULT_USER_AGENT},
+            timeout=aiohttp.ClientTimeout(total=self.config.get("request_timeout", 15))
+        )
+
+    async def _request(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        body_type: str = "text",
+        method: str = "GET",
+        **kwargs
+    ) -> Tuple[int, Any, Dict[str, str]]:
+        """요청을 보내고 (상태 코드, 본문, 헤더)를 반환합니다.
+
+        body_type은 "json", "text", "bytes" 중 하나이며, 429/5xx 응답은
+        Retry-After(없으면 지수 백오프)만큼 기다린 뒤 재시도합니다.
+        모든 요청(재시도 포함)은 호스트별 요청 제한기(per_host_concurrency / per_host_min_interval)를 거칩니다.
+        """
+        max_retries = self.config.get("max_retries", 3)
+        limiter = get_host_limiter()
+        for attempt in range(max_retries + 1):
+            record_http_request(f"web:{urlparse(url).netloc}")
+            async with limiter.slot(url, self.config["per_host_concurrency"], self.config["per_host_min_interval"]), \
+                    session.request(method, url, **kwargs) as response:
+                if response.status not in RETRYABLE_STATUSES:
+                    if response.status >= 400:
+                        raise SourceRequestError(url, response.status)
+                    if response.status == 304 or body_type == "text":
+                        body = await response.text()
+                    elif body_type == "json":
+                        body = await response.json(content_type=None)
+                    else:
+                        body = await response.read()
+                    return response.status, body, dict(response.headers)
+                retry_after = response.headers.get("Retry-After")
+
+            if attempt == max_retries:
+                raise SourceRequestError(url, response.status, "재시도 횟수 초과")
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt
+            record_retry(self.name)
+            print(f"⚠️ {url} 응답 {response.status}, {delay:.0f}초 후 재시도합니다. ({attempt + 1}/{max_retries})")
+            await asyncio.sleep(delay)
+
+    async def _request_json(self, session: aiohttp.ClientSession, url: str, **kwargs) -> Any:
+        """JSON을 요청합니다."""
+        _, body, _ = await self._request(session, url, body_type="json", **kwargs)
+        return body
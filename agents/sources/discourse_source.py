@@ -0,0 +1,142 @@
+"""Discourse forum source adapter using the public JSON API."""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+from .base import BaseSource
+from .registry import register_source
+
+
+def _parse_time(value: str) -> datetime:
+    """Discourse의 UTC ISO 시각을 로컬 naive datetime으로 변환합니다."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone().replace(tzinfo=None)
+
+
+@register_source
+class DiscourseSource(BaseSource):
+    """Discourse 포럼(파이토치 한국 사용자 모임)의 최신 토픽을 JSON API로 수집하는 소스.
+
+    /c/{category}.json?page=N 목록(최근 활동 순)을 기간(max_age_days)이 끝날 때까지 넘기며,
+    기간 안에 작성된 토픽은 바로 /t/{id}.json 본문 요청을 예약해 목록을 넘기는 동안에도 동시에 받습니다.
+    레코드의 date는 토픽 작성 시각이고, 최근 활동 시각(bumped_at)은 변경 감지에만 사용합니다.
+    수집 이력의 최근 활동 시각이 같은 토픽은 요청 없이 캐시된 레코드를 사용합니다.
+    """
+
+    name = "pytorch_kr"
+
+    def __init__(self, ledger: Optional[Any] = None, config: Optional[Dict[str, Any]] = None, **kwargs):
+        super().__init__(ledger, config, **kwargs)
+        self.base_url = self.config["base_url"].rstrip("/")
+
+    async def fetch(self) -> List[Dict[str, Any]]:
+        """최근 활동 기간 안의 토픽을 수집합니다."""
+        cutoff = datetime.now() - timedelta(days=self.config["max_age_days"])
+        semaphore = asyncio.Semaphore(self.config["concurrency"])
+        cached_posts = []
+        tasks = []
+
+        async with self._new_session() as session:
+            try:
+                async for topic, activity in self._iter_recent_topics(session, cutoff):
+                    created = _parse_time(topic["created_at"]) if topic.get("created_at") else activity
+                    if created < cutoff:
+                        # 오래전에 작성됐지만 최근 댓글로 목록 상단에 올라온 토픽은 제외
+                        continue
+                    url = f"{self.base_url}/t/{topic.get('slug', 'topic')}/{topic['id']}"
+                    entry = self.ledger.get(url) if self.ledger else None
+                    if entry and entry["version"] == activity.isoformat():
+                        # 마지막 수집 이후 활동이 없는 토픽은 캐시 사용
+                        cached_posts.append(entry["record"])
+                        self._count("cached")
+                        continue
+                    # 발견 즉시 본문 수집 예약
+                    tasks.append(asyncio.create_task(self._fetch_topic(session, semaphore, topic["id"], url, created, activity)))
+
+                print(f"총 {len(tasks) + len(cached_posts)}개의 최신 토픽을 찾았습니다. (새로 수집 {len(tasks)}개, 캐시 {len(cached_posts)}개)")
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+            except BaseException:
+                # 목록 수집 중 실패하거나 deadline으로 취소되면 예약한 본문 요청도 취소
+                for task in tasks:
+                    task.cancel()
+                raise
+
+        posts = []
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"⚠️ 토픽 수집 중 오류 발생: {result}")
+            elif result:
+                posts.append(result)
+        return posts + cached_posts
+
+    async def _iter_recent_topics(
+        self,
+        session: aiohttp.ClientSession,
+        cutoff: datetime
+    ) -> AsyncIterator[Tuple[Dict[str, Any], datetime]]:
+        """최신 활동 순 토픽 목록을 cutoff 이전 토픽이 나올 때까지 페이지 단위로 넘깁니다."""
+        seen = set()
+        for page in range(self.config["max_pages"]):
+            data = await self._request_json(
+                session, f"{self.base_url}/c/{self.config['category']}.json", params={"page": page}
+            )
+            topic_list = data.get("topic_list", {})
+            topics = topic_list.get("topics", [])
+            if not topics:
+                return
+
+            reached_cutoff = False
+            for topic in topics:
+                if topic["id"] in seen:
+                    continue
+                seen.add(topic["id"])
+                activity = _parse_time(topic.get("bumped_at") or topic.get("last_posted_at") or topic["created_at"])
+                if activity < cutoff:
+                    # 고정 토픽은 활동 시각과 무관하게 목록 상단에 있으므로 중단 기준에서 제외
+                    if not topic.get("pinned"):
+                        reached_cutoff = True
+                    continue
+                yield topic, activity
+
+            if reached_cutoff:
+                print(f"{self.config['max_age_days']}일 이전 토픽에 도달해 목록 수집을 중단합니다. ({page + 1}페이지)")
+                return
+            if not topic_list.get("more_topics_url"):
+                return
+
+    async def _fetch_topic(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        topic_id: int,
+        url: str,
+        created: datetime,
+        activity: datetime
+    ) -> Optional[Dict[str, Any]]:
+        """토픽 본문(첫 게시물)을 가져와 레코드로 변환하고 수집 이력에 기록합니다."""
+        async with semaphore:
+            data = await self._request_json(session, f"{self.base_url}/t/{topic_id}.json")
+
+        posts = data.get("post_stream", {}).get("posts", [])
+        if not posts:
+            print(f"⚠️ 토픽 본문을 찾을 수 없습니다: {url}")
+            return None
+
+        first_post = posts[0]
+        post_data = {
+            "title": data.get("title", ""),
+            "content": BeautifulSoup(first_post.get("cooked", ""), "html.parser").get_text("\n", strip=True),
+            "author": first_post.get("username") or "Unknown",
+            "url": url,
+            "date": created.isoformat(),
+            "source": self.name
+        }
+        # 목록의 최근 활동 시각을 버전 표시로 사용
+        self._count("fetched")
+        if self.ledger is None or self.ledger.record(url, post_data, version=activity.isoformat()):
+            self._count("changed")
+        print(f"✅ '{post_data['title']}' 수집 완료")
+        return post_data
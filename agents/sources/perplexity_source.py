@@ -0,0 +1,180 @@
+"""Perplexity search source with concurrent queries and citation records."""
+
+import asyncio
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+from .base import HTML_PARSER, BaseSource
+from .registry import register_source
+from ..browser_service import SELENIUM_AVAILABLE, BrowserService, get_browser_service
+
+try:
+    from instrumentation import record_llm_usage
+except ImportError:
+    from ...instrumentation import record_llm_usage
+
+# 인용 페이지에서 본문이 아닌 요소
+_BOILERPLATE_TAGS = ["script", "style", "noscript", "nav", "header", "footer", "aside", "form"]
+
+
+def extract_main_text(html: str) -> str:
+    """일반 웹 페이지에서 본문 텍스트를 추출합니다. (article/main 우선)"""
+    soup = BeautifulSoup(html, HTML_PARSER)
+    for element in soup(_BOILERPLATE_TAGS):
+        element.decompose()
+    main = soup.find("article") or soup.find("main") or soup.body or soup
+    return main.get_text("\n", strip=True)
+
+
+@register_source
+class PerplexitySource(BaseSource):
+    """Perplexity API로 여러 검색 쿼리를 동시에 보내는 소스.
+
+    모든 쿼리는 keep-alive 연결 풀을 쓰는 세션 하나로 동시에 요청하므로 쿼리 수와 관계없이
+    대략 한 번의 왕복 시간이 걸립니다. 답변마다 레코드 하나를 만들고, 답변의 인용 URL은
+    (쿼리 간 중복 없이) 별도 레코드로 반환합니다. hydrate_citations가 켜져 있으면
+    인용 페이지 본문을 동시에 받아 content로 채웁니다. HTTP 응답의 본문이 거의 없는(JS로 그리는)
+    인용 페이지는 공유 BrowserService의 탭을 빌려 렌더링한 HTML에서 다시 추출합니다.
+    """
+
+    name = "perplexity"
+    needs_queries = True
+
+    def __init__(
+        self,
+        ledger: Optional[Any] = None,
+        config: Optional[Dict[str, Any]] = None,
+        queries: Optional[List[str]] = None,
+        api_key: Optional[str] = None,
+        browser: Optional[BrowserService] = None
+    ):
+        super().__init__(ledger, config, queries)
+        # 빈 쿼리와 중복 쿼리 제외 (순서 유지)
+        self.queries = list(dict.fromkeys(query.strip() for query in self.queries if query and query.strip()))
+        self.api_key = api_key or os.environ.get("PERPLEXITY_API_KEY")
+        # 지정하지 않으면 렌더링이 필요할 때 프로세스 전역 브라우저를 사용 (처음 빌릴 때 시작)
+        self.browser = browser
+        self.stats.update({"queries": 0, "citations": 0, "citations_hydrated": 0, "citations_rendered": 0})
+
+    async def fetch(self) -> List[Dict[str, Any]]:
+        """모든 쿼리의 답변 레코드와 인용 레코드를 반환합니다."""
+        if not self.api_key:
+            print("❌ Perplexity API 키가 설정되지 않았습니다.")
+            return []
+        if not self.queries:
+            return []
+
+        print(f"\n=== Perplexity 검색 시작: {len(self.queries)}개 쿼리 동시 요청 ===")
+        async with self._new_session() as session:
+            answers = await asyncio.gather(
+                *(self._search(session, query) for query in self.queries),
+                return_exceptions=True
+            )
+
+            results = []
+            citations: Dict[str, Dict[str, Any]] = {}
+            for query, answer in zip(self.queries, answers):
+                if isinstance(answer, Exception):
+                    print(f"❌ Perplexity 검색 중 오류 발생 ('{query}'): {answer}")
+                    continue
+                results.append(answer["record"])
+                for citation in answer["citations"]:
+                    citations.setdefault(citation["url"], citation)
+
+            citation_records = list(citations.values())
+            self.stats["citations"] = len(citation_records)
+            if citation_records and self.config["hydrate_citations"]:
+                await self._hydrate_citations(session, citation_records)
+
+        print(f"✅ Perplexity 검색 완료: 답변 {len(results)}개, 인용 {len(citation_records)}개")
+        return results + citation_records
+
+    async def _search(self, session: aiohttp.ClientSession, query: str) -> Dict[str, Any]:
+        """쿼리 하나를 요청하고 답변 레코드와 인용 레코드 목록을 반환합니다."""
+        payload = {
+            "model": self.config["model"],
+            "messages": [
+                {"role": "user", "content": self.config["prompt_template"].format(query=query)}
+            ],
+            "max_tokens": self.config["max_tokens"],
+            "temperature": self.config["temperature"]
+        }
+        _, result, _ = await self._request(
+            session,
+            self.config["api_url"],
+            body_type="json",
+            method="POST",
+            json=payload,
+            headers={"Authorization": f"Bearer {self.api_key}"}
+        )
+        self._count("queries")
+        usage = result.get("usage") or {}
+        record_llm_usage(self.config["model"], usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0))
+
+        now = datetime.now().isoformat()
+        # search_results(제목/날짜 포함)가 있으면 우선 사용하고, 없으면 citations URL 목록 사용
+        sources = result.get("search_results") or [{"url": url} for url in result.get("citations", [])]
+        citations = [
+            {
+                "title": source.get("title") or source["url"],
+                "content": "",
+                "author": urlparse(source["url"]).netloc,
+                "url": source["url"],
+                "date": source.get("date") or now,
+                "source": "perplexity_citation",
+                "query": query
+            }
+            for source in sources if source.get("url")
+        ]
+        record = {
+            "title": f"Perplexity 검색 결과: {query}",
+            "content": result["choices"][0]["message"]["content"],
+            "author": "Perplexity AI",
+            "url": "https://www.perplexity.ai",
+            "date": now,
+            "source": self.name,
+            "query": query,
+            "citations": [citation["url"] for citation in citations]
+        }
+        return {"record": record, "citations": citations}
+
+    async def _hydrate_citations(self, session: aiohttp.ClientSession, citations: List[Dict[str, Any]]) -> None:
+        """인용 페이지 본문을 동시에 받아 레코드의 content를 채웁니다. (실패한 인용은 빈 content 유지)"""
+        semaphore = asyncio.Semaphore(self.config["citation_concurrency"])
+        timeout = aiohttp.ClientTimeout(total=self.config["citation_timeout"])
+
+        async def hydrate(citation: Dict[str, Any]) -> None:
+            async with semaphore:
+                try:
+                    _, html, _ = await self._request(session, citation["url"], timeout=timeout)
+                except Exception as e:
+                    print(f"⚠️ 인용 페이지 수집 실패: {citation['url']} ({e})")
+                    return
+            content = extract_main_text(html)
+            if len(content) < self.config["js_render_min_chars"]:
+                content = await self._render_citation(citation["url"]) or content
+            citation["content"] = content[:self.config["max_citation_chars"]]
+            self._count("citations_hydrated")
+
+        await asyncio.gather(*(hydrate(citation) for citation in citations))
+
+    async def _render_citation(self, url: str) -> Optional[str]:
+        """브라우저 탭에서 인용 페이지를 렌더링해 본문을 추출합니다. 렌더링할 수 없으면 None을 반환합니다."""
+        if not self.config["render_js_citations"]:
+            return None
+        browser = self.browser or (get_browser_service() if SELENIUM_AVAILABLE else None)
+        if browser is None:
+            return None
+        try:
+            # WebDriver 호출은 블로킹이므로 워커 스레드에서 실행 (탭 수는 max_tabs로 제한)
+            html = await asyncio.to_thread(browser.render, url, None, self.config["citation_timeout"])
+        except Exception as e:
+            print(f"⚠️ 인용 페이지 렌더링 실패: {url} ({e})")
+            return None
+        self._count("citations_rendered")
+        return extract_main_text(html)
@@ -0,0 +1,69 @@
+"""Source registry and deadline-bounded concurrent fan-out."""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Type
+
+from .base import BaseSource
+
+# 등록 순서가 결과를 합치는 순서
+SOURCE_REGISTRY: Dict[str, Type[BaseSource]] = {}
+
+
+def register_source(source_cls: Type[BaseSource]) -> Type[BaseSource]:
+    """소스 어댑터 클래스를 name으로 등록하는 데코레이터."""
+    if not source_cls.name:
+        raise ValueError(f"{source_cls.__name__}에 name이 없습니다.")
+    SOURCE_REGISTRY[source_cls.name] = source_cls
+    return source_cls
+
+
+async def _run_with_deadline(source: BaseSource, deadline: float) -> Dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        records = await asyncio.wait_for(source.fetch(), timeout=deadline)
+        outcome = {"status": "ok", "records": records}
+    except asyncio.TimeoutError:
+        print(f"⏱️ {source.name} 수집이 {deadline:.0f}초 제한을 넘어 중단되었습니다.")
+        outcome = {"status": "timeout", "records": []}
+    except Exception as e:
+        print(f"❌ {source.name} 수집 중 오류 발생: {e}")
+        outcome = {"status": "error", "records": [], "error": str(e)}
+    outcome["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+    return outcome
+
+
+async def run_sources(sources: List[BaseSource], budget: float) -> Dict[str, Dict[str, Any]]:
+    """모든 소스를 동시에 실행하고 소스별 결과를 반환합니다.
+
+    소스마다 설정의 deadline(최대 budget)을 적용하고, 전체가 budget 안에 끝나지 않으면
+    남은 소스를 취소합니다. 한 소스가 느리거나 실패해도 끝난 소스의 결과는 그대로 반환합니다.
+
+    Returns:
+        {소스 이름: {"status": ok/timeout/error/cancelled, "records": [...],
+                    "elapsed_seconds": float, "stats": {...}, ("error": str)}}
+    """
+    tasks = {
+        source.name: asyncio.create_task(
+            _run_with_deadline(source, min(source.config.get("deadline", budget), budget))
+        )
+        for source in sources
+    }
+    if tasks:
+        # 소스별 deadline이 먼저 적용되며, 이 대기는 전체 단계 예산을 지키기 위한 안전장치
+        _, pending = await asyncio.wait(tasks.values(), timeout=budget)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    outcomes = {}
+    for source in sources:
+        task = tasks[source.name]
+        if task.cancelled():
+            print(f"⏱️ {source.name} 수집이 단계 예산({budget:.0f}초)을 넘어 취소되었습니다.")
+            outcome = {"status": "cancelled", "records": [], "elapsed_seconds": round(budget, 3)}
+        else:
+            outcome = task.result()
+        outcome["stats"] = source.stats
+        outcomes[source.name] = outcome
+    return outcomes
@@ -5,30 +5,43 @@ import torch
 import numpy as np
 from tqdm import tqdm
 from datetime import datetime
+from typing import Any, Dict
 
 # Transformers 라이브러리 임포트
 from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 
-from .base_agent import BaseAgent
-from ..state import WorkflowState
+try:
+    from agents.base_agent import BaseAgent
+    from state import WorkflowState
+    from artifact_store import put_artifact, load_artifact
+except ImportError:
+    from .base_agent import BaseAgent
+    from ..state import WorkflowState
+    from ..artifact_store import put_artifact, load_artifact
 
 # --- GPU 설정 ---
 DEVICE = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 print(f"🚀 사용 디바이스: {DEVICE}")
 
+SUMMARY_FAILED_MESSAGE = "요약 생성에 실패했습니다."
+
 class KoT5Summarizer:
     """
     KoT5 모델을 사용하여 텍스트를 요약하는 에이전트
     """
     
-    def __init__(self, model_name="psyche/KoT5-summarization"):
+    def __init__(self, model_name="psyche/KoT5-summarization", batch_size=8, max_batch_tokens=8192):
         """
         KoT5 모델과 토크나이저를 초기화합니다.
         
         Args:
             model_name (str): 사용할 KoT5 모델명
+            batch_size (int): 한 번에 generate할 최대 텍스트 수
+            max_batch_tokens (int): 배치당 최대 (패딩 포함) 입력 토큰 수
         """
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_batch_tokens = max_batch_tokens
         self.tokenizer = None
         self.model = None
         self._load_model()
@@ -56,36 +69,132 @@ class KoT5Summarizer:
         Returns:
             str: 요약된 텍스트
         """
-        try:
-            # 텍스트 전처리 (너무 긴 텍스트는 잘라냄)
-            if len(text) > 4000:
-                text = text[:4000] + "..."
+        return self.summarize_batch([text], max_length=max_length, min_length=min_length, show_progress=False)[0]
+    
+    def _make_batches(self, lengths, batch_size, max_batch_tokens):
+        """
+        토큰 길이순으로 정렬한 인덱스를 배치로 나눕니다.
+        
+        비슷한 길이끼리 묶어 패딩을 줄이고, 배치의 (샘플 수 x 최대 길이)가
+        max_batch_tokens를 넘지 않도록 합니다.
+        
+        Args:
+            lengths (list): 각 입력의 토큰 길이
+            batch_size (int): 배치당 최대 샘플 수
+            max_batch_tokens (int): 배치당 최대 패딩 포함 토큰 수
             
-            # 토크나이징
-            inputs = self.tokenizer(
-                text, 
-                return_tensors="pt", 
-                max_length=1024, 
-                truncation=True
-            ).to(DEVICE)
+        Returns:
+            list: 원본 인덱스 리스트들의 리스트
+        """
+        order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+        
+        batches = []
+        current = []
+        for index in order:
+            # 길이 내림차순이므로 배치의 최대 길이는 첫 원소의 길이
+            padded_length = lengths[current[0]] if current else lengths[index]
+            if current and (len(current) >= batch_size or (len(current) + 1) * padded_length > max_batch_tokens):
+                batches.append(current)
+                current = []
+            current.append(index)
+        if current:
+            batches.append(current)
+        
+        return batches
+    
+    def _generate(self, batch_ids, max_length, min_length):
+        """
+        토큰 ID 목록을 배치 단위로 패딩해 요약을 생성하고 디코딩합니다.
+        
+        Args:
+            batch_ids (list): 패딩하지 않은 입력 토큰 ID 리스트들
+            max_length (int): 최대 요약 길이
+            min_length (int): 최소 요약 길이
             
-            # 요약 생성
+        Returns:
+            list: batch_ids와 같은 순서의 요약 텍스트 목록
+        """
+        # 배치 단위 패딩
+        inputs = self.tokenizer.pad({"input_ids": batch_ids}, return_tensors="pt").to(DEVICE)
+        
+        # 요약 생성
+        with torch.inference_mode():
             summary_ids = self.model.generate(
                 inputs['input_ids'],
+                attention_mask=inputs['attention_mask'],
                 max_length=max_length,
                 min_length=min_length,
                 num_beams=4,
                 length_penalty=2.0,
                 early_stopping=True
             )
+        
+        return self.tokenizer.batch_decode(summary_ids, skip_special_tokens=True)
+    
+    def _generate_single(self, input_ids, index, max_length, min_length):
+        """실패한 배치의 샘플 하나를 단독으로 요약합니다. 실패하면 None을 반환합니다."""
+        try:
+            return self._generate([input_ids], max_length, min_length)[0]
+        except Exception as e:
+            print(f"⚠️ 단일 샘플 요약 중 오류 발생 (샘플 {index + 1}): {e}")
+            return None
+    
+    def summarize_batch(self, texts, max_length=200, min_length=30, batch_size=None, max_batch_tokens=None, show_progress=True):
+        """
+        여러 텍스트를 길이별 배치로 묶어 한 번에 요약합니다.
+        
+        Args:
+            texts (list): 요약할 텍스트 목록
+            max_length (int): 최대 요약 길이
+            min_length (int): 최소 요약 길이
+            batch_size (int): 배치당 최대 샘플 수 (None이면 초기화 값 사용)
+            max_batch_tokens (int): 배치당 최대 토큰 수 (None이면 초기화 값 사용)
+            show_progress (bool): 진행 표시 여부
             
-            # 디코딩
-            summary = self.tokenizer.decode(summary_ids[0], skip_special_tokens=True)
-            return summary.strip()
+        Returns:
+            list: 입력과 같은 순서의 요약 텍스트 목록
+        """
+        if not texts:
+            return []
+        
+        batch_size = batch_size or self.batch_size
+        max_batch_tokens = max_batch_tokens or self.max_batch_tokens
+        
+        # 텍스트 전처리 (너무 긴 텍스트는 잘라냄)
+        texts = [text[:4000] + "..." if len(text) > 4000 else text for text in texts]
+        
+        summaries = [SUMMARY_FAILED_MESSAGE] * len(texts)
+        
+        # 패딩 없이 토크나이징해 길이를 구함 (토크나이징에 실패한 텍스트만 실패 처리)
+        encoded = {}
+        for index, text in enumerate(texts):
+            try:
+                encoded[index] = self.tokenizer(text, max_length=1024, truncation=True)["input_ids"]
+            except Exception as e:
+                print(f"⚠️ 토크나이징 중 오류 발생 (샘플 {index + 1}): {e}")
+        
+        valid = list(encoded)
+        batches = [
+            [valid[position] for position in batch]
+            for batch in self._make_batches([len(encoded[i]) for i in valid], batch_size, max_batch_tokens)
+        ]
+        
+        for batch in tqdm(batches, desc="배치 요약 생성 중", disable=not show_progress):
+            try:
+                decoded = self._generate([encoded[i] for i in batch], max_length, min_length)
+            except Exception as e:
+                print(f"⚠️ 요약 생성 중 오류 발생 (배치 크기 {len(batch)}): {e}")
+                if len(batch) == 1:
+                    continue
+                # 한 샘플 때문에 배치 전체가 실패했을 수 있으므로 하나씩 다시 시도
+                decoded = [self._generate_single(encoded[i], i, max_length, min_length) for i in batch]
             
-        except Exception as e:
-            print(f"⚠️ 요약 생성 중 오류 발생: {e}")
-            return "요약 생성에 실패했습니다."
+            # 원래 위치로 되돌림 (단독으로도 실패한 샘플은 실패 메시지 유지)
+            for index, summary in zip(batch, decoded):
+                if summary is not None:
+                    summaries[index] = summary.strip()
+        
+        return summaries
 
 def load_search_results(filename="combined_search_results.json"):
     """
@@ -130,37 +239,37 @@ def save_summarized_results(data, filename=None):
         print(f"❌ 파일 저장 중 오류 발생: {e}")
         return None
 
-def process_search_results(data, summarizer):
+def process_search_results(data, summarizer, batch_size=None):
     """
     검색 결과에 요약을 추가합니다.
     
     Args:
         data (list): 검색 결과 데이터
         summarizer (KoT5Summarizer): 요약 모델
+        batch_size (int): 배치당 최대 샘플 수 (None이면 요약 모델 설정 사용)
         
     Returns:
         list: 요약이 추가된 데이터
     """
     print(f"📝 총 {len(data)}개 샘플에 대한 요약 생성 시작")
     
-    processed_data = []
+    # 기존 데이터 복사
+    processed_data = [sample.copy() for sample in data]
     
-    for i, sample in enumerate(tqdm(data, desc="요약 생성 중")):
-        # 기존 데이터 복사
-        processed_sample = sample.copy()
-        
-        # content가 있는 경우에만 요약 생성
-        if 'content' in sample and sample['content'].strip():
-            try:
-                summary = summarizer.summarize_text(sample['content'])
-                processed_sample['summary'] = summary
-            except Exception as e:
-                print(f"⚠️ 샘플 {i+1} 요약 실패: {e}")
-                processed_sample['summary'] = "요약 생성에 실패했습니다."
-        else:
-            processed_sample['summary'] = "요약할 내용이 없습니다."
-        
-        processed_data.append(processed_sample)
+    # content가 있는 샘플만 배치 요약
+    targets = [
+        i for i, sample in enumerate(data)
+        if 'content' in sample and sample['content'].strip()
+    ]
+    summaries = summarizer.summarize_batch(
+        [data[i]['content'] for i in targets],
+        batch_size=batch_size
+    )
+    
+    for processed_sample in processed_data:
+        processed_sample['summary'] = "요약할 내용이 없습니다."
+    for i, summary in zip(targets, summaries):
+        processed_data[i]['summary'] = summary
     
     return processed_data
 
@@ -176,7 +285,7 @@ class SummarizerAgent(BaseAgent):
         self.output_keys = ["summarized_results", "summarization_metadata"]
         self.summarizer = KoT5Summarizer(model_name)
     
-    async def process(self, state: WorkflowState) -> WorkflowState:
+    async def process(self, state: WorkflowState) -> Dict[str, Any]:
         """검색 결과에 요약을 추가합니다."""
         self.log_execution("텍스트 요약 시작")
         
@@ -186,7 +295,7 @@ class SummarizerAgent(BaseAgent):
                 raise ValueError("필수 입력이 누락되었습니다.")
             
             # 검색 결과 가져오기
-            search_results = getattr(state, 'search_results', [])
+            search_results = load_artifact(state, 'search_results', [])
             if not search_results:
                 raise ValueError("요약할 검색 결과가 없습니다.")
             
@@ -197,23 +306,18 @@ class SummarizerAgent(BaseAgent):
             output_filename = f"AgentCast/output/summarizer/summarized_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             save_summarized_results(summarized_results, output_filename)
             
-            # 워크플로우 상태 업데이트
-            new_state = WorkflowState(
-                **{k: v for k, v in state.__dict__.items()},
-                summarized_results=summarized_results,
+            # 요약 결과는 아티팩트 저장소에 두고 상태에는 참조 ID만 전달
+            self.log_execution(f"텍스트 요약 완료: {len(summarized_results)}개 항목 처리")
+            return self.build_update(
+                "summarizer_completed",
+                artifacts={"summarized_results": put_artifact(summarized_results)},
                 summarization_metadata={
                     "total_items": len(summarized_results),
-                    "successful_summaries": sum(1 for item in summarized_results if item.get('summary') != "요약 생성에 실패했습니다."),
+                    "successful_summaries": sum(1 for item in summarized_results if item.get('summary') != SUMMARY_FAILED_MESSAGE),
                     "output_file": output_filename
                 }
             )
             
-            # 워크플로우 상태 업데이트
-            new_state = self.update_workflow_status(new_state, "summarizer_completed")
-            
-            self.log_execution(f"텍스트 요약 완료: {len(summarized_results)}개 항목 처리")
-            return new_state
-            
         except Exception as e:
             self.log_execution(f"텍스트 요약 중 오류 발생: {str(e)}", "ERROR")
             raise
@@ -1,16 +1,22 @@
 """TTS Agent for converting podcast scripts to audio using TTS."""
 
 import os
+import asyncio
+import hashlib
 import google.generativeai as genai
 from google.generativeai import types
-import wave
 from tqdm import tqdm
 import argparse # 명령행 인자를 처리하기 위해 추가
 from dotenv import load_dotenv
 from datetime import datetime
+from typing import Any, Dict
 
 from .base_agent import BaseAgent
+from .tts_pipeline import TTSPipeline
+from .tts_cache import TTSChunkCache, is_tts_cache_bypassed
+from .audio_sink import AudioSink, finalize_audio
 from ..state import WorkflowState
+from ..constants.configuration import TTS_SYNTHESIS_CONFIGS, TTS_CACHE_CONFIGS
 
 # --- 환경 변수 로드 ---
 load_dotenv()  # .env 파일에서 환경 변수 로드
@@ -27,24 +33,34 @@ def read_script_file(filepath):
         print(f"오류: 파일을 읽는 중 문제가 발생했습니다 - {e}")
         return None
 
+def _is_anchor_turn(turn):
+    """턴 내용의 해시로 청크 경계(앵커) 여부를 정합니다."""
+    digest = hashlib.sha256(turn.strip().encode('utf-8')).digest()
+    return int.from_bytes(digest[:4], "big") % TTS_SYNTHESIS_CONFIGS["anchor_divisor"] == 0
+
 def split_script_into_chunks(script_text):
-    """스크립트 텍스트를 API 제한에 맞는 청크로 분할합니다."""
+    """스크립트 텍스트를 API 제한에 맞는 청크로 분할합니다.
+
+    청크 경계는 앞에서부터 바이트 수를 채우는 위치가 아니라 턴 내용으로 정해지는
+    앵커 턴 뒤에 둡니다. 대본 일부를 수정해도 다음 앵커부터는 경계가 그대로라서
+    바뀌지 않은 턴들은 같은 청크(같은 TTS 캐시 키)가 됩니다.
+    """
     print("스크립트를 청크 단위로 나누는 중...")
-    MAX_BYTES = 4500
+    MAX_BYTES = TTS_SYNTHESIS_CONFIGS["max_chunk_bytes"]
+    MIN_BYTES = TTS_SYNTHESIS_CONFIGS["min_chunk_bytes"]
     final_chunks = []
     current_chunk = ""
     dialogue_turns = script_text.strip().split('\n\n')
 
     for turn in tqdm(dialogue_turns):
-        if len((current_chunk + turn).encode('utf-8')) > MAX_BYTES:
-            if current_chunk:
-                final_chunks.append(current_chunk)
-            current_chunk = turn
-        else:
-            if current_chunk:
-                current_chunk += "\n\n" + turn
-            else:
-                current_chunk = turn
+        if current_chunk and len((current_chunk + "\n\n" + turn).encode('utf-8')) > MAX_BYTES:
+            final_chunks.append(current_chunk)
+            current_chunk = ""
+        current_chunk = current_chunk + "\n\n" + turn if current_chunk else turn
+
+        if len(current_chunk.encode('utf-8')) >= MIN_BYTES and _is_anchor_turn(turn):
+            final_chunks.append(current_chunk)
+            current_chunk = ""
     
     if current_chunk:
         final_chunks.append(current_chunk)
@@ -52,13 +68,51 @@ def split_script_into_chunks(script_text):
     print(f"총 {len(final_chunks)}개의 청크로 분할되었습니다.")
     return final_chunks
 
-def write_wave_file(filename, pcm, channels=1, rate=24000, sample_width=2):
-   """오디오 데이터를 .wav 파일로 저장합니다."""
-   with wave.open(filename, "wb") as wf:
-      wf.setnchannels(channels)
-      wf.setsampwidth(sample_width)
-      wf.setframerate(rate)
-      wf.writeframes(pcm)
+def build_tts_prompt(chunk):
+    """청크 하나를 TTS 요청 프롬프트로 만듭니다."""
+    return f"""TTS the following conversation between Joe and Jane:
+                {chunk}"""
+
+def build_speech_config():
+    """TTS_SYNTHESIS_CONFIGS의 화자별 음성으로 멀티 스피커 합성 설정을 만듭니다."""
+    return types.GenerateContentConfig(
+        response_modalities=["AUDIO"],
+        speech_config=types.SpeechConfig(
+            multi_speaker_voice_config=types.MultiSpeakerVoiceConfig(
+                speaker_voice_configs=[
+                    types.SpeakerVoiceConfig(
+                        speaker=speaker,
+                        voice_config=types.VoiceConfig(
+                            prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name=voice_name)
+                        )
+                    )
+                    for speaker, voice_name in TTS_SYNTHESIS_CONFIGS["speakers"].items()
+                ]
+            )
+        )
+    )
+
+async def synthesize_to_file(pipeline, chunks, output_filename):
+    """청크를 합성하는 대로 WAV에 이어 쓰고, 끝나면 정규화/인코딩 후처리를 수행합니다."""
+    sink = AudioSink(output_filename)
+    try:
+        await pipeline.stream(
+            [build_tts_prompt(chunk) for chunk in chunks],
+            lambda index, audio: sink.write_segment(audio)
+        )
+    except BaseException:
+        sink.abort()
+        raise
+    stats = sink.close()
+    # 정규화와 인코딩은 파일 전체를 블록 단위로 다시 읽으므로 스레드에서 실행
+    stats.update(await asyncio.to_thread(finalize_audio, output_filename, stats))
+    return stats
+
+def create_tts_cache():
+    """설정에 따라 TTS 청크 캐시를 생성합니다. 비활성화/우회 시 None을 반환합니다."""
+    if not TTS_CACHE_CONFIGS["enabled"] or is_tts_cache_bypassed():
+        return None
+    return TTSChunkCache()
 
 def main():
     """메인 실행 함수"""
@@ -84,55 +138,19 @@ def main():
     # --- 4. 스크립트 분할 ---
     final_chunks = split_script_into_chunks(script)
     
-    # --- 5. 오디오 생성 ---
-    audio_segments = []
+    # --- 5. 오디오 생성 (청크 동시 합성, 원래 순서로 WAV에 스트리밍 저장) ---
     client = genai.Client(api_key=API_KEY)
+    pipeline = TTSPipeline(client, speech_config=build_speech_config(), cache=create_tts_cache())
+    output_filename = 'combined_output.wav'
     
     print("오디오 생성을 시작합니다...")
-    for chunk in tqdm(final_chunks):
-        prompt = f"""TTS the following conversation between Joe and Jane:
-                {chunk}"""
-        try:
-            response = client.models.generate_content(
-              model="gemini-2.5-flash-preview-tts",
-              contents=prompt,
-              config=types.GenerateContentConfig(
-                  response_modalities=["AUDIO"],
-                  speech_config=types.SpeechConfig(
-                    multi_speaker_voice_config=types.MultiSpeakerVoiceConfig(
-                        speaker_voice_configs=[
-                          types.SpeakerVoiceConfig(
-                              speaker='Joe',
-                              voice_config=types.VoiceConfig(
-                                prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name='Kore')
-                              )
-                          ),
-                          types.SpeakerVoiceConfig(
-                              speaker='Jane',
-                              voice_config=types.VoiceConfig(
-                                prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name='Puck')
-                              )
-                          ),
-                        ]
-                    )
-                  )
-              )
-            )
-            data = response.candidates[0].content.parts[0].inline_data.data
-            audio_segments.append(data)
-        except Exception as e:
-            print(f"청크 처리 중 오류 발생: {e}")
-            continue
-
-    # --- 6. 오디오 병합 및 저장 ---
-    if audio_segments:
-        print("\n모든 오디오 조각을 합치는 중...")
-        combined_audio_data = b''.join(audio_segments)
-        output_filename = 'combined_output.wav'
-        write_wave_file(output_filename, combined_audio_data)
-        print(f"성공적으로 '{output_filename}' 파일로 저장되었습니다.")
-    else:
-        print("생성된 오디오가 없어 파일을 저장하지 않았습니다.")
+    try:
+        stats = asyncio.run(synthesize_to_file(pipeline, final_chunks, output_filename))
+        print(f"성공적으로 '{output_filename}' 파일로 저장되었습니다. ({stats['duration_seconds']}초)")
+        for audio_format, encoded_file in stats["encoded_files"].items():
+            print(f"{audio_format} 파일: {encoded_file}")
+    except Exception as e:
+        print(f"오디오 생성 중 오류가 발생해 파일을 저장하지 않았습니다: {e}")
 
 class TTSAgent(BaseAgent):
     """팟캐스트 오디오 생성 에이전트"""
@@ -146,7 +164,7 @@ class TTSAgent(BaseAgent):
         self.output_keys = ["audio_file", "audio_metadata"]
         self.api_key = api_key
     
-    async def process(self, state: WorkflowState) -> WorkflowState:
+    async def process(self, state: WorkflowState) -> Dict[str, Any]:
         """팟캐스트 대본을 오디오로 변환합니다."""
         self.log_execution("팟캐스트 오디오 생성 시작")
         
@@ -173,70 +191,33 @@ class TTSAgent(BaseAgent):
             # 스크립트 분할
             final_chunks = split_script_into_chunks(podcast_script)
             
-            # 오디오 생성
-            audio_segments = []
+            # 오디오 생성 (청크 동시 합성 + 청크별 재시도, 끝난 순서가 아닌 대본 순서로 WAV에 스트리밍 저장)
             client = genai.Client(api_key=self.api_key)
+            pipeline = TTSPipeline(client, speech_config=build_speech_config(), cache=create_tts_cache())
+            output_filename = f"AgentCast/output/tts/podcast_audio_{datetime.now().strftime('%Y%m%d_%H%M%S')}.wav"
+            audio_stats = await synthesize_to_file(pipeline, final_chunks, output_filename)
             
-            for chunk in tqdm(final_chunks, desc="오디오 생성 중"):
-                prompt = f"""TTS the following conversation between Joe and Jane:
-                        {chunk}"""
-                try:
-                    response = client.models.generate_content(
-                      model="gemini-2.5-flash-preview-tts",
-                      contents=prompt,
-                      config=types.GenerateContentConfig(
-                          response_modalities=["AUDIO"],
-                          speech_config=types.SpeechConfig(
-                            multi_speaker_voice_config=types.MultiSpeakerVoiceConfig(
-                                speaker_voice_configs=[
-                                  types.SpeakerVoiceConfig(
-                                      speaker='Joe',
-                                      voice_config=types.VoiceConfig(
-                                        prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name='Kore')
-                                      )
-                                  ),
-                                  types.SpeakerVoiceConfig(
-                                      speaker='Jane',
-                                      voice_config=types.VoiceConfig(
-                                        prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name='Puck')
-                                      )
-                                  ),
-                                ]
-                            )
-                          )
-                      )
-                    )
-                    data = response.candidates[0].content.parts[0].inline_data.data
-                    audio_segments.append(data)
-                except Exception as e:
-                    self.log_execution(f"청크 처리 중 오류 발생: {e}", "WARNING")
-                    continue
-            
-            # 오디오 병합 및 저장
-            if audio_segments:
-                combined_audio_data = b''.join(audio_segments)
-                output_filename = f"AgentCast/output/tts/podcast_audio_{datetime.now().strftime('%Y%m%d_%H%M%S')}.wav"
-                write_wave_file(output_filename, combined_audio_data)
-                
-                # 워크플로우 상태 업데이트
-                new_state = WorkflowState(
-                    **{k: v for k, v in state.__dict__.items()},
-                    audio_file=output_filename,
-                    audio_metadata={
-                        "chunks_processed": len(final_chunks),
-                        "audio_segments": len(audio_segments),
-                        "output_file": output_filename
-                    }
-                )
-                
-                # 워크플로우 상태 업데이트
-                new_state = self.update_workflow_status(new_state, "tts_completed")
-                
-                self.log_execution(f"팟캐스트 오디오 생성 완료: {output_filename}")
-                return new_state
-            else:
+            if not audio_stats["frames"]:
                 raise ValueError("생성된 오디오가 없습니다.")
             
+            # 워크플로우 상태 업데이트 (변경된 필드만 반환)
+            self.log_execution(f"팟캐스트 오디오 생성 완료: {output_filename}")
+            return self.build_update(
+                "tts_completed",
+                audio_file=output_filename,
+                audio_metadata={
+                    "chunks_processed": len(final_chunks),
+                    "audio_segments": audio_stats["segments"],
+                    "synthesis_retries": pipeline.stats["retries"],
+                    "cache_hits": pipeline.stats["cache_hits"],
+                    "max_concurrency": pipeline.max_concurrency,
+                    "duration_seconds": audio_stats["duration_seconds"],
+                    "normalization_gain_db": audio_stats["gain_db"],
+                    "encoded_files": audio_stats["encoded_files"],
+                    "output_file": output_filename
+                }
+            )
+            
         except Exception as e:
             self.log_execution(f"팟캐스트 오디오 생성 중 오류 발생: {str(e)}", "ERROR")
             raise
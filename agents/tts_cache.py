@@ -0,0 +1,107 @@
+"""Content-hash file cache for synthesized TTS chunks."""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    from constants.configuration import TTS_CACHE_CONFIGS
+except ImportError:
+    from ..constants.configuration import TTS_CACHE_CONFIGS
+
+
+class TTSChunkCache:
+    """청크 텍스트, 모델, 화자/음성 설정을 해시한 키로 합성된 PCM을 파일에 저장하는 캐시.
+
+    대본 일부만 수정해 다시 렌더링하면 바뀌지 않은 청크는 같은 키가 되어
+    API를 호출하지 않습니다. 파일 mtime을 마지막 사용 시각으로 사용하고,
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은 청크부터 제거합니다(LRU).
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.cache_dir = Path(cache_dir or TTS_CACHE_CONFIGS["cache_dir"])
+        self.max_bytes = max_bytes or TTS_CACHE_CONFIGS["max_bytes"]
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._total_bytes = sum(path.stat().st_size for path in self._entries())
+
+    @staticmethod
+    def make_key(text: str, model: str, voices: Dict[str, Any]) -> str:
+        """청크 텍스트와 합성 설정으로부터 캐시 키를 생성합니다."""
+        payload = {"text": text, "model": model, "voices": voices}
+        encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pcm"
+
+    def _entries(self):
+        return self.cache_dir.glob("*/*.pcm")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """캐시된 PCM을 반환합니다. 없으면 None을 반환합니다."""
+        path = self._path(key)
+        with self._lock:
+            try:
+                audio = path.read_bytes()
+            except FileNotFoundError:
+                self.misses += 1
+                return None
+            # 최근 사용으로 갱신 (LRU 기준)
+            os.utime(path)
+            self.hits += 1
+            return audio
+
+    def set(self, key: str, audio: bytes) -> None:
+        """PCM을 저장하고 전체 크기가 한도를 넘으면 LRU 청크를 제거합니다."""
+        path = self._path(key)
+        with self._lock:
+            previous_size = path.stat().st_size if path.exists() else 0
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(audio)
+            os.replace(tmp_path, path)
+            self._total_bytes += len(audio) - previous_size
+            self._evict()
+
+    def _evict(self) -> None:
+        """전체 크기가 한도를 넘으면 mtime이 오래된 청크부터 제거합니다."""
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        entries = sorted(
+            ((path.stat(), path) for path in self._entries()),
+            key=lambda entry: entry[0].st_mtime
+        )
+        for stat, path in entries:
+            size = stat.st_size
+            if self._total_bytes <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._total_bytes -= size
+            self.evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 적중/미스 통계를 반환합니다."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "total_bytes": self._total_bytes,
+            "cache_dir": str(self.cache_dir)
+        }
+
+
+def is_tts_cache_bypassed() -> bool:
+    """환경변수로 TTS 캐시 우회가 설정되었는지 확인합니다."""
+    return os.getenv(TTS_CACHE_CONFIGS["bypass_env"], "") == "1"
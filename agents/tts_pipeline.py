@@ -0,0 +1,156 @@
+"""Concurrent TTS synthesis of script chunks with ordered reassembly."""
+
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from tqdm import tqdm
+
+try:
+    from constants.configuration import TTS_SYNTHESIS_CONFIGS
+    from instrumentation import record_llm_response, record_retry
+except ImportError:
+    from ..constants.configuration import TTS_SYNTHESIS_CONFIGS
+    from ..instrumentation import record_llm_response, record_retry
+
+
+@dataclass
+class ChunkAudio:
+    """청크 하나의 합성 결과를 나타내는 데이터 클래스."""
+    index: int
+    audio: bytes
+    attempts: int
+
+
+class TTSSynthesisError(RuntimeError):
+    """재시도 후에도 합성하지 못한 청크가 있을 때 발생하는 예외.
+
+    일부 청크를 빼고 이어 붙이면 오디오 중간에 대사가 빠지므로
+    실패한 청크가 하나라도 있으면 전체 합성을 실패로 처리합니다.
+    """
+
+    def __init__(self, failed: Dict[int, BaseException]):
+        self.failed = failed
+        details = ", ".join(f"#{index}: {error}" for index, error in sorted(failed.items()))
+        super().__init__(f"{len(failed)}개 청크 합성 실패 ({details})")
+
+
+class TTSPipeline:
+    """대본 청크를 제한된 동시성으로 합성하고 원래 순서대로 합치는 파이프라인.
+
+    client는 google-genai 클라이언트처럼 client.models.generate_content(model=, contents=, config=)
+    를 제공하면 되며, 블로킹 호출은 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+    cache(TTSChunkCache)를 지정하면 같은 청크/모델/음성 설정의 오디오는 API 호출 없이 재사용합니다.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        speech_config: Any = None,
+        model: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_base_delay: Optional[float] = None,
+        cache: Optional[Any] = None,
+        voices: Optional[Dict[str, str]] = None
+    ):
+        self.client = client
+        self.speech_config = speech_config
+        self.model = model or TTS_SYNTHESIS_CONFIGS["model"]
+        self.max_concurrency = max_concurrency or TTS_SYNTHESIS_CONFIGS["max_concurrency"]
+        self.max_retries = TTS_SYNTHESIS_CONFIGS["max_retries"] if max_retries is None else max_retries
+        self.retry_base_delay = (
+            TTS_SYNTHESIS_CONFIGS["retry_base_delay"] if retry_base_delay is None else retry_base_delay
+        )
+        self.cache = cache
+        self.voices = voices or TTS_SYNTHESIS_CONFIGS["speakers"]
+        self.stats = {"chunks": 0, "retries": 0, "failed": 0, "cache_hits": 0}
+
+    def _synthesize_sync(self, prompt: str) -> bytes:
+        """청크 하나를 합성해 PCM 데이터를 반환합니다. (블로킹)"""
+        response = self.client.models.generate_content(
+            model=self.model,
+            contents=prompt,
+            config=self.speech_config
+        )
+        record_llm_response(self.model, response)
+        data = response.candidates[0].content.parts[0].inline_data.data
+        if not data:
+            raise ValueError("응답에 오디오 데이터가 없습니다.")
+        return data
+
+    async def _synthesize_chunk(self, index: int, prompt: str, semaphore: asyncio.Semaphore) -> ChunkAudio:
+        """청크 하나를 합성하고, 실패하면 지수 백오프로 재시도합니다."""
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(prompt, self.model, self.voices)
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                self.stats["cache_hits"] += 1
+                return ChunkAudio(index=index, audio=cached, attempts=0)
+
+        async with semaphore:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    audio = await asyncio.to_thread(self._synthesize_sync, prompt)
+                    if cache_key is not None:
+                        await asyncio.to_thread(self.cache.set, cache_key, audio)
+                    return ChunkAudio(index=index, audio=audio, attempts=attempt + 1)
+                except Exception as e:
+                    if attempt >= self.max_retries:
+                        raise
+                    self.stats["retries"] += 1
+                    record_retry("tts")
+                    delay = self.retry_base_delay * (2 ** attempt) + random.uniform(0, self.retry_base_delay)
+                    print(f"⚠️ 청크 #{index} 합성 실패, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries}): {e}")
+                    await asyncio.sleep(delay)
+
+    async def stream(
+        self,
+        prompts: List[str],
+        on_segment: Callable[[int, bytes], None],
+        desc: str = "오디오 생성 중"
+    ) -> None:
+        """청크를 동시에 합성하면서, 앞 청크가 모두 끝난 구간부터 순서대로 on_segment에 넘깁니다.
+
+        순서보다 먼저 끝난 청크만 잠시 보관하므로, 넘긴 청크의 오디오는 메모리에 남지 않습니다.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.stats["chunks"] = len(prompts)
+
+        pending: Dict[int, bytes] = {}
+        next_index = 0
+
+        async def synthesize_and_emit(index: int, prompt: str) -> None:
+            nonlocal next_index
+            chunk = await self._synthesize_chunk(index, prompt, semaphore)
+            pending[chunk.index] = chunk.audio
+            while next_index in pending:
+                on_segment(next_index, pending.pop(next_index))
+                next_index += 1
+
+        tasks = [
+            asyncio.create_task(synthesize_and_emit(index, prompt))
+            for index, prompt in enumerate(prompts)
+        ]
+
+        # 완료되는 순서대로 진행률을 갱신하고, 결과는 청크 번호 순서로 내보냄
+        with tqdm(total=len(tasks), desc=desc) as progress:
+            for task in tasks:
+                task.add_done_callback(lambda _: progress.update(1))
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        failed = {
+            index: result for index, result in enumerate(results)
+            if isinstance(result, BaseException)
+        }
+        self.stats["failed"] = len(failed)
+        if failed:
+            raise TTSSynthesisError(failed)
+
+    async def synthesize(self, prompts: List[str], desc: str = "오디오 생성 중") -> List[bytes]:
+        """모든 청크를 합성해 입력 순서대로 PCM 데이터 목록을 반환합니다."""
+        segments: List[bytes] = []
+        await self.stream(prompts, lambda index, audio: segments.append(audio), desc=desc)
+        return segments
@@ -0,0 +1,177 @@
+"""Local IVF-Flat vector index with cosine similarity search."""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """각 행을 L2 정규화합니다. (0 벡터는 그대로 유지)"""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32, copy=False)
+
+
+class IVFFlatIndex:
+    """역파일(IVF) 구조의 코사인 유사도 ANN 인덱스.
+
+    정규화된 벡터를 구면 k-means로 nlist개 클러스터에 나누고, 검색 시에는
+    쿼리와 가까운 nprobe개 클러스터의 벡터만 정확히 비교합니다.
+    벡터 행렬 자체는 복사하지 않고 (memmap 포함) 원본 배열을 참조합니다.
+    """
+
+    def __init__(self, nlist: Optional[int] = None, nprobe: int = 8, kmeans_iterations: int = 10, seed: int = 42):
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.kmeans_iterations = kmeans_iterations
+        self.seed = seed
+
+        self.vectors: Optional[np.ndarray] = None
+        self.centroids: Optional[np.ndarray] = None
+        self.assignments: Optional[np.ndarray] = None
+        self.inverted_lists: List[np.ndarray] = []
+        self.build_time = 0.0
+
+    @property
+    def size(self) -> int:
+        """인덱스에 포함된 벡터 수."""
+        return 0 if self.vectors is None else int(self.vectors.shape[0])
+
+    def build(self, vectors: np.ndarray) -> "IVFFlatIndex":
+        """벡터 행렬로 인덱스를 구축합니다. 벡터는 정규화되어 있어야 합니다."""
+        start_time = time.perf_counter()
+        self.vectors = vectors
+        count = vectors.shape[0]
+
+        if count == 0:
+            self.centroids = np.zeros((0, vectors.shape[1]), dtype=np.float32)
+            self.assignments = np.zeros(0, dtype=np.int32)
+            self.inverted_lists = []
+            self.build_time = time.perf_counter() - start_time
+            return self
+
+        nlist = self.nlist or max(1, int(np.sqrt(count)))
+        nlist = min(nlist, count)
+
+        rng = np.random.default_rng(self.seed)
+        centroids = np.array(vectors[rng.choice(count, size=nlist, replace=False)], dtype=np.float32)
+
+        for _ in range(self.kmeans_iterations):
+            sums, counts = self._accumulate(centroids)
+            non_empty = counts > 0
+            centroids[non_empty] = sums[non_empty] / counts[non_empty, None]
+            centroids = normalize_rows(centroids)
+
+        self.centroids = centroids
+        self.assignments = self._assign(centroids)
+        self.inverted_lists = [
+            np.flatnonzero(self.assignments == cluster_id).astype(np.int64)
+            for cluster_id in range(nlist)
+        ]
+        self.build_time = time.perf_counter() - start_time
+        return self
+
+    def _accumulate(self, centroids: np.ndarray, batch_size: int = 4096) -> Tuple[np.ndarray, np.ndarray]:
+        """한 번의 순회로 클러스터별 벡터 합과 개수를 계산합니다."""
+        sums = np.zeros_like(centroids)
+        counts = np.zeros(centroids.shape[0], dtype=np.int64)
+        for start in range(0, self.vectors.shape[0], batch_size):
+            block = np.asarray(self.vectors[start:start + batch_size], dtype=np.float32)
+            labels = np.argmax(block @ centroids.T, axis=1)
+            np.add.at(sums, labels, block)
+            counts += np.bincount(labels, minlength=centroids.shape[0])
+        return sums, counts
+
+    def _assign(self, centroids: np.ndarray, batch_size: int = 4096) -> np.ndarray:
+        """각 벡터를 가장 가까운 중심에 배정합니다. (배치 단위로 메모리 제한)"""
+        assignments = np.empty(self.vectors.shape[0], dtype=np.int32)
+        for start in range(0, self.vectors.shape[0], batch_size):
+            block = np.asarray(self.vectors[start:start + batch_size], dtype=np.float32)
+            assignments[start:start + batch_size] = np.argmax(block @ centroids.T, axis=1)
+        return assignments
+
+    def search(self, query: np.ndarray, top_k: int = 5, nprobe: Optional[int] = None) -> List[Tuple[int, float]]:
+        """코사인 유사도가 높은 상위 k개의 (행 번호, 점수)를 반환합니다."""
+        if self.size == 0:
+            return []
+
+        query = normalize_rows(np.asarray(query, dtype=np.float32).reshape(1, -1))[0]
+        nprobe = min(nprobe or self.nprobe, len(self.inverted_lists))
+
+        centroid_scores = self.centroids @ query
+        probe_ids = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+        candidates = np.concatenate([self.inverted_lists[i] for i in probe_ids])
+        if candidates.size == 0:
+            return []
+
+        scores = np.asarray(self.vectors[candidates], dtype=np.float32) @ query
+        k = min(top_k, candidates.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(candidates[i]), float(scores[i])) for i in top]
+
+    def nbytes(self) -> int:
+        """인덱스 구조(중심 + 역리스트)와 벡터 행렬의 크기(바이트)."""
+        index_bytes = 0 if self.centroids is None else self.centroids.nbytes
+        index_bytes += sum(ids.nbytes for ids in self.inverted_lists)
+        vector_bytes = 0 if self.vectors is None else self.vectors.nbytes
+        return int(index_bytes + vector_bytes)
+
+    def save(self, index_dir: str) -> Dict[str, str]:
+        """중심과 배정 결과를 디스크에 저장합니다."""
+        path = Path(index_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        np.save(path / "centroids.npy", self.centroids)
+        np.save(path / "assignments.npy", self.assignments)
+        with open(path / "index.json", "w", encoding="utf-8") as f:
+            json.dump({
+                "nlist": len(self.inverted_lists),
+                "nprobe": self.nprobe,
+                "size": self.size,
+                "build_time": self.build_time
+            }, f, indent=2)
+        return {
+            "centroids": str(path / "centroids.npy"),
+            "assignments": str(path / "assignments.npy")
+        }
+
+    @classmethod
+    def load(cls, index_dir: str, vectors: np.ndarray) -> "IVFFlatIndex":
+        """저장된 인덱스를 벡터 행렬과 함께 불러옵니다."""
+        path = Path(index_dir)
+        with open(path / "index.json", "r", encoding="utf-8") as f:
+            info = json.load(f)
+
+        index = cls(nlist=info["nlist"], nprobe=info["nprobe"])
+        index.vectors = vectors
+        index.centroids = np.load(path / "centroids.npy")
+        index.assignments = np.load(path / "assignments.npy")
+        index.inverted_lists = [
+            np.flatnonzero(index.assignments == cluster_id).astype(np.int64)
+            for cluster_id in range(info["nlist"])
+        ]
+        index.build_time = info.get("build_time", 0.0)
+        return index
+
+    def measure_latency(self, queries: np.ndarray, top_k: int = 5) -> Dict[str, Any]:
+        """쿼리 벡터로 실제 검색 지연 시간을 측정합니다."""
+        if self.size == 0 or len(queries) == 0:
+            return {"queries": 0, "p50_ms": 0.0, "p95_ms": 0.0, "qps": 0.0}
+
+        latencies = []
+        for query in queries:
+            start_time = time.perf_counter()
+            self.search(query, top_k=top_k)
+            latencies.append((time.perf_counter() - start_time) * 1000)
+
+        latencies = np.array(latencies)
+        total_seconds = latencies.sum() / 1000
+        return {
+            "queries": int(len(latencies)),
+            "p50_ms": float(np.percentile(latencies, 50)),
+            "p95_ms": float(np.percentile(latencies, 95)),
+            "qps": float(len(latencies) / total_seconds) if total_seconds > 0 else 0.0
+        }
@@ -0,0 +1,102 @@
+"""Content-addressed store for large workflow payloads.
+
+Crawled documents, summaries and generated reports are written here once and
+the workflow state only carries their IDs (``WorkflowState.artifacts``), so a
+state hop and a checkpoint write no longer copy the payload itself.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from .constants.configuration import WORKFLOW_CONFIGS
+except ImportError:
+    from constants.configuration import WORKFLOW_CONFIGS
+
+
+class ArtifactStore:
+    """JSON 직렬화 가능한 데이터를 내용 해시(SHA-256)를 ID로 저장하는 클래스.
+
+    같은 내용은 같은 ID가 되므로 다시 저장해도 파일을 새로 쓰지 않고,
+    최근에 읽은 아티팩트는 메모리에 캐시합니다.
+    """
+
+    def __init__(self, root_dir: Optional[str] = None, cache_size: int = 32):
+        self.root_dir = Path(root_dir or WORKFLOW_CONFIGS["artifact_dir"])
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, artifact_id: str) -> Path:
+        return self.root_dir / artifact_id[:2] / f"{artifact_id}.json"
+
+    def _remember(self, artifact_id: str, payload: Any) -> None:
+        with self._lock:
+            self._cache[artifact_id] = payload
+            self._cache.move_to_end(artifact_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def put(self, payload: Any) -> str:
+        """데이터를 저장하고 아티팩트 ID를 반환합니다."""
+        data = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+        artifact_id = hashlib.sha256(data).hexdigest()
+
+        path = self._path(artifact_id)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 다른 프로세스가 읽는 도중 반쯤 쓰인 파일이 보이지 않도록 임시 파일에 쓴 뒤 교체
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+
+        self._remember(artifact_id, payload)
+        return artifact_id
+
+    def get(self, artifact_id: str) -> Any:
+        """아티팩트 ID로 데이터를 읽습니다."""
+        with self._lock:
+            if artifact_id in self._cache:
+                self._cache.move_to_end(artifact_id)
+                return self._cache[artifact_id]
+
+        path = self._path(artifact_id)
+        if not path.exists():
+            raise KeyError(f"아티팩트를 찾을 수 없습니다: {artifact_id}")
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        self._remember(artifact_id, payload)
+        return payload
+
+
+_store: Optional[ArtifactStore] = None
+
+
+def get_artifact_store() -> ArtifactStore:
+    """프로세스 전역 아티팩트 저장소를 반환합니다."""
+    global _store
+    if _store is None:
+        _store = ArtifactStore()
+    return _store
+
+
+def put_artifact(payload: Any) -> str:
+    """데이터를 전역 아티팩트 저장소에 저장하고 ID를 반환합니다."""
+    return get_artifact_store().put(payload)
+
+
+def load_artifact(state: Any, name: str, default: Any = None) -> Any:
+    """상태에서 이름에 해당하는 데이터를 읽습니다.
+
+    state.artifacts에 참조가 있으면 저장소에서 읽고, 없으면 같은 이름의
+    상태 필드 값을 그대로 사용합니다. (에이전트를 직접 실행하는 경우 호환)
+    """
+    artifact_id = (getattr(state, "artifacts", None) or {}).get(name)
+    if artifact_id:
+        return get_artifact_store().get(artifact_id)
+    value = getattr(state, name, None)
+    return default if value is None else value
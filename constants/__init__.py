@@ -20,7 +20,11 @@ from .mcp import (
     MCP_HEALTH_CHECK,
     MCP_LOGGING,
     MCP_SECURITY,
-    MCP_PERFORMANCE
+    MCP_PERFORMANCE,
+    SLACK_RATE_LIMITS,
+    GMAIL_BATCH_CONFIGS,
+    NOTION_RATE_LIMITS,
+    NOTION_SYNC_CONFIGS
 )
 
 from .workflow import (
@@ -28,6 +32,7 @@ from .workflow import (
     WORKFLOW_STEPS,
     WORKFLOW_STEP_DESCRIPTIONS,
     WORKFLOW_STEP_ORDER,
+    WORKFLOW_STEP_AGENTS,
     WORKFLOW_STEP_TIMEOUTS,
     WORKFLOW_STEP_RETRIES,
     WORKFLOW_EXECUTION_MODES,
@@ -48,7 +53,8 @@ from .ai_models import (
     VECTOR_DB_CONFIGS,
     WEB_CRAWLING_TOOLS,
     WEB_CRAWLING_CONFIGS,
-    QUALITY_WEIGHTS
+    QUALITY_WEIGHTS,
+    LLM_PRICING
 )
 
 from .prompts import (
@@ -69,12 +75,18 @@ from .configuration import (
     TTS_PROVIDERS,
     WEB_CRAWLING_CONFIGS,
     CHUNKING_CONFIGS,
+    CHUNKING_PROFILE_BY_SOURCE,
     QUALITY_THRESHOLDS,
     QUALITY_WEIGHTS,
     LOGGING_CONFIGS,
     WORKFLOW_CONFIGS,
     MCP_SERVER_DEFAULTS,
-    WEB_CRAWLING_TOOL_CONFIGS
+    WEB_CRAWLING_TOOL_CONFIGS,
+    LLM_CACHE_CONFIGS,
+    DEDUP_CONFIGS,
+    TTS_SYNTHESIS_CONFIGS,
+    TTS_CACHE_CONFIGS,
+    AUDIO_POSTPROCESS_CONFIGS
 )
 
 __all__ = [
@@ -98,12 +110,17 @@ __all__ = [
     "MCP_LOGGING",
     "MCP_SECURITY",
     "MCP_PERFORMANCE",
+    "SLACK_RATE_LIMITS",
+    "GMAIL_BATCH_CONFIGS",
+    "NOTION_RATE_LIMITS",
+    "NOTION_SYNC_CONFIGS",
     
     # Workflow
     "WORKFLOW_STATUS",
     "WORKFLOW_STEPS",
     "WORKFLOW_STEP_DESCRIPTIONS",
     "WORKFLOW_STEP_ORDER",
+    "WORKFLOW_STEP_AGENTS",
     "WORKFLOW_STEP_TIMEOUTS",
     "WORKFLOW_STEP_RETRIES",
     "WORKFLOW_EXECUTION_MODES",
@@ -124,6 +141,7 @@ __all__ = [
     "WEB_CRAWLING_TOOLS",
     "WEB_CRAWLING_CONFIGS",
     "QUALITY_WEIGHTS",
+    "LLM_PRICING",
     
     # Prompts
     "PERSONALIZE_SYSTEM_PROMPT",
@@ -142,10 +160,16 @@ __all__ = [
     "TTS_PROVIDERS",
     "WEB_CRAWLING_CONFIGS",
     "CHUNKING_CONFIGS",
+    "CHUNKING_PROFILE_BY_SOURCE",
     "QUALITY_THRESHOLDS",
     "QUALITY_WEIGHTS",
     "LOGGING_CONFIGS",
     "WORKFLOW_CONFIGS",
     "MCP_SERVER_DEFAULTS",
-    "WEB_CRAWLING_TOOL_CONFIGS"
+    "WEB_CRAWLING_TOOL_CONFIGS",
+    "LLM_CACHE_CONFIGS",
+    "DEDUP_CONFIGS",
+    "TTS_SYNTHESIS_CONFIGS",
+    "TTS_CACHE_CONFIGS",
+    "AUDIO_POSTPROCESS_CONFIGS"
 ]
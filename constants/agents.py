@@ -6,6 +6,7 @@ AGENT_NAMES = {
     "PERSONALIZE": "personalize",
     "QUERY_WRITER": "query_writer",
     "SEARCHER": "searcher",
+    "QUERY_SEARCHER": "query_searcher",
     "DB_CONSTRUCTOR": "db_constructor",
     "RESEARCHER": "researcher",
     "CRITIC": "critic",
@@ -23,9 +24,10 @@ KG_SEARCH_AGENT_NAME = "kg_search"
 AGENT_EXECUTION_ORDER = [
     "orchestrator",
     "personalize",
-    "searcher",
-    "knowledge_graph",  # 실시간 지식 그래프화
+    "searcher",         # 쿼리가 필요 없는 크롤링 소스 (personalize와 병렬 실행)
     "query_writer",
+    "query_searcher",   # 생성된 쿼리로 검색하고 크롤링 결과와 합침
+    "knowledge_graph",  # 실시간 지식 그래프화
     "kg_search",        # 지식 그래프 검색
     "db_constructor",
     "researcher",
@@ -35,18 +37,20 @@ AGENT_EXECUTION_ORDER = [
 ]
 
 # 에이전트별 타임아웃 (초)
+# BaseAgent가 asyncio.wait_for로 강제 적용하므로 정상적인 최악의 경우(긴 대본, 많은 문서)도 끝날 수 있는 값을 사용
 AGENT_TIMEOUTS = {
     "orchestrator": 30,
-    "personalize": 120,  # MCP 통합으로 인해 더 긴 시간
-    "query_writer": 60,
-    "searcher": 180,  # 웹 크롤링으로 인해 더 긴 시간
-    "knowledge_graph": 240,  # HippoRAG 처리로 인해 더 긴 시간
-    "kg_search": 120,  # 지식 그래프 검색
-    "db_constructor": 300,  # 벡터 DB 구축으로 인해 더 긴 시간
-    "researcher": 120,
-    "critic": 60,
-    "script_writer": 90,
-    "tts": 180  # 음성 생성으로 인해 더 긴 시간
+    "personalize": 300,  # Slack/Notion/Gmail 페이지네이션 수집
+    "query_writer": 120,
+    "searcher": 180,  # 소스별 deadline(최대 120초) + 중복 제거/저장 여유 (수집 예산은 이 값에서 계산)
+    "query_searcher": 120,  # Perplexity 검색 및 인용 페이지 수집
+    "knowledge_graph": 1800,  # 수집 문서 전체의 HippoRAG 인덱싱 (OpenIE LLM 호출)
+    "kg_search": 600,  # 생성된 쿼리별 지식 그래프 검색
+    "db_constructor": 1200,  # 모든 청크 임베딩 (요청 한도 초과 시 재시도 포함)
+    "researcher": 600,
+    "critic": 180,
+    "script_writer": 600,  # 긴 팟캐스트 대본 생성
+    "tts": 3600  # 대본 전체 음성 합성 (청크별 재시도 포함)
 }
 
 # 에이전트별 재시도 횟수
@@ -55,6 +59,7 @@ AGENT_RETRY_ATTEMPTS = {
     "personalize": 3,  # MCP 연결 실패 시 재시도
     "query_writer": 2,
     "searcher": 3,  # 네트워크 오류 시 재시도
+    "query_searcher": 2,  # 네트워크 오류 시 재시도
     "knowledge_graph": 2,  # HippoRAG 처리 실패 시 재시도
     "kg_search": 2,  # 검색 실패 시 재시도
     "db_constructor": 2,
@@ -68,15 +73,16 @@ AGENT_RETRY_ATTEMPTS = {
 AGENT_PRIORITIES = {
     "orchestrator": 1,
     "personalize": 2,
-    "searcher": 2,
-    "knowledge_graph": 3,  # 크롤링 후 즉시 처리
-    "query_writer": 4,
-    "kg_search": 5,  # 쿼리 생성 후 검색
-    "db_constructor": 6,
-    "researcher": 7,
-    "critic": 8,
-    "script_writer": 9,
-    "tts": 10
+    "searcher": 2,  # 개인화와 병렬 실행
+    "query_writer": 3,
+    "query_searcher": 4,  # 생성된 쿼리로 검색
+    "knowledge_graph": 5,  # 검색 결과를 합친 후 즉시 처리
+    "kg_search": 6,  # 지식 그래프 구축 후 검색
+    "db_constructor": 7,
+    "researcher": 8,
+    "critic": 9,
+    "script_writer": 10,
+    "tts": 11
 }
 
 # 에이전트별 필수 입력
@@ -85,6 +91,7 @@ AGENT_REQUIRED_INPUTS = {
     "personalize": ["workflow_status"],
     "query_writer": ["current_progress", "personal_info", "research_context"],
     "searcher": ["workflow_status"],
+    "query_searcher": ["search_query", "primary_query"],
     "knowledge_graph": ["crawled_documents"],
     "kg_search": ["query_writer_output"],
     "db_constructor": ["data_chunks", "search_scope"],
@@ -100,6 +107,7 @@ AGENT_OUTPUT_KEYS = {
     "personalize": ["personal_info", "research_context", "current_progress"],
     "query_writer": ["rag_query", "search_scope", "research_priorities"],
     "searcher": ["crawled_data", "search_sources", "data_chunks"],
+    "query_searcher": ["search_results", "search_metadata"],
     "knowledge_graph": ["knowledge_graph", "document_store", "kg_metadata"],
     "kg_search": ["kg_search_results", "search_statistics", "enhanced_results"],
     "db_constructor": ["vector_db", "embedding_stats", "db_metadata"],
@@ -115,6 +123,7 @@ AGENT_DESCRIPTIONS = {
     "personalize": "Slack, Notion, Gmail에서 개인화된 정보를 수집하는 에이전트",
     "query_writer": "개인화된 정보를 바탕으로 RAG 검색 쿼리를 생성하는 에이전트",
     "searcher": "웹 크롤링을 통해 최신 AI 연구 정보를 수집하는 에이전트",
+    "query_searcher": "생성된 검색 쿼리로 최신 AI 연구 정보를 검색하는 에이전트",
     "knowledge_graph": "HippoRAG를 활용하여 실시간으로 지식 그래프를 구축하는 에이전트",
     "kg_search": "query_writer의 출력을 받아 지식 그래프에서 관련 정보를 검색하는 에이전트",
     "db_constructor": "수집된 정보를 벡터 데이터베이스로 구축하는 에이전트",
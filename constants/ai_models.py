@@ -56,6 +56,19 @@ VECTOR_DB_PROVIDERS = {
 
 # 벡터 DB 설정
 VECTOR_DB_CONFIGS = {
+    "local": {
+        "storage_dir": "output/vector_db",
+        "collection_name": "ai_research_data",
+        "embedding_model": "text-embedding-3-large",
+        "dimension": 3072,
+        "embedding_batch_size": 100,
+        "embedding_max_retries": 3,  # 429/5xx/연결 오류 시 배치별 재시도 횟수
+        "embedding_retry_delay": 1.0,  # 지수 백오프 기본 대기 시간(초, Retry-After가 있으면 그 값 사용)
+        "index_type": "IVF_FLAT",
+        "metric_type": "COSINE",
+        "nprobe": 8,
+        "latency_sample_queries": 50
+    },
     "milvus": {
         "host": "localhost",
         "port": 19530,
@@ -121,3 +134,20 @@ QUALITY_WEIGHTS = {
     "data_freshness": 0.15,
     "completeness": 0.1
 }
+
+# 모델별 토큰 단가 (USD / 1M 토큰, 비용 추정용 공개 정가)
+# 모델 이름이 정확히 일치하지 않으면 가장 긴 접두사가 일치하는 항목을 사용
+LLM_PRICING = {
+    "gpt-4o-mini": {"input": 0.15, "output": 0.60},
+    "gpt-4o": {"input": 2.50, "output": 10.00},
+    "gpt-4-turbo": {"input": 10.00, "output": 30.00},
+    "gpt-4": {"input": 30.00, "output": 60.00},
+    "gpt-3.5-turbo": {"input": 0.50, "output": 1.50},
+    "text-embedding-3-large": {"input": 0.13, "output": 0.0},
+    "text-embedding-3-small": {"input": 0.02, "output": 0.0},
+    "claude-sonnet-4": {"input": 3.00, "output": 15.00},
+    "claude-3-5-sonnet": {"input": 3.00, "output": 15.00},
+    "claude-3-opus": {"input": 15.00, "output": 75.00},
+    "claude-3-haiku": {"input": 0.25, "output": 1.25},
+    "gemini-2.5-flash-preview-tts": {"input": 0.50, "output": 10.00}
+}
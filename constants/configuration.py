@@ -28,7 +28,7 @@ TTS_PROVIDERS = {
     "AZURE": "azure"
 }
 
-# 청킹 설정
+# 청킹 설정 (크기 단위는 토큰, agents/chunker.py의 TokenChunker에서 사용)
 CHUNKING_CONFIGS = {
     "default": {
         "chunk_size": 1000,
@@ -53,6 +53,13 @@ CHUNKING_CONFIGS = {
     }
 }
 
+# 수집 출처별 청킹 프로필 (없는 출처는 default)
+CHUNKING_PROFILE_BY_SOURCE = {
+    "aitimes_kr": "news_articles",
+    "pytorch_kr": "news_articles",
+    "arxiv": "research_papers"
+}
+
 # 품질 임계값
 QUALITY_THRESHOLDS = {
     "minimum_quality_score": 0.7,
@@ -78,6 +85,10 @@ LOGGING_CONFIGS = {
 WORKFLOW_CONFIGS = {
     "max_execution_time": 3600,  # 1시간
     "checkpoint_interval": 300,  # 5분마다 체크포인트
+    "checkpoint_db_path": "output/checkpoints/workflow_checkpoints.db",  # 노드 실행마다 상태를 저장하는 SQLite 체크포인터
+    "trace_dir": "output/traces",  # 실행별 단계 트레이스(OTLP/JSON) 저장 위치
+    "rss_sample_interval": 0.1,  # 단계별 최대 RSS 측정 간격 (초)
+    "artifact_dir": "output/artifacts",  # 상태 밖에 보관하는 대용량 데이터(검색 결과, 요약, 리포트 등)
     "parallel_execution": True,
     "error_recovery": True,
     "progress_tracking": True
@@ -129,5 +140,134 @@ WEB_CRAWLING_TOOL_CONFIGS = {
             "DOWNLOAD_DELAY": 1,
             "COOKIES_ENABLED": False
         }
-    }
+    },
+    "browser_service": {
+        "max_tabs": 4,  # 동시에 빌려줄 수 있는 탭 수
+        "profile_dir": "output/cache/chrome_profile",  # 실행 간 HTTP 캐시/쿠키를 유지하는 프로필
+        "driver_path_cache": "output/cache/chromedriver_path.txt",  # 설치된 ChromeDriver 경로 캐시
+        "page_load_timeout": 30,
+        "poll_interval": 0.1,  # 탭 로딩 완료 확인 간격 (초)
+        # 텍스트 수집에 필요 없는 이미지/폰트/미디어와 분석 스크립트 요청 차단
+        "blocked_url_patterns": [
+            "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+            "*.woff", "*.woff2", "*.ttf", "*.otf",
+            "*.mp4", "*.webm", "*.mp3", "*.m3u8",
+            "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+            "*facebook.net*", "*hotjar.com*", "*clarity.ms*"
+        ]
+    },
+    "crawl_ledger": {
+        "db_path": "output/cache/crawl_ledger.db",
+        "revalidate_after_hours": 24  # 이 시간 안에 수집한 URL은 요청 없이 재사용
+    },
+    # 같은 호스트에 대한 요청 제한 (모든 소스가 공유, 소스 설정에서 같은 키로 덮어쓸 수 있음)
+    "host_limits": {
+        "per_host_concurrency": 4,  # 호스트별 동시 요청 수
+        "per_host_min_interval": 0.1  # 같은 호스트 요청 시작 간 최소 간격 (초)
+    },
+    # 브라우저 없이 HTTP로 수집하는 소스 어댑터 설정 (agents/sources)
+    "sources": {
+        "pytorch_kr": {
+            "base_url": "https://discuss.pytorch.kr",
+            "category": "news",
+            "max_age_days": 7,  # 최근 활동이 이 기간 안인 토픽만 수집
+            "max_pages": 20,  # 목록 페이지 최대 수 (안전장치)
+            "concurrency": 4,  # 토픽 본문 동시 요청 수
+            "request_timeout": 15,
+            "max_retries": 3,  # 429/5xx 응답 재시도 횟수
+            "deadline": 120  # 소스 전체 수집 제한 시간 (초)
+        },
+        "aitimes_kr": {
+            # 발행 시각이 있는 피드를 순서대로 읽음 (앞 피드가 기간 전체를 덮으면 중단)
+            "feeds": [
+                "https://www.aitimes.kr/rss/allArticle.xml",
+                "https://www.aitimes.kr/sitemap.xml"
+            ],
+            "max_age_days": 7,
+            "concurrency": 4,  # 기사 HTML 동시 요청 수
+            "request_timeout": 15,
+            "max_retries": 3,
+            "deadline": 120
+        },
+        "perplexity": {
+            "api_url": "https://api.perplexity.ai/chat/completions",
+            "model": "llama-3.1-sonar-small-128k-online",
+            "prompt_template": "최신 AI 트렌드와 관련된 정보를 검색해주세요: {query}",
+            "max_tokens": 1000,
+            "temperature": 0.1,
+            "request_timeout": 30,  # 요청별 제한 시간 (초)
+            "max_retries": 3,  # 429/5xx 응답 재시도 횟수 (Retry-After 준수)
+            "hydrate_citations": True,  # 인용 URL 본문을 가져와 레코드 content로 사용
+            "citation_concurrency": 6,
+            "citation_timeout": 10,
+            "max_citation_chars": 20000,
+            # HTTP로 받은 본문이 이보다 짧으면 JS로 그리는 페이지로 보고 공유 브라우저 탭에서 다시 렌더링
+            # (selenium이 없으면 건너뜀)
+            "render_js_citations": True,
+            "js_render_min_chars": 200,
+            "deadline": 90
+        }
+    },
+    # 소스 동시 수집: 전체 예산은 AGENT_TIMEOUTS["searcher"] / ["query_searcher"]에서 이 여유분을 뺀 값
+    # (중복 제거/저장할 시간을 남겨 단계 타임아웃 전에 부분 결과를 반환)
+    "source_budget_margin": 15
+}
+
+# LLM 응답 캐시 설정
+LLM_CACHE_CONFIGS = {
+    "enabled": True,
+    "cache_path": "output/cache/llm_cache.db",
+    "ttl_seconds": 7 * 24 * 3600,  # 7일
+    "max_entries": 5000,
+    "max_bytes": 200 * 1024 * 1024,  # 200MB
+    "bypass_env": "LLM_CACHE_BYPASS"  # 환경변수가 "1"이면 캐시 우회
+}
+
+# 수집 문서 중복 제거 설정 (MinHash + LSH)
+DEDUP_CONFIGS = {
+    "enabled": True,
+    "shingle_size": 5,  # 문자 단위 shingle 길이 (한국어는 띄어쓰기가 달라도 잡히도록 문자 기준)
+    "num_perm": 128,  # MinHash 서명 길이
+    "bands": 16,  # LSH 밴드 수 (bands x rows = num_perm), 후보 임계값 ≈ (1/bands)^(1/rows) ≈ 0.71
+    "similarity_threshold": 0.7,  # 서명으로 추정한 Jaccard 유사도가 이 이상이면 중복
+    "seed": 42,
+    # 중복 묶음에서 대표 문서를 고를 때의 출처 우선순위 (원문 기사를 우선, 같으면 본문이 긴 문서)
+    "source_priority": ["aitimes_kr", "pytorch_kr", "perplexity"]
+}
+
+# TTS 합성 설정 (TTSAgent의 청크 단위 동시 합성)
+TTS_SYNTHESIS_CONFIGS = {
+    "model": "gemini-2.5-flash-preview-tts",
+    "speakers": {"Joe": "Kore", "Jane": "Puck"},  # 화자 -> 사전 정의 음성
+    "max_chunk_bytes": 4500,  # 요청 하나에 담을 대본 최대 바이트
+    "min_chunk_bytes": 1500,  # 이보다 작으면 앵커 턴에서도 청크를 나누지 않음
+    "anchor_divisor": 8,  # 턴 해시가 이 값으로 나누어떨어지면 청크 경계(앵커)로 사용
+    "max_concurrency": 4,  # 동시에 합성하는 청크 수
+    "max_retries": 3,  # 청크별 재시도 횟수
+    "retry_base_delay": 1.0,  # 지수 백오프 기본 대기 시간(초)
+    "sample_rate": 24000,
+    "channels": 1,
+    "sample_width": 2
+}
+
+# TTS 청크 오디오 캐시 설정 (대본 일부 수정 시 바뀐 청크만 다시 합성)
+TTS_CACHE_CONFIGS = {
+    "enabled": True,
+    "cache_dir": "output/cache/tts",
+    "max_bytes": 2 * 1024 * 1024 * 1024,  # 2GB, 초과 시 가장 오래 사용되지 않은 청크부터 제거
+    "bypass_env": "TTS_CACHE_BYPASS"  # 환경변수가 "1"이면 캐시 우회
+}
+
+# TTS 출력 후처리 설정 (청크 단위 스트리밍 처리)
+AUDIO_POSTPROCESS_CONFIGS = {
+    "trim_silence": True,  # 청크 앞뒤의 무음 제거
+    "silence_threshold_dbfs": -45.0,  # 이 값보다 조용한 구간을 무음으로 간주
+    "keep_silence_ms": 120,  # 청크 경계에 남겨둘 무음 길이
+    "crossfade_ms": 30,  # 청크 경계 크로스페이드 길이 (0이면 사용 안 함)
+    "normalize": True,  # 2-pass RMS 라우드니스 정규화
+    "target_rms_dbfs": -18.0,
+    "peak_ceiling_dbfs": -1.0,  # 정규화 후 허용 최대 피크
+    "block_frames": 262144,  # 정규화 시 한 번에 처리하는 프레임 수
+    "encode_formats": ["mp3"],  # ffmpeg가 있으면 추가로 인코딩할 배포용 포맷 (mp3, opus)
+    "bitrates": {"mp3": "128k", "opus": "64k"}
 }
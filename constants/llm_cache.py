@@ -0,0 +1,189 @@
+"""Persistent on-disk cache for LLM responses."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .configuration import LLM_CACHE_CONFIGS
+
+
+class LLMResponseCache:
+    """요청 내용을 해시한 키로 LLM 응답을 SQLite에 저장하는 캐시 클래스.
+
+    키는 (model, system_prompt, prompt, temperature, max_tokens, 추가 파라미터)의
+    SHA-256 해시이며, TTL이 지난 항목은 무시되고 항목 수/전체 크기가 한도를
+    넘으면 가장 오래 사용되지 않은 항목부터 제거합니다(LRU).
+    """
+
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        캐시를 초기화합니다.
+
+        Args:
+            cache_path: SQLite 파일 경로 (기본값: LLM_CACHE_CONFIGS["cache_path"])
+            ttl_seconds: 항목 유효 기간(초), None 또는 0이면 만료 없음
+            max_entries: 최대 항목 수
+            max_bytes: 응답 텍스트의 최대 총 크기(바이트)
+        """
+        self.cache_path = Path(cache_path or LLM_CACHE_CONFIGS["cache_path"])
+        self.ttl_seconds = LLM_CACHE_CONFIGS["ttl_seconds"] if ttl_seconds is None else ttl_seconds
+        self.max_entries = max_entries or LLM_CACHE_CONFIGS["max_entries"]
+        self.max_bytes = max_bytes or LLM_CACHE_CONFIGS["max_bytes"]
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache(last_access)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        system_prompt: Optional[str],
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        extra: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """요청 파라미터로부터 캐시 키를 생성합니다."""
+        payload = {
+            "model": model,
+            "system_prompt": system_prompt or "",
+            "prompt": prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "extra": extra or {}
+        }
+        encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 응답을 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            response, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return response
+
+    def set(self, key: str, response: str, model: Optional[str] = None) -> None:
+        """응답을 저장하고 한도를 넘으면 LRU 항목을 제거합니다."""
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_cache (key, model, response, size, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (key, model, response, size, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """만료 항목과 한도를 초과한 LRU 항목을 제거합니다."""
+        if self.ttl_seconds:
+            cursor = self._conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+            self.evictions += max(cursor.rowcount, 0)
+
+        count, total_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+        ).fetchone()
+        if count <= self.max_entries and total_bytes <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT key, size FROM llm_cache ORDER BY last_access ASC"
+        ).fetchall()
+        stale_keys = []
+        for key, size in rows:
+            if count <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            stale_keys.append((key,))
+            count -= 1
+            total_bytes -= size
+
+        self._conn.executemany("DELETE FROM llm_cache WHERE key = ?", stale_keys)
+        self.evictions += len(stale_keys)
+
+    def clear(self) -> None:
+        """캐시를 비웁니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 적중/미스 통계를 반환합니다."""
+        with self._lock:
+            count, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": count,
+            "total_bytes": total_bytes,
+            "cache_path": str(self.cache_path)
+        }
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+
+def is_cache_bypassed() -> bool:
+    """환경변수로 캐시 우회가 설정되었는지 확인합니다."""
+    return os.getenv(LLM_CACHE_CONFIGS["bypass_env"], "") == "1"
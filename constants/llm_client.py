@@ -8,17 +8,25 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 from openai import AsyncOpenAI
 from .ai_models import OPENAI_MODELS
+from .configuration import LLM_CACHE_CONFIGS
+from .llm_cache import LLMResponseCache, is_cache_bypassed
+
+try:
+    from ..instrumentation import record_llm_response, record_retry
+except ImportError:
+    from instrumentation import record_llm_response, record_retry
 
 
 class LLMClient:
     """OpenAI GPT-4 클라이언트 클래스."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache: Optional[LLMResponseCache] = None):
         """
         LLM 클라이언트를 초기화합니다.
         
         Args:
             api_key: OpenAI API 키 (없으면 환경변수에서 읽음)
+            cache: 응답 캐시 (없으면 LLM_CACHE_CONFIGS 설정으로 생성)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
@@ -28,6 +36,11 @@ class LLMClient:
         self.default_model = "gpt-4"  # GPT-4 사용
         self.max_retries = 3
         self.retry_delay = 1.0
+        
+        # 응답 캐시
+        self.cache = cache
+        if self.cache is None and LLM_CACHE_CONFIGS.get("enabled", False):
+            self.cache = LLMResponseCache()
     
     async def generate_response(
         self,
@@ -36,6 +49,7 @@ class LLMClient:
         model: Optional[str] = None,
         max_tokens: int = 2000,
         temperature: float = 0.7,
+        use_cache: bool = True,
         **kwargs
     ) -> str:
         """
@@ -47,6 +61,7 @@ class LLMClient:
             model: 사용할 모델 (기본값: gpt-4)
             max_tokens: 최대 토큰 수
             temperature: 온도 설정
+            use_cache: False면 캐시를 조회하지 않고 항상 새로 생성 (결과는 캐시에 저장)
             **kwargs: 추가 OpenAI API 파라미터
             
         Returns:
@@ -54,6 +69,17 @@ class LLMClient:
         """
         model = model or self.default_model
         
+        # 캐시 조회
+        cache_key = None
+        if self.cache is not None:
+            cache_key = LLMResponseCache.make_key(
+                model, system_prompt, prompt, temperature, max_tokens, kwargs
+            )
+            if use_cache and not is_cache_bypassed():
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
+        
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
@@ -70,15 +96,26 @@ class LLMClient:
                     **kwargs
                 )
                 
-                return response.choices[0].message.content.strip()
+                record_llm_response(model, response)
+                content = response.choices[0].message.content.strip()
+                if cache_key is not None:
+                    self.cache.set(cache_key, content, model=model)
+                return content
                 
             except Exception as e:
                 if attempt < self.max_retries - 1:
                     print(f"LLM API 호출 실패 (시도 {attempt + 1}/{self.max_retries}): {e}")
+                    record_retry("openai")
                     await asyncio.sleep(self.retry_delay * (2 ** attempt))
                 else:
                     raise e
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """응답 캐시의 적중/미스 통계를 반환합니다."""
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.cache.get_stats()}
+    
     async def analyze_personalized_data(
         self,
         slack_data: Dict[str, Any],
@@ -82,3 +82,56 @@ MCP_PERFORMANCE = {
     "caching_enabled": True,
     "cache_ttl": 300
 }
+
+# Slack API Rate Limit (Web API tier별 분당 허용 요청 수)
+SLACK_RATE_LIMITS = {
+    "tiers": {
+        "tier1": 1,
+        "tier2": 20,
+        "tier3": 50,
+        "tier4": 100
+    },
+    "methods": {
+        "conversations.list": "tier2",
+        "conversations.info": "tier3",
+        "conversations.members": "tier4",
+        "conversations.history": "tier3",
+        "search.messages": "tier2",
+        "team.info": "tier3",
+        "users.list": "tier2",
+        "users.info": "tier4"
+    },
+    "default_tier": "tier3",
+    "max_concurrency": 8,  # 동시에 처리할 채널 수
+    "page_size": 200,  # cursor 페이지당 항목 수
+    "max_rate_limit_retries": 5  # 429 응답 재시도 횟수
+}
+
+# Gmail API 배치 요청 설정
+GMAIL_BATCH_CONFIGS = {
+    "batch_size": 50,  # 배치당 messages.get 수 (API 최대 100, 50 초과 시 사용자별 rate limit에 걸리기 쉬움)
+    "page_size": 500,  # messages.list 페이지당 최대 항목 수
+    "max_messages": 500,  # get_gmail_info에서 수집할 최대 메시지 수 (mcp_config.yaml serverConfigs.gmail.maxMessages와 동일)
+    "metadata_headers": ["From", "To", "Subject", "Date", "Cc", "Bcc"],
+    "max_batch_retries": 3,  # 429/5xx로 실패한 항목 재시도 횟수
+    "retry_base_delay": 1.0  # 재시도 지수 백오프 기본 지연 (초)
+}
+
+# Notion API Rate Limit (통합당 평균 초당 3회)
+NOTION_RATE_LIMITS = {
+    "requests_per_second": 3,
+    "burst": 3,  # 순간 허용 요청 수
+    "max_concurrency": 6,  # 동시에 수집할 페이지 수
+    "page_size": 100,  # start_cursor 페이지당 항목 수 (API 최대 100)
+    "max_block_depth": 8,  # 하위 블록 재귀 최대 깊이
+    "max_rate_limit_retries": 5  # 429 응답 재시도 횟수
+}
+
+# Notion 증분 동기화 설정
+NOTION_SYNC_CONFIGS = {
+    "db_path": "output/cache/notion_mirror.db",
+    "clock_skew_minutes": 2,  # last_edited_time은 분 단위로 기록되므로 이전 동기화 시작 시각보다 여유를 두고 재확인
+    # 삭제/권한 해제된 페이지는 수정분 검색에 나오지 않으므로 이 주기마다 전체 목록을 조회해 미러에서 정리
+    # (목록 조회만 하고 본문은 수정된 페이지만 다시 가져옴)
+    "full_listing_interval_hours": 24
+}
@@ -16,6 +16,7 @@ WORKFLOW_STEPS = {
     "PERSONALIZATION": "personalization",
     "SEARCH": "search",
     "QUERY_WRITING": "query_writing",
+    "QUERY_SEARCH": "query_search",
     "DB_CONSTRUCTION": "db_construction",
     "RESEARCH": "research",
     "CRITIQUE": "critique",
@@ -29,6 +30,7 @@ WORKFLOW_STEP_DESCRIPTIONS = {
     "personalization": "개인화 정보 수집",
     "search": "정보 탐색",
     "query_writing": "쿼리 작성",
+    "query_search": "쿼리 기반 탐색",
     "db_construction": "DB 구축",
     "research": "리서치",
     "critique": "비평",
@@ -42,6 +44,7 @@ WORKFLOW_STEP_ORDER = [
     "personalization",
     "search",
     "query_writing",
+    "query_search",
     "db_construction",
     "research",
     "critique",
@@ -49,17 +52,32 @@ WORKFLOW_STEP_ORDER = [
     "tts"
 ]
 
-# 워크플로우 단계별 타임아웃 (초)
+# 워크플로우 단계별 담당 에이전트 (constants.agents.AGENT_NAMES 값)
+WORKFLOW_STEP_AGENTS = {
+    "orchestration": "orchestrator",
+    "personalization": "personalize",
+    "search": "searcher",
+    "query_writing": "query_writer",
+    "query_search": "query_searcher",
+    "db_construction": "db_constructor",
+    "research": "researcher",
+    "critique": "critic",
+    "script_writing": "script_writer",
+    "tts": "tts"
+}
+
+# 워크플로우 단계별 타임아웃 (초, 담당 에이전트의 AGENT_TIMEOUTS와 같은 값)
 WORKFLOW_STEP_TIMEOUTS = {
     "orchestration": 30,
-    "personalization": 120,
+    "personalization": 300,
     "search": 180,
-    "query_writing": 60,
-    "db_construction": 300,
-    "research": 120,
-    "critique": 60,
-    "script_writing": 90,
-    "tts": 180
+    "query_writing": 120,
+    "query_search": 120,
+    "db_construction": 1200,
+    "research": 600,
+    "critique": 180,
+    "script_writing": 600,
+    "tts": 3600
 }
 
 # 워크플로우 단계별 재시도 횟수
@@ -68,6 +86,7 @@ WORKFLOW_STEP_RETRIES = {
     "personalization": 3,
     "search": 3,
     "query_writing": 2,
+    "query_search": 2,
     "db_construction": 2,
     "research": 2,
     "critique": 1,
@@ -84,7 +103,7 @@ WORKFLOW_EXECUTION_MODES = {
 
 # 워크플로우 병렬 실행 가능한 단계들
 WORKFLOW_PARALLEL_STEPS = [
-    ["personalization", "search"]  # 개인화와 탐색은 병렬로 실행 가능
+    ["personalization", "search"]  # 개인화와 (쿼리가 필요 없는) 탐색은 병렬로 실행 가능
 ]
 
 # 워크플로우 조건부 실행
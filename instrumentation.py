@@ -0,0 +1,438 @@
+"""Per-run tracing of agent stages, LLM usage, HTTP requests and retries.
+
+Every ``BaseAgent.process`` call opens a span. LLM calls, HTTP requests and
+retries made while the span is active are attributed to it through a context
+variable, which also follows ``asyncio`` tasks and ``asyncio.to_thread`` calls.
+At the end of a run the spans are written as an OpenTelemetry-compatible
+(OTLP/JSON) trace.
+"""
+
+import contextvars
+import json
+import os
+import secrets
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    from .constants.ai_models import LLM_PRICING
+    from .constants.configuration import WORKFLOW_CONFIGS
+except ImportError:
+    from constants.ai_models import LLM_PRICING
+    from constants.configuration import WORKFLOW_CONFIGS
+
+# 최대 RSS 측정 (Windows에는 resource 모듈이 없음)
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+# 현재 RSS 측정 (Linux의 /proc/self/statm, 두 번째 값이 상주 페이지 수)
+_STATM_PATH = Path("/proc/self/statm")
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """LLM_PRICING 기준으로 호출 비용(USD)을 추정합니다. 단가를 모르면 0을 반환합니다."""
+    name = model.split("/")[-1]
+    matches = [key for key in LLM_PRICING if name.startswith(key)]
+    if not matches:
+        return 0.0
+    pricing = LLM_PRICING[max(matches, key=len)]
+    return (input_tokens * pricing["input"] + output_tokens * pricing["output"]) / 1_000_000
+
+
+def current_rss_mb() -> Optional[float]:
+    """현재 RSS(MB)를 반환합니다. /proc이 없는 플랫폼에서는 None을 반환합니다."""
+    try:
+        resident_pages = int(_STATM_PATH.read_text().split()[1])
+        page_size = os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+    return round(resident_pages * page_size / (1024 * 1024), 1)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """프로세스 시작 이후 최대 RSS(MB)를 반환합니다. (누적 값이라 줄어들지 않음)"""
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+class _RssSampler:
+    """열려 있는 span들의 최대 RSS를 주기적으로 갱신하는 백그라운드 스레드.
+
+    시작/종료 시점만 재면 단계 도중 올라갔다 내려간 메모리를 놓치므로, span이 하나라도
+    열려 있는 동안 interval초마다 현재 RSS를 읽어 각 span의 최대값을 갱신합니다.
+    열린 span이 없으면 스레드는 종료되고 다음 span이 열릴 때 다시 시작합니다.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._spans: set = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, span: "Span") -> None:
+        with self._lock:
+            self._spans.add(span)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="agentcast-rss-sampler", daemon=True)
+                self._thread.start()
+
+    def discard(self, span: "Span") -> None:
+        with self._lock:
+            self._spans.discard(span)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                spans = list(self._spans)
+                if not spans:
+                    self._thread = None
+                    return
+            rss = current_rss_mb()
+            for span in spans:
+                span.observe_rss(rss)
+
+
+_rss_sampler = _RssSampler(WORKFLOW_CONFIGS["rss_sample_interval"])
+
+
+class Span:
+    """단계 하나의 실행 구간과 그 동안의 사용량을 기록하는 클래스."""
+
+    def __init__(self, name: str, trace_id: str, parent: Optional["Span"] = None, attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent = parent
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.events: List[Dict[str, Any]] = []
+        self.status = "OK"
+        self.error: Optional[str] = None
+
+        self.llm: Dict[str, Dict[str, float]] = defaultdict(lambda: {"calls": 0, "input_tokens": 0, "output_tokens": 0, "cost_usd": 0.0})
+        self.http: Dict[str, int] = defaultdict(int)
+        self.retries: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self.wall_time: Optional[float] = None
+        self.cpu_time: Optional[float] = None
+        # 단계 동안의 최대 RSS는 백그라운드 샘플링으로 측정 (병렬 단계끼리는 서로 겹쳐 집계됨)
+        self.rss_start_mb = current_rss_mb()
+        self.rss_end_mb: Optional[float] = None
+        self.rss_peak_mb = self.rss_start_mb
+        # 샘플 사이의 순간 최대값은 프로세스 최대 RSS(ru_maxrss)가 단계 중에 올랐는지로 보정
+        self._process_peak_start_mb = peak_rss_mb()
+        if self.rss_start_mb is not None:
+            _rss_sampler.add(self)
+
+    def end(self) -> None:
+        self.end_time_ns = time.time_ns()
+        self.wall_time = time.perf_counter() - self._wall_start
+        # 프로세스 전체 CPU 시간이므로 병렬 단계끼리는 서로 겹쳐 집계됨
+        self.cpu_time = time.process_time() - self._cpu_start
+        self.rss_end_mb = current_rss_mb()
+        _rss_sampler.discard(self)
+        self.observe_rss(self.rss_end_mb)
+        process_peak_end_mb = peak_rss_mb()
+        if self._process_peak_start_mb is not None and process_peak_end_mb > self._process_peak_start_mb:
+            # 프로세스 최대 RSS가 이 단계 중에 갱신되었으므로 그 값이 단계의 최대 RSS
+            # (/proc이 없는 플랫폼에서는 이 값만으로 최대 RSS를 기록)
+            self.observe_rss(process_peak_end_mb)
+
+    def observe_rss(self, rss_mb: Optional[float]) -> None:
+        """측정한 RSS(MB)로 단계의 최대 RSS를 갱신합니다."""
+        if rss_mb is None:
+            return
+        with self._lock:
+            if self.rss_peak_mb is None or rss_mb > self.rss_peak_mb:
+                self.rss_peak_mb = rss_mb
+
+    @property
+    def rss_delta_mb(self) -> Optional[float]:
+        """단계 시작과 끝의 RSS 차이(MB). 측정할 수 없으면 None을 반환합니다."""
+        if self.rss_start_mb is None or self.rss_end_mb is None:
+            return None
+        return round(self.rss_end_mb - self.rss_start_mb, 1)
+
+    @property
+    def rss_peak_growth_mb(self) -> Optional[float]:
+        """단계 중 최대 RSS가 시작 시점보다 늘어난 양(MB). 측정할 수 없으면 None을 반환합니다."""
+        if self.rss_start_mb is None or self.rss_peak_mb is None:
+            return None
+        return round(self.rss_peak_mb - self.rss_start_mb, 1)
+
+    def set_error(self, error: BaseException) -> None:
+        self.status = "ERROR"
+        self.error = f"{type(error).__name__}: {error}"
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        with self._lock:
+            self.events.append({"name": name, "time_ns": time.time_ns(), "attributes": attributes or {}})
+
+    def add_llm_usage(self, model: str, input_tokens: int, output_tokens: int) -> None:
+        with self._lock:
+            usage = self.llm[model]
+            usage["calls"] += 1
+            usage["input_tokens"] += input_tokens
+            usage["output_tokens"] += output_tokens
+            usage["cost_usd"] += estimate_cost(model, input_tokens, output_tokens)
+
+    def add_http_request(self, connector: str, count: int = 1) -> None:
+        with self._lock:
+            self.http[connector] += count
+
+    def add_retry(self, component: str) -> None:
+        with self._lock:
+            self.retries[component] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """단계별 요약 (사람이 읽기 쉬운 형태)."""
+        return {
+            "name": self.name,
+            "status": self.status,
+            "error": self.error,
+            "wall_time_s": round(self.wall_time or 0.0, 3),
+            "cpu_time_s": round(self.cpu_time or 0.0, 3),
+            "rss_start_mb": self.rss_start_mb,
+            "rss_end_mb": self.rss_end_mb,
+            "rss_delta_mb": self.rss_delta_mb,
+            "rss_peak_mb": self.rss_peak_mb,
+            "rss_peak_growth_mb": self.rss_peak_growth_mb,
+            "llm": {model: dict(usage) for model, usage in self.llm.items()},
+            "llm_cost_usd": round(sum(usage["cost_usd"] for usage in self.llm.values()), 6),
+            "http_requests": dict(self.http),
+            "retries": dict(self.retries)
+        }
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """OTLP/JSON span 형식으로 변환합니다."""
+        attributes = dict(self.attributes)
+        attributes.update({
+            "agentcast.wall_time_s": round(self.wall_time or 0.0, 3),
+            "agentcast.cpu_time_s": round(self.cpu_time or 0.0, 3)
+        })
+        if self.rss_delta_mb is not None:
+            attributes["agentcast.rss_start_mb"] = self.rss_start_mb
+            attributes["agentcast.rss_end_mb"] = self.rss_end_mb
+            attributes["agentcast.rss_delta_mb"] = self.rss_delta_mb
+        if self.rss_peak_mb is not None:
+            attributes["agentcast.rss_peak_mb"] = self.rss_peak_mb
+        if self.rss_peak_growth_mb is not None:
+            attributes["agentcast.rss_peak_growth_mb"] = self.rss_peak_growth_mb
+        for model, usage in self.llm.items():
+            attributes[f"llm.{model}.calls"] = usage["calls"]
+            attributes[f"llm.{model}.input_tokens"] = usage["input_tokens"]
+            attributes[f"llm.{model}.output_tokens"] = usage["output_tokens"]
+            attributes[f"llm.{model}.cost_usd"] = round(usage["cost_usd"], 6)
+        for connector, count in self.http.items():
+            attributes[f"http.{connector}.requests"] = count
+        for component, count in self.retries.items():
+            attributes[f"retry.{component}"] = count
+
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_time_ns),
+            "endTimeUnixNano": str(self.end_time_ns or time.time_ns()),
+            "attributes": [_otlp_attribute(key, value) for key, value in attributes.items()],
+            "events": [
+                {
+                    "name": event["name"],
+                    "timeUnixNano": str(event["time_ns"]),
+                    "attributes": [_otlp_attribute(key, value) for key, value in event["attributes"].items()]
+                }
+                for event in self.events
+            ],
+            "status": {"code": 2, "message": self.error} if self.status == "ERROR" else {"code": 1}
+        }
+        if self.parent is not None:
+            span["parentSpanId"] = self.parent.span_id
+        return span
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class RunTracer:
+    """워크플로우 실행 하나의 span들을 모으고 트레이스 파일로 저장하는 클래스."""
+
+    def __init__(self, run_id: Optional[str] = None, resume: bool = False):
+        self.run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 재개 실행은 원래 실행의 트레이스를 덮어쓰지 않도록 별도 파일(trace_{run_id}_resumeN.json)에 저장
+        self.resume = resume
+        self._resume_file: Optional[Path] = None
+        self.trace_id = secrets.token_hex(16)
+        self.root = Span(
+            "workflow", self.trace_id, attributes={"agentcast.run_id": self.run_id, "agentcast.resumed": resume}
+        )
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Span:
+        parent = _current_span.get() or self.root
+        span = Span(name, self.trace_id, parent=parent, attributes=attributes)
+        with self._lock:
+            self.spans.append(span)
+        return span
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """단계별 요약 목록 (시작 순서)."""
+        return [span.summary() for span in [self.root] + self.spans if span.end_time_ns is not None]
+
+    def write(self, trace_dir: Optional[str] = None) -> Path:
+        """OTLP/JSON 트레이스와 단계별 요약을 파일로 저장합니다."""
+        if self.root.end_time_ns is None:
+            self.root.end()
+
+        output_dir = Path(trace_dir or WORKFLOW_CONFIGS["trace_dir"])
+        output_dir.mkdir(parents=True, exist_ok=True)
+        trace_file = self._trace_file(output_dir)
+
+        trace = {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    _otlp_attribute("service.name", "agent-cast"),
+                    _otlp_attribute("agentcast.run_id", self.run_id)
+                ]},
+                "scopeSpans": [{
+                    "scope": {"name": "agentcast.instrumentation"},
+                    "spans": [span.to_otlp() for span in [self.root] + self.spans]
+                }]
+            }],
+            "summary": self.summary()
+        }
+        with open(trace_file, "w", encoding="utf-8") as f:
+            json.dump(trace, f, ensure_ascii=False, indent=2)
+        return trace_file
+
+    def _trace_file(self, output_dir: Path) -> Path:
+        if not self.resume:
+            return output_dir / f"trace_{self.run_id}.json"
+        # 같은 재개 실행에서 다시 저장하면 처음 고른 파일을 갱신
+        if self._resume_file is None or self._resume_file.parent != output_dir:
+            attempt = 1
+            while (output_dir / f"trace_{self.run_id}_resume{attempt}.json").exists():
+                attempt += 1
+            self._resume_file = output_dir / f"trace_{self.run_id}_resume{attempt}.json"
+        return self._resume_file
+
+    def print_summary(self) -> None:
+        """단계별 소요 시간과 사용량을 표로 출력합니다."""
+        print("\n⏱️  단계별 실행 통계:")
+        print(f"   {'단계':<16}{'상태':<7}{'wall(s)':>9}{'cpu(s)':>9}{'최대RSS(MB)':>12}{'최대증가(MB)':>12}{'LLM':>5}{'토큰(in/out)':>16}{'비용($)':>10}{'HTTP':>6}{'재시도':>6}")
+        for span in self.spans:
+            if span.end_time_ns is None:
+                continue
+            summary = span.summary()
+            tokens_in = sum(usage["input_tokens"] for usage in span.llm.values())
+            tokens_out = sum(usage["output_tokens"] for usage in span.llm.values())
+            print(
+                f"   {span.name:<16}{span.status:<7}{summary['wall_time_s']:>9.1f}{summary['cpu_time_s']:>9.1f}"
+                f"{_format_mb(summary['rss_peak_mb']):>12}{_format_mb(summary['rss_peak_growth_mb'], signed=True):>12}"
+                f"{sum(usage['calls'] for usage in span.llm.values()):>5}"
+                f"{f'{tokens_in}/{tokens_out}':>16}{summary['llm_cost_usd']:>10.4f}"
+                f"{sum(span.http.values()):>6}{sum(span.retries.values()):>6}"
+            )
+
+
+def _format_mb(value: Optional[float], signed: bool = False) -> str:
+    if value is None:
+        return "-"
+    return f"{value:+.0f}" if signed else f"{value:.0f}"
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("agentcast_current_span", default=None)
+_tracer: Optional[RunTracer] = None
+
+
+def start_run(run_id: Optional[str] = None, resume: bool = False) -> RunTracer:
+    """새 실행의 트레이서를 시작합니다. resume이면 원래 실행의 트레이스 파일을 보존합니다."""
+    global _tracer
+    _tracer = RunTracer(run_id, resume=resume)
+    return _tracer
+
+
+def get_tracer() -> RunTracer:
+    """현재 실행의 트레이서를 반환합니다. (없으면 새로 시작)"""
+    return _tracer or start_run()
+
+
+def current_span() -> Span:
+    """현재 활성 span을 반환합니다. 없으면 실행 전체(root) span을 반환합니다."""
+    return _current_span.get() or get_tracer().root
+
+
+@contextmanager
+def trace_span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Span]:
+    """블록 실행 구간을 span으로 기록합니다. 예외가 나면 span을 ERROR로 표시합니다."""
+    span = get_tracer().start_span(name, attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.set_error(e)
+        raise
+    finally:
+        span.end()
+        _current_span.reset(token)
+
+
+def record_llm_usage(model: str, input_tokens: int, output_tokens: int) -> None:
+    """LLM 호출 한 번의 토큰 사용량을 현재 span에 기록합니다."""
+    current_span().add_llm_usage(model, int(input_tokens or 0), int(output_tokens or 0))
+
+
+def record_llm_response(model: str, response: Any) -> None:
+    """OpenAI / Anthropic / Gemini 응답 객체에서 토큰 사용량을 읽어 기록합니다."""
+    input_tokens = output_tokens = 0
+    usage = getattr(response, "usage", None)
+    metadata = getattr(response, "usage_metadata", None)
+    if usage is not None:
+        # OpenAI: prompt_tokens/completion_tokens, Anthropic: input_tokens/output_tokens
+        input_tokens = getattr(usage, "prompt_tokens", None) or getattr(usage, "input_tokens", 0) or 0
+        output_tokens = getattr(usage, "completion_tokens", None) or getattr(usage, "output_tokens", 0) or 0
+    elif metadata is not None:
+        input_tokens = getattr(metadata, "prompt_token_count", 0) or 0
+        output_tokens = getattr(metadata, "candidates_token_count", 0) or 0
+    record_llm_usage(model, input_tokens, output_tokens)
+
+
+def record_http_request(connector: str, count: int = 1) -> None:
+    """외부 API/웹 요청 수를 커넥터별로 현재 span에 기록합니다."""
+    current_span().add_http_request(connector, count)
+
+
+def record_retry(component: str) -> None:
+    """재시도 한 번을 현재 span에 기록합니다."""
+    current_span().add_retry(component)
+
+
+def record_event(name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+    """현재 span에 이벤트(로그)를 추가합니다."""
+    current_span().add_event(name, attributes)
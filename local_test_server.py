@@ -0,0 +1,27 @@
+"""소스 어댑터 테스트에서 공유하는 로컬 aiohttp 테스트 서버."""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+
+from aiohttp import web
+
+
+@asynccontextmanager
+async def local_server(routes: List[web.RouteDef]) -> AsyncIterator[str]:
+    """routes를 처리하는 서버를 임의 포트에 띄우고 기본 URL(http://127.0.0.1:포트)을 돌려줍니다.
+
+    예:
+        async with local_server([web.get("/feed.xml", fake.feed)]) as base:
+            source = AITimesSource(config={"feeds": [f"{base}/feed.xml"]})
+    """
+    app = web.Application()
+    app.add_routes(routes)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = runner.addresses[0][:2]
+        yield f"http://{host}:{port}"
+    finally:
+        await runner.cleanup()
@@ -14,6 +14,10 @@ except ImportError:
     import os
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from constants.mcp import MCP_CONNECTION_STATUS, MCP_ERROR_CODES
+try:
+    from ..instrumentation import record_retry
+except ImportError:
+    from instrumentation import record_retry
 
 
 @dataclass
@@ -97,6 +101,7 @@ class BaseMCP(ABC):
                 self.logger.warning(f"Attempt {attempt + 1} failed: {e}")
                 
                 if attempt < self.max_retries:
+                    record_retry(self.server_type)
                     await asyncio.sleep(self.retry_delay * (2 ** attempt))  # 지수 백오프
                 else:
                     self.update_connection_status(MCP_CONNECTION_STATUS["FAILED"], str(e))
@@ -13,6 +13,14 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from .base_mcp import BaseMCP
+try:
+    from ..constants.mcp import GMAIL_BATCH_CONFIGS
+except ImportError:
+    from constants.mcp import GMAIL_BATCH_CONFIGS
+try:
+    from ..instrumentation import record_http_request, record_retry
+except ImportError:
+    from instrumentation import record_http_request, record_retry
 
 
 class GmailMCP(BaseMCP):
@@ -35,6 +43,9 @@ class GmailMCP(BaseMCP):
         self._connected = False
         self._service = None
         self._credentials = None
+        
+        # 배치 요청 설정
+        self.batch_size = min(config.get("batch_size", GMAIL_BATCH_CONFIGS["batch_size"]), 100)
     
     async def connect(self) -> bool:
         """Gmail API에 연결합니다."""
@@ -150,7 +161,8 @@ class GmailMCP(BaseMCP):
         
         try:
             # Gmail API를 사용하여 프로필 정보 가져오기
-            profile = self._service.users().getProfile(userId=self.user_id).execute()
+            record_http_request("gmail")
+            profile = await asyncio.to_thread(self._service.users().getProfile(userId=self.user_id).execute)
             
             return {
                 "user_id": self.user_id,
@@ -175,7 +187,8 @@ class GmailMCP(BaseMCP):
         
         try:
             # Gmail API를 사용하여 라벨 목록 가져오기
-            results = self._service.users().labels().list(userId=self.user_id).execute()
+            record_http_request("gmail")
+            results = await asyncio.to_thread(self._service.users().labels().list(userId=self.user_id).execute)
             labels = results.get('labels', [])
             
             return labels
@@ -184,43 +197,47 @@ class GmailMCP(BaseMCP):
             self.logger.error(f"Gmail API error: {error}")
             raise Exception(f"Failed to fetch labels: {error}")
     
-    async def get_messages(self, query: str = "", label_ids: Optional[List[str]] = None, max_results: int = 30) -> List[Dict[str, Any]]:
-        """Gmail 메시지를 가져옵니다."""
-        return await self.execute_with_retry(self._get_messages_impl, query, label_ids, max_results)
+    async def get_messages(
+        self,
+        query: str = "",
+        label_ids: Optional[List[str]] = None,
+        max_results: int = 30,
+        include_body: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Gmail 메시지를 가져옵니다.
+        
+        Args:
+            query: Gmail 검색 쿼리
+            label_ids: 필터링할 라벨 ID 목록
+            max_results: 가져올 최대 메시지 수 (nextPageToken으로 페이지 이동)
+            include_body: False면 본문 없이 헤더만 요청 (format='metadata')
+        """
+        return await self.execute_with_retry(self._get_messages_impl, query, label_ids, max_results, include_body)
     
-    async def _get_messages_impl(self, query: str = "", label_ids: Optional[List[str]] = None, max_results: int = 30) -> List[Dict[str, Any]]:
+    async def _get_messages_impl(
+        self,
+        query: str = "",
+        label_ids: Optional[List[str]] = None,
+        max_results: int = 30,
+        include_body: bool = True
+    ) -> List[Dict[str, Any]]:
         """Gmail 메시지를 가져오는 실제 구현."""
         if not self._service:
             raise Exception("Gmail API service not initialized. Please connect first.")
         
         try:
-            # Gmail API를 사용하여 메시지 목록 가져오기
-            messages_result = self._service.users().messages().list(
-                userId=self.user_id,
-                q=query,
-                labelIds=label_ids,
-                maxResults=max_results
-            ).execute()
-            
-            messages = messages_result.get('messages', [])
-            detailed_messages = []
-            
-            # 각 메시지의 상세 정보 가져오기
-            for message in messages:
-                try:
-                    msg_detail = self._service.users().messages().get(
-                        userId=self.user_id,
-                        id=message['id'],
-                        format='full'
-                    ).execute()
-                    
-                    # 메시지 정보 파싱
-                    parsed_message = self._parse_message(msg_detail)
-                    detailed_messages.append(parsed_message)
-                    
-                except HttpError as error:
-                    self.logger.error(f"Error fetching message {message['id']}: {error}")
-                    continue
+            # 메시지 ID 목록 가져오기 (페이지 단위)
+            message_ids = await self._list_message_ids(query, label_ids, max_results)
+            
+            # 상세 정보는 배치 요청으로 가져오기
+            raw_messages = await self._batch_get_messages(message_ids, include_body)
+            
+            # 목록 순서(최신순) 유지
+            detailed_messages = [
+                self._parse_message(raw_messages[message_id])
+                for message_id in message_ids
+                if message_id in raw_messages
+            ]
             
             self.logger.info(f"Successfully fetched {len(detailed_messages)} messages")
             return detailed_messages
@@ -229,6 +246,97 @@ class GmailMCP(BaseMCP):
             self.logger.error(f"Gmail API error: {error}")
             raise Exception(f"Failed to fetch messages: {error}")
     
+    async def _list_message_ids(self, query: str, label_ids: Optional[List[str]], max_results: int) -> List[str]:
+        """messages.list를 nextPageToken으로 넘기며 메시지 ID를 최대 max_results개 가져옵니다."""
+        message_ids = []
+        page_token = None
+        
+        while len(message_ids) < max_results:
+            request = self._service.users().messages().list(
+                userId=self.user_id,
+                q=query,
+                labelIds=label_ids,
+                maxResults=min(max_results - len(message_ids), GMAIL_BATCH_CONFIGS["page_size"]),
+                pageToken=page_token,
+                fields="messages/id,nextPageToken"
+            )
+            record_http_request("gmail")
+            result = await asyncio.to_thread(request.execute)
+            
+            message_ids.extend(message["id"] for message in result.get("messages", []))
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                break
+        
+        return message_ids[:max_results]
+    
+    async def _batch_get_messages(self, message_ids: List[str], include_body: bool = True) -> Dict[str, Dict[str, Any]]:
+        """messages.get을 배치 HTTP 요청으로 묶어 가져옵니다.
+        
+        한 번의 왕복에 batch_size개씩 요청하고, 429/5xx로 실패한 항목만
+        지수 백오프 후 다시 배치로 요청합니다.
+        
+        Returns:
+            메시지 ID -> Gmail API 응답 딕셔너리
+        """
+        if include_body:
+            params = {"format": "full"}
+        else:
+            params = {"format": "metadata", "metadataHeaders": GMAIL_BATCH_CONFIGS["metadata_headers"]}
+        
+        messages = {}
+        pending = list(message_ids)
+        
+        for attempt in range(GMAIL_BATCH_CONFIGS["max_batch_retries"] + 1):
+            retryable = []
+            for start in range(0, len(pending), self.batch_size):
+                chunk = pending[start:start + self.batch_size]
+                record_http_request("gmail")
+                fetched, failed = await asyncio.to_thread(self._execute_batch, chunk, params)
+                messages.update(fetched)
+                
+                for message_id, error in failed:
+                    status = getattr(getattr(error, "resp", None), "status", None)
+                    if status == 429 or (status is not None and status >= 500):
+                        retryable.append(message_id)
+                    else:
+                        self.logger.error(f"Error fetching message {message_id}: {error}")
+            
+            if not retryable:
+                break
+            if attempt == GMAIL_BATCH_CONFIGS["max_batch_retries"]:
+                self.logger.error(f"Giving up on {len(retryable)} messages after {attempt} retries")
+                break
+            
+            delay = GMAIL_BATCH_CONFIGS["retry_base_delay"] * (2 ** attempt)
+            self.logger.warning(f"{len(retryable)} messages rate limited, retrying in {delay} seconds...")
+            record_retry("gmail")
+            await asyncio.sleep(delay)
+            pending = retryable
+        
+        return messages
+    
+    def _execute_batch(self, message_ids: List[str], params: Dict[str, Any]):
+        """배치 요청 하나를 실행합니다. (블로킹, 스레드에서 호출)"""
+        fetched = {}
+        failed = []
+        
+        def callback(request_id, response, exception):
+            if exception is None:
+                fetched[request_id] = response
+            else:
+                failed.append((request_id, exception))
+        
+        batch = self._service.new_batch_http_request(callback=callback)
+        for message_id in message_ids:
+            batch.add(
+                self._service.users().messages().get(userId=self.user_id, id=message_id, **params),
+                request_id=message_id
+            )
+        batch.execute()
+        
+        return fetched, failed
+    
     def _parse_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """Gmail API 응답을 파싱하여 통일된 형식으로 변환합니다."""
         payload = message.get('payload', {})
@@ -0,0 +1,84 @@
+"""Multi-pattern keyword matcher based on the Aho-Corasick automaton."""
+
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+def _is_ascii_word_char(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+class KeywordMatcher:
+    """여러 키워드를 텍스트 한 번 순회로 찾는 Aho-Corasick 매처.
+
+    키워드 수와 관계없이 텍스트 길이에 비례하는 시간으로 검색합니다.
+    영문 키워드는 단어 경계에서만 매칭하여 "AI"가 "said"에 걸리지 않도록 하고,
+    한글 키워드는 조사가 붙는 경우("연구를")를 위해 부분 문자열로 매칭합니다.
+    """
+
+    def __init__(self, keywords: Iterable[str], case_sensitive: bool = False):
+        self.case_sensitive = case_sensitive
+        self.keywords = [keyword for keyword in dict.fromkeys(keywords) if keyword]
+
+        # goto[node][char] -> node, output[node] -> 키워드 목록
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+
+        for keyword in self.keywords:
+            self._add(keyword)
+        self._build_failure_links()
+
+    def _normalize(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def _add(self, keyword: str) -> None:
+        node = 0
+        for char in self._normalize(keyword):
+            if char not in self._goto[node]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[node][char] = len(self._goto) - 1
+            node = self._goto[node][char]
+        self._output[node].append(keyword)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterable[Tuple[int, int, str]]:
+        """(시작 위치, 끝 위치, 키워드) 튜플을 순서대로 반환합니다."""
+        normalized = self._normalize(text)
+        node = 0
+        for index, char in enumerate(normalized):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+
+            for keyword in self._output[node]:
+                start = index - len(keyword) + 1
+                end = index + 1
+                if self._at_word_boundary(normalized, keyword, start, end):
+                    yield start, end, keyword
+
+    @staticmethod
+    def _at_word_boundary(text: str, keyword: str, start: int, end: int) -> bool:
+        """영문/숫자로 시작하거나 끝나는 키워드는 앞뒤가 영문/숫자가 아니어야 합니다."""
+        if _is_ascii_word_char(keyword[0]) and start > 0 and _is_ascii_word_char(text[start - 1]):
+            return False
+        if _is_ascii_word_char(keyword[-1]) and end < len(text) and _is_ascii_word_char(text[end]):
+            return False
+        return True
+
+    def find(self, text: str) -> Set[str]:
+        """텍스트에 포함된 키워드 집합을 반환합니다."""
+        return {keyword for _, _, keyword in self.iter_matches(text)}
@@ -6,6 +6,10 @@ from .base_mcp import BaseMCP
 from .slack_mcp import SlackMCP
 from .notion_mcp import NotionMCP
 from .gmail_mcp import GmailMCP
+try:
+    from ..constants.mcp import GMAIL_BATCH_CONFIGS
+except ImportError:
+    from constants.mcp import GMAIL_BATCH_CONFIGS
 
 
 class MCPManager:
@@ -107,45 +111,20 @@ class MCPManager:
             # 워크스페이스 정보
             workspace_info = await slack_integration.get_workspace_info()
             
-            # 채널 정보 (전체)
-            channels = await slack_integration.get_channels(include_private=True)
-            
-            # 최근 활동 (전체)
-            recent_activity = await slack_integration.get_recent_activity(hours=168)  # 1주일
-            
-            # 모든 채널의 메시지 수집 (전체 범위)
-            all_messages = {}
-            total_message_count = 0
-            
-            for channel in channels:
-                try:
-                    # 각 채널의 메시지를 최대한 수집 (Slack API 제한 고려)
-                    messages = await slack_integration.get_channel_messages(channel["id"], limit=1000)
-                    all_messages[channel["name"]] = messages
-                    total_message_count += len(messages)
-                except Exception as e:
-                    print(f"채널 {channel['name']} 메시지 수집 실패: {e}")
-                    all_messages[channel["name"]] = []
-            
-            # AI 연구 관련 메시지 검색 (키워드 확장)
+            # AI 연구 관련 키워드 (키워드 확장)
             ai_keywords = ["AI", "research", "optimization", "machine learning", "deep learning", "논문", "연구", "최적화"]
-            ai_messages = []
             
-            for keyword in ai_keywords:
-                try:
-                    keyword_messages = await slack_integration.search_messages(keyword)
-                    ai_messages.extend(keyword_messages)
-                except Exception as e:
-                    print(f"키워드 '{keyword}' 검색 실패: {e}")
-                    continue
+            # 채널 목록과 히스토리를 한 번만 수집한 뒤 최근 활동(1주일)과 키워드 매칭을 로컬에서 계산
+            snapshot = await slack_integration.get_workspace_snapshot(hours=168, limit=1000, keywords=ai_keywords)
+            channels = snapshot["channels"]
+            recent_activity = snapshot["recent_activity"]
+            unique_ai_messages = snapshot["keyword_messages"]
             
-            # 중복 제거
-            unique_ai_messages = []
-            seen_ids = set()
-            for msg in ai_messages:
-                if msg.get("id") not in seen_ids:
-                    unique_ai_messages.append(msg)
-                    seen_ids.add(msg.get("id"))
+            all_messages = {
+                channel["name"]: snapshot["channel_messages"].get(channel["id"], [])
+                for channel in channels
+            }
+            total_message_count = sum(len(messages) for messages in all_messages.values())
             
             return {
                 "workspace_info": workspace_info,
@@ -208,29 +187,23 @@ class MCPManager:
             # 데이터베이스 정보 (전체)
             databases = await notion_integration.get_databases()
             
-            # 각 데이터베이스의 모든 항목 수집 (전체 범위)
-            for db in databases:
-                try:
-                    entries = await notion_integration.get_database_entries(db['id'])
-                    db['entries'] = entries  # 전체 항목 포함
-                    print(f"데이터베이스 '{db.get('title', 'Unknown')}': {len(entries)}개 항목 수집")
-                except Exception as e:
-                    print(f"데이터베이스 '{db.get('title', 'Unknown')}' 항목 수집 실패: {e}")
-                    db['entries'] = []
-            
-            # 전체 페이지 검색 (키워드 제한 없음)
-            all_pages = await notion_integration.search_pages("", None)
-            
-            # 각 페이지의 전체 내용 수집
-            pages_with_content = []
-            for page in all_pages:
-                try:
-                    page_content = await notion_integration.get_page_content(page['id'])
-                    pages_with_content.append(page_content)
-                    print(f"페이지 '{page_content.get('title', 'Unknown')}': {len(page_content.get('content', []))}개 블록")
-                except Exception as e:
-                    print(f"페이지 '{page.get('title', 'Unknown')}' 내용 수집 실패: {e}")
-                    continue
+            # 각 데이터베이스의 모든 항목 동시 수집 (전체 범위, rate limit은 NotionMCP가 관리)
+            all_entries = await asyncio.gather(
+                *(notion_integration.get_database_entries(db['id']) for db in databases),
+                return_exceptions=True
+            )
+            for db, entries in zip(databases, all_entries):
+                if isinstance(entries, Exception):
+                    print(f"데이터베이스 '{db.get('title', 'Unknown')}' 항목 수집 실패: {entries}")
+                    entries = []
+                db['entries'] = entries  # 전체 항목 포함
+                print(f"데이터베이스 '{db.get('title', 'Unknown')}': {len(entries)}개 항목 수집")
+            
+            # 전체 페이지 내용 (로컬 미러와 동기화, 마지막 동기화 이후 수정된 페이지만 다시 수집)
+            sync_result = await notion_integration.sync_pages()
+            pages_with_content = sync_result["pages"]
+            sync_stats = sync_result["sync_stats"]
+            print(f"노션 페이지 동기화: {sync_stats['refetched_pages']}개 재수집, {sync_stats['changed_pages']}개 변경 (총 {len(pages_with_content)}개)")
             
             # 최근 변경사항 (전체)
             recent_changes = await notion_integration.get_recent_changes(hours=168)  # 1주일
@@ -242,6 +215,7 @@ class MCPManager:
                 "total_database_entries": sum(len(db.get('entries', [])) for db in databases),
                 "all_pages": pages_with_content,
                 "total_pages": len(pages_with_content),
+                "sync_stats": sync_stats,
                 "recent_changes": recent_changes,
                 "connection_status": await notion_integration.is_connected()
             }
@@ -300,8 +274,11 @@ class MCPManager:
             # 라벨 정보 (전체)
             labels = await gmail_integration.get_labels()
             
-            # 전체 메시지 수집 (최근 1000개)
-            all_messages = await gmail_integration.get_messages(limit=1000)
+            # 전체 메시지 수집 (GMAIL_BATCH_CONFIGS의 max_messages, 헤더만 배치 요청)
+            all_messages = await gmail_integration.get_messages(
+                max_results=self.config.get("gmail", {}).get("max_messages", GMAIL_BATCH_CONFIGS["max_messages"]),
+                include_body=False
+            )
             
             # AI 연구 관련 메시지 검색 (키워드 확장)
             ai_keywords = ["AI", "research", "machine learning", "deep learning", "논문", "연구", "최적화", "conference", "paper"]
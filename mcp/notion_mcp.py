@@ -2,8 +2,19 @@
 
 import asyncio
 import os
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 from .base_mcp import BaseMCP
+from .rate_limiter import AsyncTokenBucket
+from .notion_mirror import NotionMirror, parse_notion_time
+try:
+    from ..constants.mcp import NOTION_RATE_LIMITS, NOTION_SYNC_CONFIGS
+except ImportError:
+    from constants.mcp import NOTION_RATE_LIMITS, NOTION_SYNC_CONFIGS
+try:
+    from ..instrumentation import record_http_request, record_retry
+except ImportError:
+    from instrumentation import record_http_request, record_retry
 
 # 노션 API 클라이언트 임포트
 try:
@@ -31,6 +42,18 @@ class NotionMCP(BaseMCP):
         self._connected = False
         self._client = None
         
+        # Rate limit: 통합 전체가 하나의 버킷을 공유하고, 동시에 수집하는 페이지 수를 제한
+        self.rate_limits = NOTION_RATE_LIMITS
+        self._bucket = AsyncTokenBucket(
+            rate=self.rate_limits["requests_per_second"],
+            capacity=self.rate_limits["burst"]
+        )
+        self._page_semaphore = asyncio.Semaphore(self.rate_limits["max_concurrency"])
+        
+        # 증분 동기화용 로컬 미러 (sync_pages 첫 호출 시 생성)
+        self.mirror_path = config.get("mirror_path")
+        self._mirror = None
+        
         # 노션 클라이언트 초기화
         if self.notion_token and NOTION_CLIENT_AVAILABLE:
             try:
@@ -42,13 +65,65 @@ class NotionMCP(BaseMCP):
         else:
             raise Exception("NOTION_INTEGRATION_TOKEN이 설정되지 않았거나 notion-client가 설치되지 않았습니다.")
     
+    async def _call(self, api, **kwargs) -> Any:
+        """Rate limit을 지키며 동기 notion_client 메서드를 스레드에서 호출합니다.
+        
+        호출 전에 버킷에서 토큰을 받고, 429(rate_limited) 응답을 받으면
+        Retry-After 헤더만큼 버킷을 멈춘 후 재시도합니다.
+        
+        Args:
+            api: notion_client 메서드 (예: self._client.blocks.children.list)
+            **kwargs: API 파라미터
+        """
+        for attempt in range(self.rate_limits["max_rate_limit_retries"] + 1):
+            await self._bucket.acquire()
+            record_http_request("notion")
+            try:
+                return await asyncio.to_thread(api, **kwargs)
+            except Exception as e:
+                if getattr(e, "status", None) != 429 or attempt >= self.rate_limits["max_rate_limit_retries"]:
+                    raise
+                headers = getattr(e, "headers", None) or {}
+                retry_after = float(headers.get("Retry-After", 1))
+                self.logger.warning(f"Notion API rate limited, {retry_after}초 후 재시도")
+                record_retry("notion")
+                self._bucket.pause(retry_after)
+    
+    async def _paginate(self, api, limit: Optional[int] = None, **kwargs) -> List[Dict[str, Any]]:
+        """start_cursor/has_more 페이지네이션으로 모든 결과를 가져옵니다.
+        
+        Args:
+            api: 페이지네이션을 지원하는 notion_client 메서드
+            limit: 최대 항목 수 (None이면 끝까지)
+            **kwargs: API 파라미터
+        """
+        results = []
+        cursor = None
+        while True:
+            page_size = self.rate_limits["page_size"]
+            if limit is not None:
+                page_size = min(page_size, limit - len(results))
+            
+            params = dict(kwargs, page_size=page_size)
+            if cursor:
+                params["start_cursor"] = cursor
+            
+            response = await self._call(api, **params)
+            results.extend(response.get("results", []))
+            
+            cursor = response.get("next_cursor")
+            if not response.get("has_more") or not cursor or (limit is not None and len(results) >= limit):
+                break
+        
+        return results if limit is None else results[:limit]
+    
     async def connect(self) -> bool:
         """Notion API에 연결합니다."""
         try:
             self.logger.info("Notion API 연결 중...")
             
             # 노션 API 연결 테스트
-            response = self._client.users.me()
+            response = await self._call(self._client.users.me)
             self._connected = True
             self.update_connection_status("connected")
             self.logger.info(f"노션 API 연결 성공: {response.get('name', 'Unknown User')}")
@@ -119,7 +194,7 @@ class NotionMCP(BaseMCP):
             self.logger.info("워크스페이스 정보 조회 중...")
             # 노션 API에서는 직접적인 워크스페이스 정보 API가 제한적이므로
             # 사용자 정보를 통해 워크스페이스 기본 정보를 구성
-            user_info = self._client.users.me()
+            user_info = await self._call(self._client.users.me)
             
             return {
                 "workspace_id": self.workspace_id or "unknown",
@@ -150,10 +225,13 @@ class NotionMCP(BaseMCP):
         """데이터베이스 목록을 가져오는 실제 구현."""
         try:
             self.logger.info("데이터베이스 목록 조회 중...")
-            response = self._client.search(filter={"property": "object", "value": "database"})
+            results = await self._paginate(
+                self._client.search,
+                filter={"property": "object", "value": "database"}
+            )
             
             databases = []
-            for db in response.get("results", []):
+            for db in results:
                 db_info = {
                     "id": db["id"],
                     "title": self._extract_title(db.get("title", [])),
@@ -179,10 +257,10 @@ class NotionMCP(BaseMCP):
         """데이터베이스 항목을 가져오는 실제 구현."""
         try:
             self.logger.info(f"데이터베이스 항목 조회 중: {database_id[:8]}...")
-            response = self._client.databases.query(database_id=database_id)
+            results = await self._paginate(self._client.databases.query, database_id=database_id)
             
             entries = []
-            for page in response.get("results", []):
+            for page in results:
                 page_properties = page.get("properties", {})
                 smart_title = self._extract_smart_title(page_properties)
                 
@@ -211,17 +289,11 @@ class NotionMCP(BaseMCP):
         try:
             self.logger.info(f"페이지 내용 조회 중: {page_id[:8]}...")
             
-            # 페이지 정보 가져오기
-            page = self._client.pages.retrieve(page_id=page_id)
-            
-            # 페이지 블록 내용 가져오기
-            blocks_response = self._client.blocks.children.list(block_id=page_id)
-            
-            content_blocks = []
-            for block in blocks_response.get("results", []):
-                block_content = self._extract_block_content(block)
-                if block_content:  # None이 아닌 경우만 추가 (빈 블록 제외)
-                    content_blocks.append(block_content)
+            # 페이지 정보와 블록 트리를 동시에 가져오기
+            page, content_blocks = await asyncio.gather(
+                self._call(self._client.pages.retrieve, page_id=page_id),
+                self._get_block_tree(page_id)
+            )
             
             # 페이지 데이터 안전하게 추출
             if isinstance(page, dict):
@@ -258,6 +330,146 @@ class NotionMCP(BaseMCP):
                 "content": []
             }
     
+    async def hydrate_pages(self, page_ids: List[str]) -> List[Dict[str, Any]]:
+        """여러 페이지의 내용을 동시에 가져옵니다. (입력 순서 유지)
+        
+        동시에 수집하는 페이지 수는 max_concurrency로, 전체 요청 속도는
+        공유 버킷으로 제한되므로 페이지 수에 비례하는 예측 가능한 시간이 걸립니다.
+        """
+        async def hydrate(page_id: str) -> Dict[str, Any]:
+            async with self._page_semaphore:
+                return await self.get_page_content(page_id)
+        
+        return await asyncio.gather(*(hydrate(page_id) for page_id in page_ids))
+    
+    async def sync_pages(self, mirror: Optional[NotionMirror] = None) -> Dict[str, Any]:
+        """로컬 미러와 동기화하여 모든 페이지 내용을 반환합니다.
+        
+        첫 실행에서는 전체 페이지를 가져오고, 이후에는 마지막 동기화 이후
+        수정된 페이지만 다시 가져와 미러에 반영합니다. 보관(archived)되거나 휴지통으로 옮긴(in_trash)
+        페이지는 미러에서 지우고, full_listing_interval_hours마다 전체 목록을 조회해
+        목록에 없는(삭제되었거나 접근 권한이 사라진) 페이지도 정리합니다.
+        """
+        return await self.execute_with_retry(self._sync_pages_impl, mirror)
+    
+    async def _sync_pages_impl(self, mirror: Optional[NotionMirror] = None) -> Dict[str, Any]:
+        """증분 동기화의 실제 구현."""
+        if mirror is None:
+            if self._mirror is None:
+                self._mirror = NotionMirror(self.mirror_path)
+            mirror = self._mirror
+        
+        started_at = datetime.now(timezone.utc)
+        cursor = mirror.get_cursor()
+        last_full_listing = mirror.get_last_full_listing()
+        full_listing = (
+            cursor is None
+            or last_full_listing is None
+            or started_at - last_full_listing >= timedelta(hours=NOTION_SYNC_CONFIGS["full_listing_interval_hours"])
+        )
+        self.logger.info(
+            f"노션 동기화 시작 ({'전체' if cursor is None else f'{cursor.isoformat()} 이후 수정분'}"
+            f"{', 전체 목록 조회' if full_listing and cursor is not None else ''})"
+        )
+        
+        # last_edited_time 내림차순 검색으로 커서 이후 수정된 페이지만 찾기 (전체 목록 조회 시에는 끝까지)
+        listed_pages = await self._search_pages_edited_since(None if full_listing else cursor)
+        removed_ids = [page["id"] for page in listed_pages if page.get("archived") or page.get("in_trash")]
+        live_pages = [page for page in listed_pages if not (page.get("archived") or page.get("in_trash"))]
+        edited_pages = [
+            page for page in live_pages
+            if cursor is None or (parse_notion_time(page.get("last_edited_time", "")) or started_at) >= cursor
+        ]
+        hydrated = await self.hydrate_pages([page["id"] for page in edited_pages])
+        
+        changed = 0
+        failed = 0
+        for page in hydrated:
+            # get_page_content는 실패 시 빈 기본 구조를 반환하므로 미러에 덮어쓰지 않음
+            if not page.get("last_edited"):
+                failed += 1
+                continue
+            if mirror.upsert(page):
+                changed += 1
+        
+        # 보관/휴지통 페이지를 지우고, 전체 목록을 받았으면 목록에 없는 페이지도 정리
+        removed = mirror.delete(removed_ids)
+        if full_listing:
+            removed += mirror.prune(page["id"] for page in live_pages)
+            mirror.set_last_full_listing(started_at)
+        
+        # 실패한 페이지가 있으면 커서를 유지해 다음 동기화에서 다시 가져오기
+        if failed == 0:
+            mirror.set_last_sync(started_at)
+        
+        pages = mirror.get_pages()
+        sync_stats = {
+            "mode": "full" if cursor is None else "incremental",
+            "since": cursor.isoformat() if cursor else None,
+            "full_listing": full_listing,
+            "listed_pages": len(listed_pages),
+            "refetched_pages": len(edited_pages),
+            "changed_pages": changed,
+            "failed_pages": failed,
+            "removed_pages": removed,
+            "mirrored_pages": len(pages)
+        }
+        self.logger.info(f"노션 동기화 완료: {sync_stats}")
+        
+        return {"pages": pages, "sync_stats": sync_stats}
+    
+    async def _search_pages_edited_since(self, since: Optional[datetime]) -> List[Dict[str, Any]]:
+        """since 이후 수정된 페이지를 최근 수정순으로 가져옵니다. (since가 None이면 전체)"""
+        pages = []
+        cursor = None
+        while True:
+            params = {
+                "filter": {"property": "object", "value": "page"},
+                "sort": {"direction": "descending", "timestamp": "last_edited_time"},
+                "page_size": self.rate_limits["page_size"]
+            }
+            if cursor:
+                params["start_cursor"] = cursor
+            
+            response = await self._call(self._client.search, **params)
+            for page in response.get("results", []):
+                edited = parse_notion_time(page.get("last_edited_time", ""))
+                if since is not None and edited is not None and edited < since:
+                    return pages
+                pages.append(page)
+            
+            cursor = response.get("next_cursor")
+            if not response.get("has_more") or not cursor:
+                return pages
+    
+    async def _get_block_tree(self, block_id: str, depth: int = 0) -> List[Dict[str, Any]]:
+        """블록의 하위 블록을 모든 페이지에 걸쳐 가져오고, 자식이 있는 블록은 재귀적으로 펼칩니다.
+        
+        토글, 컬럼, 중첩 목록 등의 내용이 부모 블록 바로 뒤에 depth와 함께 이어집니다.
+        하위 페이지/데이터베이스 블록은 별도 페이지로 수집되므로 펼치지 않습니다.
+        """
+        blocks = await self._paginate(self._client.blocks.children.list, block_id=block_id)
+        
+        # 같은 깊이의 하위 트리들은 동시에 가져오기
+        expandable = [
+            block for block in blocks
+            if block.get("has_children")
+            and block.get("type") not in ("child_page", "child_database")
+            and depth + 1 < self.rate_limits["max_block_depth"]
+        ]
+        subtrees = await asyncio.gather(*(self._get_block_tree(block["id"], depth + 1) for block in expandable))
+        children = {block["id"]: subtree for block, subtree in zip(expandable, subtrees)}
+        
+        content_blocks = []
+        for block in blocks:
+            block_content = self._extract_block_content(block)
+            if block_content:  # None이 아닌 경우만 추가 (빈 블록 제외)
+                block_content["depth"] = depth
+                content_blocks.append(block_content)
+            content_blocks.extend(children.get(block.get("id"), []))
+        
+        return content_blocks
+    
     async def search_pages(self, query: str, filter_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """페이지를 검색합니다."""
         return await self.execute_with_retry(self._search_pages_impl, query, filter_type)
@@ -272,10 +484,10 @@ class NotionMCP(BaseMCP):
             if query and query.strip():
                 search_params["query"] = query.strip()
             
-            response = self._client.search(**search_params)
+            results = await self._paginate(self._client.search, **search_params)
             
             pages = []
-            for page in response.get("results", []):
+            for page in results:
                 page_properties = page.get("properties", {})
                 smart_title = self._extract_smart_title(page_properties)
                 
@@ -305,13 +517,15 @@ class NotionMCP(BaseMCP):
             self.logger.info(f"최근 {hours}시간 변경사항 조회 중...")
             # 노션 API는 직접적인 변경사항 조회를 지원하지 않으므로
             # 검색을 통해 최근 수정된 페이지를 조회
-            response = self._client.search(
+            response = await self._call(
+                self._client.search,
                 filter={"property": "object", "value": "page"},
-                sort={"direction": "descending", "timestamp": "last_edited_time"}
+                sort={"direction": "descending", "timestamp": "last_edited_time"},
+                page_size=10  # 최근 10개만
             )
             
             changes = []
-            for page in response.get("results", [])[:10]:  # 최근 10개만
+            for page in response.get("results", []):
                 page_properties = page.get("properties", {})
                 smart_title = self._extract_smart_title(page_properties)
                 
@@ -341,7 +555,7 @@ class NotionMCP(BaseMCP):
             self.logger.info(f"사용자 {user_id} 활동 조회 중...")
             # 노션 API는 사용자별 활동 조회를 직접 지원하지 않으므로
             # 기본 정보만 반환
-            user_info = self._client.users.me()
+            user_info = await self._call(self._client.users.me)
             
             return {
                 "user_id": user_id,
@@ -590,7 +804,8 @@ def save_notion_data_to_files(data: Dict[str, Any], output_dir: str = "output/no
                         f.write(f"{text}\n\n")
                     elif 'list' in block_type:
                         prefix = "-" if "bulleted" in block_type else "1."
-                        f.write(f"{prefix} {text}\n")
+                        indent = "  " * block.get('depth', 0)
+                        f.write(f"{indent}{prefix} {text}\n")
                     else:
                         f.write(f"{text}\n\n")
             
@@ -672,24 +887,22 @@ async def main():
         databases = await notion.get_databases()
         print(f"   수집된 데이터베이스: {len(databases)}개")
         
-        # 각 데이터베이스의 항목들 수집
-        for db in databases:
-            entries = await notion.get_database_entries(db['id'])
+        # 각 데이터베이스의 항목들 동시 수집
+        all_entries = await asyncio.gather(*(notion.get_database_entries(db['id']) for db in databases))
+        for db, entries in zip(databases, all_entries):
             db['entries'] = entries
             print(f"   {db['title']}: {len(entries)}개 항목")
         
-        # 페이지 검색 및 내용 수집
-        search_results = await notion.search_pages("", None)  # 전체 페이지 검색
-        pages = []
+        # 페이지 내용 수집 (로컬 미러와 증분 동기화)
+        sync_result = await notion.sync_pages()
+        pages = sync_result["pages"]
+        sync_stats = sync_result["sync_stats"]
         
-        print(f"   전체 검색 결과: {len(search_results)}개 페이지")
+        print(f"   동기화({sync_stats['mode']}): {sync_stats['refetched_pages']}개 재수집, {sync_stats['changed_pages']}개 변경, 총 {len(pages)}개 페이지")
         
-        for i, result in enumerate(search_results, 1):
-            print(f"   [{i}/{len(search_results)}] 페이지 처리 중: {result.get('title', '제목 없음')}")
-            page_content = await notion.get_page_content(result['id'])
-            pages.append(page_content)
+        for i, page_content in enumerate(pages, 1):
             content_count = len(page_content.get('content', []))
-            print(f"      {page_content['title']}: {content_count}개 블록")
+            print(f"   [{i}/{len(pages)}] {page_content['title']}: {content_count}개 블록")
         
         # 3. 데이터 저장
         print("\n💾 3. 데이터 저장...")
@@ -0,0 +1,162 @@
+"""Local SQLite mirror of Notion pages for incremental sync."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    from ..constants.mcp import NOTION_SYNC_CONFIGS
+except ImportError:
+    from constants.mcp import NOTION_SYNC_CONFIGS
+
+
+def parse_notion_time(value: str) -> Optional[datetime]:
+    """Notion의 ISO 8601 시각 문자열("2024-08-16T10:00:00.000Z")을 datetime으로 변환합니다."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+class NotionMirror:
+    """수집한 Notion 페이지(내용, last_edited_time, 콘텐츠 해시)를 SQLite에 저장하는 클래스.
+
+    마지막 동기화 시작 시각을 커서로 저장해 두고, 다음 실행에서는
+    그 이후 수정된 페이지만 다시 가져오도록 합니다. 삭제(휴지통)되거나 보관된 페이지는
+    수정분 검색에 나타나지 않을 수 있으므로, 주기적인 전체 목록 조회로 사라진 페이지를 정리합니다.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = Path(db_path or NOTION_SYNC_CONFIGS["db_path"])
+        self.clock_skew = timedelta(minutes=NOTION_SYNC_CONFIGS["clock_skew_minutes"])
+
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS notion_pages (
+                page_id TEXT PRIMARY KEY,
+                title TEXT,
+                last_edited TEXT,
+                content_hash TEXT NOT NULL,
+                synced_at TEXT NOT NULL,
+                page_json TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS notion_sync_state (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def content_hash(page: Dict[str, Any]) -> str:
+        """페이지 제목과 블록 내용의 SHA-256 해시를 반환합니다."""
+        payload = json.dumps(
+            {"title": page.get("title", ""), "content": page.get("content", [])},
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_state(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM notion_sync_state WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO notion_sync_state (key, value) VALUES (?, ?)", (key, value)
+            )
+            self._conn.commit()
+
+    def get_cursor(self) -> Optional[datetime]:
+        """이 시각 이후 수정된 페이지만 다시 가져오면 되는 기준 시각을 반환합니다. (첫 동기화면 None)"""
+        value = self._get_state("last_sync_started_at")
+        if value is None:
+            return None
+        return datetime.fromisoformat(value) - self.clock_skew
+
+    def set_last_sync(self, started_at: datetime) -> None:
+        """동기화 시작 시각을 저장합니다. 동기화가 끝까지 성공한 뒤에만 호출해야 합니다."""
+        self._set_state("last_sync_started_at", started_at.isoformat())
+
+    def get_last_full_listing(self) -> Optional[datetime]:
+        """마지막으로 전체 페이지 목록을 조회해 미러를 정리한 시각을 반환합니다. (없으면 None)"""
+        value = self._get_state("last_full_listing_at")
+        return datetime.fromisoformat(value) if value else None
+
+    def set_last_full_listing(self, started_at: datetime) -> None:
+        """전체 페이지 목록 조회 시각을 저장합니다. 목록을 끝까지 받아 정리한 뒤에만 호출해야 합니다."""
+        self._set_state("last_full_listing_at", started_at.isoformat())
+
+    def upsert(self, page: Dict[str, Any]) -> bool:
+        """페이지를 저장합니다. 새 페이지이거나 내용이 바뀌었으면 True를 반환합니다."""
+        new_hash = self.content_hash(page)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash FROM notion_pages WHERE page_id = ?", (page["id"],)
+            ).fetchone()
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO notion_pages
+                    (page_id, title, last_edited, content_hash, synced_at, page_json)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    page["id"],
+                    page.get("title", ""),
+                    page.get("last_edited", ""),
+                    new_hash,
+                    datetime.now(timezone.utc).isoformat(),
+                    json.dumps(page, ensure_ascii=False)
+                )
+            )
+            self._conn.commit()
+        return row is None or row[0] != new_hash
+
+    def delete(self, page_ids: Iterable[str]) -> int:
+        """페이지를 미러에서 지우고 지운 개수를 반환합니다."""
+        page_ids = list(page_ids)
+        if not page_ids:
+            return 0
+        with self._lock:
+            deleted = self._conn.executemany(
+                "DELETE FROM notion_pages WHERE page_id = ?", [(page_id,) for page_id in page_ids]
+            ).rowcount
+            self._conn.commit()
+        return deleted
+
+    def prune(self, live_page_ids: Iterable[str]) -> int:
+        """전체 목록(live_page_ids)에 없는 페이지를 미러에서 지우고 지운 개수를 반환합니다."""
+        live_page_ids = set(live_page_ids)
+        with self._lock:
+            stale = [
+                page_id for (page_id,) in self._conn.execute("SELECT page_id FROM notion_pages")
+                if page_id not in live_page_ids
+            ]
+        return self.delete(stale)
+
+    def get_pages(self) -> List[Dict[str, Any]]:
+        """저장된 모든 페이지를 최근 수정순으로 반환합니다."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT page_json FROM notion_pages ORDER BY last_edited DESC"
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
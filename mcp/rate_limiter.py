@@ -0,0 +1,50 @@
+"""Async token-bucket rate limiter for MCP API clients."""
+
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """비동기 토큰 버킷 Rate Limiter.
+
+    초당 rate개의 토큰이 최대 capacity개까지 채워지며, acquire()는 토큰이
+    생길 때까지 대기합니다. 여러 코루틴이 같은 버킷을 공유해도 전체 요청
+    속도가 rate를 넘지 않습니다.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        """
+        Args:
+            rate: 초당 토큰 보충 속도
+            capacity: 버킷 최대 토큰 수 (순간 버스트 허용량)
+        """
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, capacity: int = 1) -> "AsyncTokenBucket":
+        """분당 요청 수로 버킷을 생성합니다."""
+        return cls(rate=requests_per_minute / 60.0, capacity=capacity)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """토큰을 하나 사용합니다. 부족하면 보충될 때까지 대기합니다."""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """서버가 Retry-After를 요구하면 그 시간 동안 토큰을 비웁니다."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0) - seconds * self.rate
@@ -10,12 +10,24 @@ from slack_sdk.errors import SlackApiError
 from dotenv import load_dotenv
 try:
     from .base_mcp import BaseMCP
+    from .rate_limiter import AsyncTokenBucket
+    from .keyword_matcher import KeywordMatcher
 except ImportError:
     # 직접 실행할 때를 위한 절대 경로
     import sys
     import os
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
     from base_mcp import BaseMCP
+    from rate_limiter import AsyncTokenBucket
+    from keyword_matcher import KeywordMatcher
+try:
+    from ..constants.mcp import SLACK_RATE_LIMITS
+except ImportError:
+    from constants.mcp import SLACK_RATE_LIMITS
+try:
+    from ..instrumentation import record_http_request, record_retry
+except ImportError:
+    from instrumentation import record_http_request, record_retry
 
 
 class SlackMCP(BaseMCP):
@@ -41,6 +53,72 @@ class SlackMCP(BaseMCP):
         # Slack 클라이언트 초기화
         if self.bot_token:
             self._client = AsyncWebClient(token=self.bot_token)
+        
+        # Web API tier별 토큰 버킷 (같은 tier의 메서드끼리 한도를 공유)
+        self.rate_limits = config.get("rate_limits", SLACK_RATE_LIMITS)
+        self._buckets = {
+            tier: AsyncTokenBucket.per_minute(per_minute)
+            for tier, per_minute in self.rate_limits["tiers"].items()
+        }
+        self._channel_semaphore = asyncio.Semaphore(self.rate_limits["max_concurrency"])
+    
+    async def _call(self, method: str, **kwargs) -> Any:
+        """Rate limit을 지키며 Slack Web API 메서드를 호출합니다.
+        
+        메서드의 tier 버킷에서 토큰을 받은 뒤 호출하고, 429 응답을 받으면
+        Retry-After 헤더만큼 해당 tier 전체를 멈춘 후 재시도합니다.
+        
+        Args:
+            method: Slack API 메서드 이름 (예: "conversations.history")
+            **kwargs: API 파라미터
+        """
+        tier = self.rate_limits["methods"].get(method, self.rate_limits["default_tier"])
+        bucket = self._buckets[tier]
+        api = getattr(self._client, method.replace(".", "_"))
+        
+        for attempt in range(self.rate_limits["max_rate_limit_retries"] + 1):
+            await bucket.acquire()
+            record_http_request("slack")
+            try:
+                return await api(**kwargs)
+            except SlackApiError as e:
+                if e.response.status_code != 429 or attempt >= self.rate_limits["max_rate_limit_retries"]:
+                    raise
+                retry_after = float(e.response.headers.get("Retry-After", 1))
+                self.logger.warning(f"{method} rate limited, {retry_after}초 후 재시도")
+                record_retry("slack")
+                bucket.pause(retry_after)
+    
+    async def _paginate(self, method: str, items_key: str, limit: Optional[int] = None, **kwargs) -> List[Dict[str, Any]]:
+        """cursor 기반 페이지네이션으로 모든 항목을 가져옵니다.
+        
+        Args:
+            method: Slack API 메서드 이름
+            items_key: 응답에서 항목 목록이 들어 있는 키 (예: "messages")
+            limit: 최대 항목 수 (None이면 끝까지)
+            **kwargs: API 파라미터
+        """
+        items = []
+        cursor = None
+        while True:
+            page_size = self.rate_limits["page_size"]
+            if limit is not None:
+                page_size = min(page_size, limit - len(items))
+            
+            params = dict(kwargs, limit=page_size)
+            if cursor:
+                params["cursor"] = cursor
+            
+            response = await self._call(method, **params)
+            if not response["ok"]:
+                raise SlackApiError(f"{method} 조회 실패", response)
+            
+            items.extend(response.get(items_key, []))
+            cursor = (response.get("response_metadata") or {}).get("next_cursor")
+            if not cursor or (limit is not None and len(items) >= limit):
+                break
+        
+        return items if limit is None else items[:limit]
     
     async def connect(self) -> bool:
         """Slack API에 연결하고 인증을 확인합니다."""
@@ -137,7 +215,7 @@ class SlackMCP(BaseMCP):
         """워크스페이스 정보를 가져오는 실제 구현."""
         try:
             # 팀 정보 가져오기
-            team_info = await self._client.team_info()
+            team_info = await self._call("team.info")
             
             if not team_info["ok"]:
                 raise SlackApiError("팀 정보 조회 실패", team_info)
@@ -147,9 +225,8 @@ class SlackMCP(BaseMCP):
             # 사용자 목록 가져오기 (멤버 수 계산용) - Rate Limiting 방지를 위해 선택적으로
             member_count = "N/A"
             try:
-                users_list = await self._client.users_list()
-                if users_list["ok"]:
-                    member_count = len([u for u in users_list.get("members", []) if not u.get("deleted", False)])
+                members = await self._paginate("users.list", "members")
+                member_count = len([u for u in members if not u.get("deleted", False)])
             except Exception as e:
                 self.logger.warning(f"사용자 목록 조회 건너뜀 (Rate Limiting 방지): {e}")
             
@@ -184,62 +261,45 @@ class SlackMCP(BaseMCP):
         try:
             channels = []
             
-            # 채널 가져오기 - 권한에 따라 조정
+            # 채널 가져오기 - 권한에 따라 조정 (cursor 페이지네이션)
             try:
                 if include_private:
                     # 비공개 채널도 포함하려고 시도
-                    conversations = await self._client.conversations_list(
+                    conversations = await self._paginate(
+                        "conversations.list", "channels",
                         types="public_channel,private_channel"
                     )
                 else:
                     # 공개 채널만
-                    conversations = await self._client.conversations_list(
+                    conversations = await self._paginate(
+                        "conversations.list", "channels",
                         types="public_channel"
                     )
             except SlackApiError as e:
                 if "missing_scope" in str(e) and "groups:read" in str(e):
                     # groups:read 권한이 없으면 공개 채널만 조회 (조용히 처리)
-                    conversations = await self._client.conversations_list(
+                    conversations = await self._paginate(
+                        "conversations.list", "channels",
                         types="public_channel"
                     )
                 else:
                     raise
             
-            if not conversations["ok"]:
-                raise SlackApiError("채널 목록 조회 실패", conversations)
-            
-            for channel in conversations.get("channels", []):
-                # 채널 상세 정보 가져오기
-                channel_info = await self._client.conversations_info(channel=channel["id"])
-                
-                if channel_info["ok"]:
-                    ch = channel_info["channel"]
-                    
-                    # 채널 멤버 수 가져오기
-                    try:
-                        members = await self._client.conversations_members(channel=channel["id"])
-                        member_count = len(members.get("members", [])) if members["ok"] else 0
-                    except SlackApiError as e:
-                        if "not_in_channel" in str(e):
-                            # 봇이 채널에 참여하지 않은 경우 (조용히 처리)
-                            member_count = "N/A"
-                        else:
-                            member_count = 0
-                    except Exception:
-                        member_count = 0
-                    
-                    channel_data = {
-                        "id": ch["id"],
-                        "name": ch["name"],
-                        "is_private": ch.get("is_private", False),
-                        "is_archived": ch.get("is_archived", False),
-                        "member_count": member_count,
-                        "topic": ch.get("topic", {}).get("value", ""),
-                        "purpose": ch.get("purpose", {}).get("value", ""),
-                        "created": datetime.fromtimestamp(ch["created"]).isoformat() + "Z" if ch.get("created") else None,
-                        "creator": ch.get("creator")
-                    }
-                    channels.append(channel_data)
+            # conversations.list 응답에 채널 상세 정보와 멤버 수가 포함되어 있으므로
+            # 채널마다 conversations.info / conversations.members를 다시 호출하지 않음
+            for ch in conversations:
+                channel_data = {
+                    "id": ch["id"],
+                    "name": ch["name"],
+                    "is_private": ch.get("is_private", False),
+                    "is_archived": ch.get("is_archived", False),
+                    "member_count": ch.get("num_members", "N/A"),
+                    "topic": ch.get("topic", {}).get("value", ""),
+                    "purpose": ch.get("purpose", {}).get("value", ""),
+                    "created": datetime.fromtimestamp(ch["created"]).isoformat() + "Z" if ch.get("created") else None,
+                    "creator": ch.get("creator")
+                }
+                channels.append(channel_data)
             
             # 개별 저장 제거 - 통합 저장에서 처리
             
@@ -252,28 +312,45 @@ class SlackMCP(BaseMCP):
             self.logger.error(f"채널 정보 처리 실패: {e}")
             raise
     
-    async def get_channel_messages(self, channel_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+    async def get_channel_messages(self, channel_id: str, limit: int = 100, oldest: Optional[str] = None) -> List[Dict[str, Any]]:
         """채널의 메시지를 가져옵니다."""
-        return await self.execute_with_retry(self._get_channel_messages_impl, channel_id, limit)
+        return await self.execute_with_retry(self._get_channel_messages_impl, channel_id, limit, oldest)
+    
+    async def get_channels_messages(
+        self,
+        channels: List[Dict[str, Any]],
+        limit: int = 100,
+        oldest: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """여러 채널의 메시지를 동시에 가져옵니다.
+        
+        동시 처리 채널 수는 max_concurrency로, 전체 요청 속도는
+        conversations.history의 tier 버킷으로 제한됩니다.
+        
+        Returns:
+            채널 ID별 메시지 목록 (실패한 채널은 빈 리스트)
+        """
+        async def fetch(channel: Dict[str, Any]) -> List[Dict[str, Any]]:
+            async with self._channel_semaphore:
+                try:
+                    return await self.get_channel_messages(channel["id"], limit=limit, oldest=oldest)
+                except Exception as e:
+                    self.logger.warning(f"채널 {channel.get('name', channel['id'])} 메시지 수집 실패: {e}")
+                    return []
+        
+        results = await asyncio.gather(*(fetch(channel) for channel in channels))
+        return {channel["id"]: messages for channel, messages in zip(channels, results)}
     
-    async def _get_channel_messages_impl(self, channel_id: str, limit: int = 100) -> List[Dict[str, Any]]:
-        """채널 메시지를 가져오는 실제 구현."""
+    async def _get_channel_messages_impl(self, channel_id: str, limit: int = 100, oldest: Optional[str] = None) -> List[Dict[str, Any]]:
+        """채널 메시지를 가져오는 실제 구현. (cursor로 limit까지 페이지네이션)"""
         try:
-            messages = []
+            params = {"channel": channel_id}
+            if oldest:
+                params["oldest"] = oldest
             
             # 채널 히스토리 가져오기 (최근 메시지부터)
             try:
-                history = await self._client.conversations_history(
-                    channel=channel_id,
-                    limit=min(limit, 1000)  # Slack API 제한
-                )
-                
-                if not history["ok"]:
-                    if history.get("error") == "not_in_channel":
-                        # 봇이 채널에 참여하지 않은 경우 조용히 처리
-                        return []
-                    else:
-                        raise SlackApiError("메시지 히스토리 조회 실패", history)
+                history = await self._paginate("conversations.history", "messages", limit=limit, **params)
             except SlackApiError as e:
                 if "not_in_channel" in str(e):
                     # 봇이 채널에 참여하지 않은 경우 조용히 빈 리스트 반환
@@ -281,45 +358,9 @@ class SlackMCP(BaseMCP):
                 else:
                     raise
             
-            for message in history.get("messages", []):
-                # 메시지 데이터 정리
-                message_data = {
-                    "id": message.get("ts"),
-                    "channel_id": channel_id,
-                    "user_id": message.get("user"),
-                    "text": message.get("text", ""),
-                    "timestamp": datetime.fromtimestamp(float(message["ts"])).isoformat() + "Z",
-                    "thread_ts": message.get("thread_ts"),
-                    "reply_count": message.get("reply_count", 0),
-                    "reactions": []
-                }
-                
-                # 반응(이모지) 정보 추가
-                if "reactions" in message:
-                    for reaction in message["reactions"]:
-                        message_data["reactions"].append({
-                            "name": reaction["name"],
-                            "count": reaction["count"],
-                            "users": reaction.get("users", [])
-                        })
-                
-                # 첨부 파일 정보 추가
-                if "files" in message:
-                    message_data["files"] = []
-                    for file in message["files"]:
-                        message_data["files"].append({
-                            "id": file.get("id"),
-                            "name": file.get("name"),
-                            "mimetype": file.get("mimetype"),
-                            "size": file.get("size"),
-                            "url": file.get("url_private")
-                        })
-                
-                messages.append(message_data)
-            
             # 개별 저장 제거 - 통합 저장에서 처리
             
-            return messages[:limit]
+            return [self._format_message(message, channel_id) for message in history]
             
         except SlackApiError as e:
             self.logger.error(f"채널 메시지 조회 실패: {e}")
@@ -328,6 +369,42 @@ class SlackMCP(BaseMCP):
             self.logger.error(f"메시지 처리 실패: {e}")
             raise
     
+    def _format_message(self, message: Dict[str, Any], channel_id: str) -> Dict[str, Any]:
+        """Slack 메시지를 저장용 형식으로 정리합니다."""
+        message_data = {
+            "id": message.get("ts"),
+            "channel_id": channel_id,
+            "user_id": message.get("user"),
+            "text": message.get("text", ""),
+            "timestamp": datetime.fromtimestamp(float(message["ts"])).isoformat() + "Z",
+            "thread_ts": message.get("thread_ts"),
+            "reply_count": message.get("reply_count", 0),
+            "reactions": []
+        }
+        
+        # 반응(이모지) 정보 추가
+        if "reactions" in message:
+            for reaction in message["reactions"]:
+                message_data["reactions"].append({
+                    "name": reaction["name"],
+                    "count": reaction["count"],
+                    "users": reaction.get("users", [])
+                })
+        
+        # 첨부 파일 정보 추가
+        if "files" in message:
+            message_data["files"] = []
+            for file in message["files"]:
+                message_data["files"].append({
+                    "id": file.get("id"),
+                    "name": file.get("name"),
+                    "mimetype": file.get("mimetype"),
+                    "size": file.get("size"),
+                    "url": file.get("url_private")
+                })
+        
+        return message_data
+    
     async def get_user_info(self, user_id: str) -> Optional[Dict[str, Any]]:
         """사용자 정보를 가져옵니다."""
         return await self.execute_with_retry(self._get_user_info_impl, user_id)
@@ -336,7 +413,7 @@ class SlackMCP(BaseMCP):
         """사용자 정보를 가져오는 실제 구현."""
         try:
             # 사용자 정보 가져오기
-            user_info = await self._client.users_info(user=user_id)
+            user_info = await self._call("users.info", user=user_id)
             
             if not user_info["ok"]:
                 if user_info.get("error") == "user_not_found":
@@ -391,7 +468,8 @@ class SlackMCP(BaseMCP):
                 search_query = f"{query} {channel_filter}"
             
             # 메시지 검색
-            search_result = await self._client.search_messages(
+            search_result = await self._call(
+                "search.messages",
                 query=search_query,
                 sort="timestamp",
                 sort_dir="desc"
@@ -456,74 +534,10 @@ class SlackMCP(BaseMCP):
             # 채널 목록 가져오기
             channels = await self.get_channels(include_private=True)
             
-            activity_data = {
-                "period_hours": hours,
-                "start_time": start_time.isoformat() + "Z",
-                "end_time": end_time.isoformat() + "Z",
-                "total_messages": 0,
-                "active_channels": 0,
-                "active_users": set(),
-                "channel_activity": {},
-                "user_activity": {}
-            }
+            # 각 채널의 최근 메시지를 동시에 가져오기 (고정 지연 대신 tier 버킷으로 제한)
+            channel_messages = await self.get_channels_messages(channels, limit=1000, oldest=oldest_ts)
             
-            # 각 채널의 최근 활동 분석
-            for channel in channels:
-                try:
-                    # Rate Limiting 방지를 위한 지연
-                    await asyncio.sleep(1.0)  # Rate Limiting 방지를 위해 딜레이 증가
-                    
-                    # 채널의 최근 메시지 가져오기
-                    history = await self._client.conversations_history(
-                        channel=channel["id"],
-                        oldest=oldest_ts,
-                        limit=1000
-                    )
-                    
-                    if history["ok"]:
-                        messages = history.get("messages", [])
-                        if messages:
-                            activity_data["active_channels"] += 1
-                            activity_data["total_messages"] += len(messages)
-                            activity_data["channel_activity"][channel["name"]] = len(messages)
-                            
-                            # 사용자별 메시지 수 계산
-                            for message in messages:
-                                user_id = message.get("user")
-                                if user_id:
-                                    activity_data["active_users"].add(user_id)
-                                    if user_id not in activity_data["user_activity"]:
-                                        activity_data["user_activity"][user_id] = 0
-                                    activity_data["user_activity"][user_id] += 1
-                                    
-                except Exception as e:
-                    self.logger.warning(f"채널 {channel['name']} 활동 분석 실패: {e}")
-                    continue
-            
-            # 상위 채널 및 사용자 정렬
-            top_channels = sorted(
-                activity_data["channel_activity"].items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]
-            
-            top_users = sorted(
-                activity_data["user_activity"].items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]
-            
-            # 최종 결과 구성
-            result = {
-            "period_hours": hours,
-                "start_time": activity_data["start_time"],
-                "end_time": activity_data["end_time"],
-                "total_messages": activity_data["total_messages"],
-                "active_channels": activity_data["active_channels"],
-                "active_users": len(activity_data["active_users"]),
-                "top_channels": [{"channel": ch, "message_count": count} for ch, count in top_channels],
-                "top_users": [{"user_id": user, "message_count": count} for user, count in top_users]
-            }
+            result = self._compute_recent_activity(channels, channel_messages, hours, end_time)
             
             # 개별 저장 제거 - 통합 저장에서 처리
             
@@ -533,6 +547,104 @@ class SlackMCP(BaseMCP):
             self.logger.error(f"최근 활동 분석 실패: {e}")
             raise
     
+    def _compute_recent_activity(
+        self,
+        channels: List[Dict[str, Any]],
+        channel_messages: Dict[str, List[Dict[str, Any]]],
+        hours: int,
+        end_time: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """이미 가져온 메시지로 기간 내 채널/사용자 활동 통계를 계산합니다."""
+        end_time = end_time or datetime.now()
+        start_time = end_time - timedelta(hours=hours)
+        oldest = start_time.timestamp()
+        
+        channel_activity = {}
+        user_activity = {}
+        total_messages = 0
+        
+        for channel in channels:
+            messages = [
+                message for message in channel_messages.get(channel["id"], [])
+                if float(message["id"]) >= oldest
+            ]
+            if not messages:
+                continue
+            
+            total_messages += len(messages)
+            channel_activity[channel["name"]] = len(messages)
+            
+            # 사용자별 메시지 수 계산
+            for message in messages:
+                user_id = message.get("user_id")
+                if user_id:
+                    user_activity[user_id] = user_activity.get(user_id, 0) + 1
+        
+        # 상위 채널 및 사용자 정렬
+        top_channels = sorted(channel_activity.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_users = sorted(user_activity.items(), key=lambda x: x[1], reverse=True)[:10]
+        
+        return {
+            "period_hours": hours,
+            "start_time": start_time.isoformat() + "Z",
+            "end_time": end_time.isoformat() + "Z",
+            "total_messages": total_messages,
+            "active_channels": len(channel_activity),
+            "active_users": len(user_activity),
+            "top_channels": [{"channel": ch, "message_count": count} for ch, count in top_channels],
+            "top_users": [{"user_id": user, "message_count": count} for user, count in top_users]
+        }
+    
+    def _match_keywords(
+        self,
+        channels: List[Dict[str, Any]],
+        channel_messages: Dict[str, List[Dict[str, Any]]],
+        keywords: List[str]
+    ) -> List[Dict[str, Any]]:
+        """이미 가져온 메시지에서 키워드가 포함된 메시지를 찾습니다. (최신순)"""
+        matcher = KeywordMatcher(keywords)
+        channel_names = {channel["id"]: channel["name"] for channel in channels}
+        
+        matched = []
+        for channel_id, messages in channel_messages.items():
+            for message in messages:
+                found = matcher.find(message.get("text", ""))
+                if found:
+                    matched.append({
+                        **message,
+                        "channel_name": channel_names.get(channel_id, "unknown"),
+                        "matched_keywords": sorted(found)
+                    })
+        
+        matched.sort(key=lambda message: float(message["id"]), reverse=True)
+        return matched
+    
+    async def get_workspace_snapshot(
+        self,
+        hours: int = 168,
+        limit: int = 1000,
+        keywords: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """채널 목록과 히스토리를 한 번만 가져와 메시지, 최근 활동, 키워드 매칭을 함께 계산합니다.
+        
+        get_recent_activity와 키워드별 search_messages 호출을 대체하여
+        같은 히스토리를 여러 번 읽지 않습니다.
+        
+        Args:
+            hours: 최근 활동 집계 기간 (시간)
+            limit: 채널별 최대 메시지 수
+            keywords: 찾을 키워드 목록
+        """
+        channels = await self.get_channels(include_private=True)
+        channel_messages = await self.get_channels_messages(channels, limit=limit)
+        
+        return {
+            "channels": channels,
+            "channel_messages": channel_messages,
+            "recent_activity": self._compute_recent_activity(channels, channel_messages, hours),
+            "keyword_messages": self._match_keywords(channels, channel_messages, keywords or [])
+        }
+    
     async def _save_data(self, data: Any, filename: str) -> None:
         """데이터를 JSON 파일로 저장합니다."""
         try:
@@ -609,18 +721,11 @@ class SlackMCP(BaseMCP):
             channels = await self.get_channels(include_private=True)
             collected_data["channels"] = channels
             
-            # 3. 각 채널의 메시지 수집
+            # 3. 각 채널의 메시지 수집 (채널 동시 처리)
+            self.logger.info(f"채널 {len(channels)}개 메시지 수집 중...")
+            channel_messages = await self.get_channels_messages(channels, limit=500)
             for channel in channels:
-                try:
-                    self.logger.info(f"채널 '{channel['name']}' 메시지 수집 중...")
-                    messages = await self.get_channel_messages(channel["id"], limit=500)
-                    collected_data["messages"][channel["name"]] = messages
-                    
-                    # 사용자 정보 수집 제거 (Rate Limiting 방지)
-                                
-                except Exception as e:
-                    self.logger.error(f"채널 '{channel['name']}' 데이터 수집 실패: {e}")
-                    continue
+                collected_data["messages"][channel["name"]] = channel_messages.get(channel["id"], [])
             
             # 4. 최근 활동 분석
             self.logger.info("최근 활동 분석 중...")
@@ -1,16 +1,25 @@
 """Orchestrator Graph for the multi-agent workflow system."""
 
-from typing import Dict, Any
-from langgraph.graph import StateGraph, END
+from typing import Dict, Any, List, Optional
+from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
 
 from .state import WorkflowState
-from .constants import AGENT_NAMES, WORKFLOW_STEP_ORDER
+from .constants import (
+    AGENT_NAMES,
+    AGENT_EXECUTION_ORDER,
+    WORKFLOW_STEP_ORDER,
+    WORKFLOW_STEP_AGENTS,
+    WORKFLOW_EXECUTION_MODES,
+    WORKFLOW_PARALLEL_STEPS,
+    WORKFLOW_CONFIGS
+)
 from .agents import (
     OrchestratorAgent,
     PersonalizeAgent,
     QueryWriterAgent,
     SearcherAgent,
+    QuerySearcherAgent,
     KnowledgeGraphAgent,
     KGSearchAgent,
     DBConstructorAgent,
@@ -21,61 +30,113 @@ from .agents import (
 )
 
 
-def create_orchestrator_graph() -> StateGraph:
-    """멀티 에이전트 워크플로우를 위한 오케스트레이터 그래프를 생성합니다."""
-    
+def _default_execution_mode() -> str:
+    """WORKFLOW_CONFIGS 설정에 따른 기본 실행 모드를 반환합니다."""
+    if WORKFLOW_CONFIGS.get("parallel_execution", False):
+        return WORKFLOW_EXECUTION_MODES["HYBRID"]
+    return WORKFLOW_EXECUTION_MODES["SEQUENTIAL"]
+
+
+def _build_stages(execution_mode: str) -> List[List[str]]:
+    """에이전트 실행 순서를 단계(stage) 목록으로 묶습니다.
+
+    같은 단계에 속한 에이전트들은 동시에 실행(fan-out)되고,
+    다음 단계는 모든 에이전트가 끝난 뒤 실행(fan-in)됩니다.
+    """
+    stages = [[agent_name] for agent_name in AGENT_EXECUTION_ORDER]
+    if execution_mode == WORKFLOW_EXECUTION_MODES["SEQUENTIAL"]:
+        return stages
+
+    for step_group in WORKFLOW_PARALLEL_STEPS:
+        group = [WORKFLOW_STEP_AGENTS[step] for step in step_group]
+        positions = [i for i, stage in enumerate(stages) if stage[0] in group]
+        if len(positions) != len(group):
+            continue
+
+        # 그룹의 첫 위치에 병렬 단계를 두고 나머지 단독 단계는 제거
+        first = positions[0]
+        stages = [
+            stage for i, stage in enumerate(stages)
+            if i == first or i not in positions
+        ]
+        stages[first] = group
+
+    return stages
+
+
+def build_orchestrator_graph(execution_mode: Optional[str] = None) -> StateGraph:
+    """멀티 에이전트 워크플로우 그래프를 컴파일하지 않은 상태로 구성합니다.
+
+    체크포인터를 붙여 다시 컴파일할 수 있도록 그래프 구성과 컴파일을 분리합니다.
+
+    Args:
+        execution_mode: WORKFLOW_EXECUTION_MODES 값. 지정하지 않으면
+            WORKFLOW_CONFIGS["parallel_execution"]에 따라 결정됩니다.
+            sequential 이외의 모드에서는 WORKFLOW_PARALLEL_STEPS에 정의된
+            단계들(개인화, 탐색)을 동시에 실행합니다.
+    """
+    execution_mode = execution_mode or _default_execution_mode()
+
     # 워크플로우 그래프 생성
     workflow = StateGraph(WorkflowState)
-    
+
     # 에이전트 인스턴스 생성
-    orchestrator = OrchestratorAgent()
-    personalize = PersonalizeAgent()
-    query_writer = QueryWriterAgent()
-    searcher = SearcherAgent()
-    knowledge_graph = KnowledgeGraphAgent()
-    kg_search = KGSearchAgent()
-    db_constructor = DBConstructorAgent()
-    researcher = ResearcherAgent()
-    critic = CriticAgent()
-    script_writer = ScriptWriterAgent()
-    tts = TTSAgent()
-    
-    # 노드 추가
-    workflow.add_node(AGENT_NAMES["ORCHESTRATOR"], orchestrator.process)
-    workflow.add_node(AGENT_NAMES["PERSONALIZE"], personalize.process)
-    workflow.add_node(AGENT_NAMES["QUERY_WRITER"], query_writer.process)
-    workflow.add_node(AGENT_NAMES["SEARCHER"], searcher.process)
-    workflow.add_node(AGENT_NAMES["KNOWLEDGE_GRAPH"], knowledge_graph.process)
-    workflow.add_node(AGENT_NAMES["KG_SEARCH"], kg_search.process)
-    workflow.add_node(AGENT_NAMES["DB_CONSTRUCTOR"], db_constructor.process)
-    workflow.add_node(AGENT_NAMES["RESEARCHER"], researcher.process)
-    workflow.add_node(AGENT_NAMES["CRITIC"], critic.process)
-    workflow.add_node(AGENT_NAMES["SCRIPT_WRITER"], script_writer.process)
-    workflow.add_node(AGENT_NAMES["TTS"], tts.process)
-    
-    # 엣지 추가 - 순차적 실행
-    workflow.add_edge(AGENT_NAMES["ORCHESTRATOR"], AGENT_NAMES["PERSONALIZE"])
-    workflow.add_edge(AGENT_NAMES["PERSONALIZE"], AGENT_NAMES["SEARCHER"])
-    workflow.add_edge(AGENT_NAMES["SEARCHER"], AGENT_NAMES["KNOWLEDGE_GRAPH"])
-    workflow.add_edge(AGENT_NAMES["KNOWLEDGE_GRAPH"], AGENT_NAMES["QUERY_WRITER"])
-    workflow.add_edge(AGENT_NAMES["QUERY_WRITER"], AGENT_NAMES["KG_SEARCH"])
-    workflow.add_edge(AGENT_NAMES["KG_SEARCH"], AGENT_NAMES["DB_CONSTRUCTOR"])
-    workflow.add_edge(AGENT_NAMES["DB_CONSTRUCTOR"], AGENT_NAMES["RESEARCHER"])
-    workflow.add_edge(AGENT_NAMES["RESEARCHER"], AGENT_NAMES["CRITIC"])
-    workflow.add_edge(AGENT_NAMES["CRITIC"], AGENT_NAMES["SCRIPT_WRITER"])
-    workflow.add_edge(AGENT_NAMES["SCRIPT_WRITER"], AGENT_NAMES["TTS"])
-    workflow.add_edge(AGENT_NAMES["TTS"], END)
-    
-    # 워크플로우 컴파일
-    app = workflow.compile()
-    
+    agents = {
+        AGENT_NAMES["ORCHESTRATOR"]: OrchestratorAgent(),
+        AGENT_NAMES["PERSONALIZE"]: PersonalizeAgent(),
+        AGENT_NAMES["QUERY_WRITER"]: QueryWriterAgent(),
+        AGENT_NAMES["SEARCHER"]: SearcherAgent(),
+        AGENT_NAMES["QUERY_SEARCHER"]: QuerySearcherAgent(),
+        AGENT_NAMES["KNOWLEDGE_GRAPH"]: KnowledgeGraphAgent(),
+        AGENT_NAMES["KG_SEARCH"]: KGSearchAgent(),
+        AGENT_NAMES["DB_CONSTRUCTOR"]: DBConstructorAgent(),
+        AGENT_NAMES["RESEARCHER"]: ResearcherAgent(),
+        AGENT_NAMES["CRITIC"]: CriticAgent(),
+        AGENT_NAMES["SCRIPT_WRITER"]: ScriptWriterAgent(),
+        AGENT_NAMES["TTS"]: TTSAgent()
+    }
+    stages = _build_stages(execution_mode)
+
+    # 노드 추가 - 에이전트는 변경된 필드만 반환하고, 병렬 단계에서 같은 필드를
+    # 갱신하는 workflow_status / artifacts는 필드별 리듀서가 병합
+    for stage in stages:
+        for agent_name in stage:
+            workflow.add_node(agent_name, agents[agent_name].process)
+
+    # 엣지 추가 - 단계 사이는 순차, 단계 내부는 fan-out / fan-in
+    workflow.add_edge(START, stages[0][0])
+    for current_stage, next_stage in zip(stages, stages[1:]):
+        if len(current_stage) > 1:
+            for agent_name in next_stage:
+                workflow.add_edge(current_stage, agent_name)
+        else:
+            for agent_name in next_stage:
+                workflow.add_edge(current_stage[0], agent_name)
+    for agent_name in stages[-1]:
+        workflow.add_edge(agent_name, END)
+
     # 워크플로우 정보 출력
     print(f"워크플로우 생성 완료:")
+    print(f"실행 모드: {execution_mode}")
     print(f"총 단계 수: {len(WORKFLOW_STEP_ORDER)}")
-    print(f"단계 순서: {' -> '.join(WORKFLOW_STEP_ORDER)}")
-    
-    return app
+    print(f"단계 순서: {' -> '.join(' | '.join(stage) for stage in stages)}")
+
+    return workflow
+
+
+def create_orchestrator_graph(execution_mode: Optional[str] = None, checkpointer=None):
+    """멀티 에이전트 워크플로우를 위한 오케스트레이터 그래프를 생성합니다.
+
+    Args:
+        execution_mode: WORKFLOW_EXECUTION_MODES 값 (build_orchestrator_graph 참고)
+        checkpointer: LangGraph 체크포인터. 지정하면 노드 실행마다 상태를 저장하여
+            실패한 실행을 thread_id(run_id)로 이어서 실행할 수 있습니다.
+    """
+    return build_orchestrator_graph(execution_mode).compile(checkpointer=checkpointer)
+
 
+# 메인 워크플로우 그래프 (체크포인터를 붙여 다시 컴파일할 수 있도록 보관)
+main_graph = build_orchestrator_graph()
 
 # 메인 워크플로우 인스턴스
-main_workflow = create_orchestrator_graph()
+main_workflow = main_graph.compile()
@@ -1,13 +1,30 @@
 """Main script for running the multi-agent workflow."""
 
+import argparse
 import asyncio
 import sys
+import uuid
 from datetime import datetime
-from typing import Dict, Any
+from pathlib import Path
+from typing import Dict, Any, Optional
 
-from .state import WorkflowState
-from .constants import WORKFLOW_STEPS, WORKFLOW_STEP_DESCRIPTIONS, WORKFLOW_STEP_ORDER
-from .orchestrator_graph import main_workflow
+from .state import WorkflowState, apply_update
+from .constants import (
+    AGENT_EXECUTION_ORDER,
+    WORKFLOW_CONFIGS,
+    WORKFLOW_STEPS,
+    WORKFLOW_STEP_DESCRIPTIONS,
+    WORKFLOW_STEP_ORDER
+)
+from .orchestrator_graph import main_graph, main_workflow
+from .instrumentation import start_run
+
+# SQLite 체크포인터 (langgraph-checkpoint-sqlite)
+try:
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    CHECKPOINT_SQLITE_AVAILABLE = True
+except ImportError:
+    CHECKPOINT_SQLITE_AVAILABLE = False
 
 
 def _get_agent_for_step(step_name: str):
@@ -25,6 +42,9 @@ def _get_agent_for_step(step_name: str):
         elif step_name == "searcher":
             from .agents import SearcherAgent
             return SearcherAgent()
+        elif step_name == "query_searcher":
+            from .agents import QuerySearcherAgent
+            return QuerySearcherAgent()
         elif step_name == "db_constructor":
             from .agents import DBConstructorAgent
             return DBConstructorAgent()
@@ -47,17 +67,90 @@ def _get_agent_for_step(step_name: str):
         return None
 
 
-async def run_workflow(user_query: str) -> Dict[str, Any]:
-    """멀티 에이전트 워크플로우를 실행합니다."""
+def _new_run_id() -> str:
+    """새 실행의 run_id(체크포인트 thread_id)를 생성합니다."""
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+
+async def _find_step_checkpoint(workflow, config: Dict[str, Any], step_name: str) -> Optional[Dict[str, Any]]:
+    """step_name 노드가 실행되기 직전의 체크포인트 설정을 찾습니다. (가장 최근 것 우선)"""
+    async for snapshot in workflow.aget_state_history(config):
+        if step_name in snapshot.next:
+            return snapshot.config
+    return None
+
+
+async def _invoke_with_checkpoints(
+    initial_state: WorkflowState,
+    run_id: str,
+    resume: bool,
+    from_step: Optional[str]
+):
+    """SQLite 체크포인터를 붙여 워크플로우를 실행하거나 이어서 실행합니다.
+    
+    노드가 끝날 때마다 상태가 run_id(thread_id)별로 저장되므로, 실패한 실행은
+    마지막 체크포인트(또는 지정한 단계 직전)부터 다시 시작할 수 있습니다.
+    """
+    db_path = Path(WORKFLOW_CONFIGS["checkpoint_db_path"])
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    async with AsyncSqliteSaver.from_conn_string(str(db_path)) as checkpointer:
+        workflow = main_graph.compile(checkpointer=checkpointer)
+        config = {"configurable": {"thread_id": run_id}}
+        
+        if not resume:
+            # 체크포인트에 dataclass 객체 대신 필드 값만 저장되도록 dict로 전달
+            return await workflow.ainvoke(vars(initial_state), config=config)
+        
+        snapshot = await workflow.aget_state(config)
+        if not snapshot.values:
+            raise ValueError(f"run_id '{run_id}'의 체크포인트를 찾을 수 없습니다.")
+        
+        if from_step:
+            step_config = await _find_step_checkpoint(workflow, config, from_step)
+            if step_config is None:
+                raise ValueError(f"run_id '{run_id}'에서 '{from_step}' 단계 직전의 체크포인트를 찾을 수 없습니다.")
+            print(f"⏪ '{from_step}' 단계부터 다시 실행합니다.")
+            return await workflow.ainvoke(None, config=step_config)
+        
+        if not snapshot.next:
+            print("ℹ️  이미 완료된 실행입니다. 저장된 최종 상태를 반환합니다.")
+            return snapshot.values
+        
+        print(f"⏩ '{', '.join(snapshot.next)}' 단계부터 이어서 실행합니다.")
+        return await workflow.ainvoke(None, config=config)
+
+
+async def run_workflow(
+    user_query: Optional[str] = None,
+    run_id: Optional[str] = None,
+    resume: bool = False,
+    from_step: Optional[str] = None
+) -> Dict[str, Any]:
+    """멀티 에이전트 워크플로우를 실행합니다.
+    
+    Args:
+        user_query: 사용자 쿼리 (재개 시에는 체크포인트의 쿼리를 사용)
+        run_id: 실행 ID. 새 실행이면 생략 시 자동 생성, 재개 시에는 필수
+        resume: True면 run_id의 마지막 체크포인트부터 이어서 실행
+        from_step: resume과 함께 사용하면 해당 단계 직전 체크포인트부터 다시 실행
+    """
+    if (resume or from_step) and not run_id:
+        raise ValueError("재개하려면 run_id가 필요합니다.")
+    resume = resume or from_step is not None
+    run_id = run_id or _new_run_id()
+    tracer = start_run(run_id, resume=resume)
     
     print("🚀 멀티 에이전트 워크플로우 시작")
-    print(f"📝 사용자 쿼리: {user_query}")
+    print(f"🆔 실행 ID: {run_id}")
+    if not resume:
+        print(f"📝 사용자 쿼리: {user_query}")
     print(f"⏰ 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("-" * 60)
     
     # 초기 상태 생성
     initial_state = WorkflowState(
-        user_query=user_query,
+        user_query=user_query or "",
         workflow_status={
             "status": "starting",
             "current_step": "initialization",
@@ -75,7 +168,13 @@ async def run_workflow(user_query: str) -> Dict[str, Any]:
     try:
         # 워크플로우 실행
         print("🔄 워크플로우 실행 중...")
-        result = await main_workflow.ainvoke(initial_state)
+        if CHECKPOINT_SQLITE_AVAILABLE:
+            result = await _invoke_with_checkpoints(initial_state, run_id, resume, from_step)
+        elif resume:
+            raise RuntimeError("재개하려면 langgraph-checkpoint-sqlite가 필요합니다. (pip install langgraph-checkpoint-sqlite)")
+        else:
+            print("⚠️  langgraph-checkpoint-sqlite가 설치되지 않아 체크포인트 없이 실행합니다.")
+            result = await main_workflow.ainvoke(initial_state)
         
         print("✅ 워크플로우 실행 완료!")
         print(f"⏰ 완료 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -98,7 +197,14 @@ async def run_workflow(user_query: str) -> Dict[str, Any]:
     except Exception as e:
         print(f"❌ 워크플로우 실행 실패: {e}")
         print(f"⏰ 실패 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        if CHECKPOINT_SQLITE_AVAILABLE:
+            print(f"💾 재개: python -m langgraph_mcp.run_workflow --resume {run_id}")
         raise
+    
+    finally:
+        # 단계별 실행 통계 출력 및 트레이스 저장
+        tracer.print_summary()
+        print(f"🧭 실행 트레이스: {tracer.write()}")
 
 
 async def run_step_by_step(user_query: str) -> Dict[str, Any]:
@@ -109,6 +215,8 @@ async def run_step_by_step(user_query: str) -> Dict[str, Any]:
     print(f"⏰ 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("-" * 60)
     
+    tracer = start_run()
+    
     # 초기 상태 생성
     current_state = WorkflowState(
         user_query=user_query,
@@ -142,8 +250,8 @@ async def run_step_by_step(user_query: str) -> Dict[str, Any]:
                     print(f"   ❌ 에이전트를 찾을 수 없음: {step_name}")
                     continue
                 
-                # 단계 실행
-                current_state = await agent.process(current_state)
+                # 단계 실행 (에이전트가 반환한 변경 필드만 상태에 반영)
+                current_state = apply_update(current_state, await agent.process(current_state))
                 
                 # 상태 업데이트
                 current_state.workflow_status["completed_steps"] = i + 1
@@ -194,20 +302,43 @@ async def run_step_by_step(user_query: str) -> Dict[str, Any]:
         print(f"❌ 단계별 워크플로우 실행 실패: {e}")
         print(f"⏰ 실패 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         raise
+    
+    finally:
+        tracer.print_summary()
+        print(f"🧭 실행 트레이스: {tracer.write()}")
 
 
 def main():
     """메인 함수"""
-    if len(sys.argv) < 2:
-        print("사용법: python -m langgraph_mcp.run_workflow <사용자_쿼리>")
-        print("예시: python -m langgraph_mcp.run_workflow 'AI 연구 동향에 대한 팟캐스트를 만들어주세요'")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="멀티 에이전트 워크플로우를 실행합니다.",
+        epilog=(
+            "예시:\n"
+            "  python -m langgraph_mcp.run_workflow 'AI 연구 동향에 대한 팟캐스트를 만들어주세요'\n"
+            "  python -m langgraph_mcp.run_workflow --resume 20240816_100000_ab12cd\n"
+            "  python -m langgraph_mcp.run_workflow --resume 20240816_100000_ab12cd --from-step tts"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("user_query", nargs="?", help="사용자 쿼리 (--resume 시 생략)")
+    parser.add_argument("--run-id", help="새 실행의 ID (생략 시 자동 생성)")
+    parser.add_argument("--resume", metavar="RUN_ID", help="실패한 실행을 마지막 체크포인트부터 이어서 실행")
+    parser.add_argument("--from-step", choices=AGENT_EXECUTION_ORDER, help="--resume과 함께 사용: 지정한 단계부터 다시 실행")
+    args = parser.parse_args()
     
-    user_query = sys.argv[1]
+    if args.from_step and not args.resume:
+        parser.error("--from-step은 --resume과 함께 사용해야 합니다.")
+    if not args.resume and not args.user_query:
+        parser.error("사용자 쿼리 또는 --resume RUN_ID가 필요합니다.")
     
     try:
-        # 기본 워크플로우 실행
-        result = asyncio.run(run_workflow(user_query))
+        # 기본 워크플로우 실행 (또는 재개)
+        result = asyncio.run(run_workflow(
+            args.user_query,
+            run_id=args.resume or args.run_id,
+            resume=args.resume is not None,
+            from_step=args.from_step
+        ))
         print("\n🎉 워크플로우가 성공적으로 완료되었습니다!")
         
     except KeyboardInterrupt:
@@ -5,8 +5,8 @@ router graph.
 
 """
 
-from dataclasses import dataclass, field
-from typing import Annotated, Sequence, Dict, Any, List, Optional
+from dataclasses import dataclass, field, fields, replace
+from typing import Annotated, Sequence, Dict, Any, List, Optional, get_type_hints
 
 from langchain_core.documents import Document
 from langchain_core.messages import AnyMessage
@@ -88,6 +88,54 @@ def add_queries(existing: Sequence[str], new: Sequence[str]) -> Sequence[str]:
     return list(existing) + list(new)
 
 
+def merge_workflow_status(existing: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge a workflow status update into the current workflow status.
+
+    Scalar keys from `new` overwrite those in `existing`. The `errors` and
+    `warnings` lists are unioned so that parallel branches do not drop each
+    other's messages, and a `completed_steps_delta` key is added onto the
+    current `completed_steps` count instead of replacing it.
+
+    Args:
+        existing (Dict[str, Any]): The current workflow status in the state.
+        new (Dict[str, Any]): The (possibly partial) status update from a node.
+
+    Returns:
+        Dict[str, Any]: A new dictionary with the merged workflow status.
+    """
+    merged = dict(existing or {})
+    new = dict(new or {})
+
+    delta = new.pop("completed_steps_delta", None)
+    for key in ("errors", "warnings"):
+        if key in new:
+            current = list(merged.get(key, []))
+            current.extend(item for item in new.pop(key) if item not in current)
+            merged[key] = current
+
+    merged.update(new)
+    if delta is not None:
+        merged["completed_steps"] = merged.get("completed_steps", 0) + delta
+    return merged
+
+
+def merge_artifacts(existing: Dict[str, str], new: Dict[str, str]) -> Dict[str, str]:
+    """Merge artifact references into the current artifact map.
+
+    Large payloads are kept in the artifact store and the state only holds
+    their IDs, keyed by the name of the payload (e.g. ``"search_results"``).
+    A newer reference for the same name replaces the older one.
+
+    Args:
+        existing (Dict[str, str]): The current artifact references in the state.
+        new (Dict[str, str]): The artifact references written by a node.
+
+    Returns:
+        Dict[str, str]: A new dictionary with the merged artifact references.
+    """
+    return {**(existing or {}), **(new or {})}
+
+
 @dataclass(kw_only=True)
 class State(InputState):
     """The state of your graph / agent."""
@@ -131,14 +179,26 @@ class WorkflowState:
     search_queries: List[str] = field(default_factory=list)
     search_results: List[Dict[str, Any]] = field(default_factory=list)
     search_query: str = ""  # 단수형 추가
+    search_metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    # RAG 검색 쿼리 (QueryWriterAgent)
+    primary_query: str = ""
+    secondary_query: str = ""
+    third_query: str = ""
+    search_scope: Dict[str, Any] = field(default_factory=dict)
+    research_priorities: List[Any] = field(default_factory=list)
     
     # 데이터베이스 및 연구
     vector_db_data: List[Dict[str, Any]] = field(default_factory=list)
+    vector_db: Dict[str, Any] = field(default_factory=dict)
+    embedding_stats: Dict[str, Any] = field(default_factory=dict)
+    db_metadata: Dict[str, Any] = field(default_factory=dict)
     research_results: List[Dict[str, Any]] = field(default_factory=list)
     research_result: str = ""  # 단수형 추가 (ReporterAgent용)
     
     # 요약 및 평가
     summarized_results: List[Dict[str, Any]] = field(default_factory=list)
+    summarization_metadata: Dict[str, Any] = field(default_factory=dict)
     evaluation_results: Dict[str, Any] = field(default_factory=dict)
     critic_feedback: str = ""
     quality_score: float = 0.0
@@ -167,8 +227,8 @@ class WorkflowState:
     final_script: str = ""
     audio_file_path: str = ""
     
-    # 워크플로우 상태
-    workflow_status: Dict[str, Any] = field(default_factory=lambda: {
+    # 워크플로우 상태 (병렬 노드의 갱신을 병합하기 위해 리듀서 사용)
+    workflow_status: Annotated[Dict[str, Any], merge_workflow_status] = field(default_factory=lambda: {
         "current_step": "initialized",
         "completed_steps": 0,
         "total_steps": 8,
@@ -177,6 +237,12 @@ class WorkflowState:
         "warnings": []
     })
     
+    # 다음 실행 에이전트 (OrchestratorAgent)
+    next_agents: List[str] = field(default_factory=list)
+    
+    # 아티팩트 저장소에 보관한 대용량 데이터의 참조 (이름 -> 아티팩트 ID)
+    artifacts: Annotated[Dict[str, str], merge_artifacts] = field(default_factory=dict)
+    
     # 메타데이터
     execution_start_time: Optional[float] = None
     execution_end_time: Optional[float] = None
@@ -207,3 +273,39 @@ class WorkflowState:
     def get_progress(self) -> float:
         """진행률을 반환합니다 (0.0 ~ 1.0)."""
         return self.workflow_status["completed_steps"] / self.workflow_status["total_steps"]
+
+
+def _field_reducers(state_cls) -> Dict[str, Any]:
+    """Annotated[..., reducer]로 선언된 필드의 리듀서를 반환합니다."""
+    hints = get_type_hints(state_cls, include_extras=True)
+    reducers = {}
+    for name, hint in hints.items():
+        metadata = getattr(hint, "__metadata__", ())
+        if metadata and callable(metadata[-1]):
+            reducers[name] = metadata[-1]
+    return reducers
+
+
+_WORKFLOW_REDUCERS = _field_reducers(WorkflowState)
+_WORKFLOW_FIELDS = {f.name for f in fields(WorkflowState)}
+
+
+def apply_update(state: WorkflowState, update: Optional[Dict[str, Any]]) -> WorkflowState:
+    """에이전트가 반환한 부분 업데이트를 상태에 적용한 새 WorkflowState를 반환합니다.
+
+    LangGraph 밖에서 에이전트를 직접 실행할 때(단계별 실행, 테스트 등) 사용하며,
+    그래프와 같은 방식으로 리듀서가 있는 필드는 병합하고 나머지 필드는 교체합니다.
+    바뀌지 않은 필드는 기존 객체를 그대로 공유합니다.
+    """
+    if not update:
+        return state
+    if isinstance(update, WorkflowState):
+        return update
+
+    changes = {}
+    for name, value in update.items():
+        if name not in _WORKFLOW_FIELDS:
+            raise KeyError(f"WorkflowState에 없는 필드입니다: {name}")
+        reducer = _WORKFLOW_REDUCERS.get(name)
+        changes[name] = reducer(getattr(state, name), value) if reducer else value
+    return replace(state, **changes)
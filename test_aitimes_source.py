@@ -0,0 +1,158 @@
+"""AI타임스 RSS/사이트맵 소스 어댑터 테스트 스크립트 (로컬 테스트 서버 사용)."""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from aiohttp import web
+
+from agents.sources import AITimesSource
+from agents.sources.aitimes_source import parse_feed
+from local_test_server import local_server
+
+
+def _rss(base, ages):
+    items = "".join(
+        f"<item><title>기사 {i}</title><link>{base}/news/articleView.html?idxno={i}</link>"
+        f"<pubDate>{format_datetime(datetime.now(timezone.utc) - timedelta(days=age))}</pubDate></item>"
+        for i, age in enumerate(ages)
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>AI타임스</title>{items}</channel></rss>'
+
+
+class FakeAITimes:
+    """RSS 피드와 기사 페이지를 돌려주는 AI타임스 흉내 서버."""
+
+    def __init__(self, ages):
+        self.ages = ages
+        self.article_requests = []
+        self.sitemap_requested = False
+        self.active = 0
+        self.peak_active = 0
+
+    async def rss(self, request):
+        base = f"http://{request.host}"
+        return web.Response(body=_rss(base, self.ages).encode("utf-8"), content_type="application/xml")
+
+    async def sitemap(self, request):
+        self.sitemap_requested = True
+        return web.Response(body=b"<urlset xmlns='http://www.sitemaps.org/schemas/sitemap/0.9'/>", content_type="application/xml")
+
+    async def article(self, request):
+        idxno = request.query["idxno"]
+        self.article_requests.append(idxno)
+        if "If-None-Match" in request.headers:
+            return web.Response(status=304)
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            self.active -= 1
+        html = f"<html><body><div class='article-content'><p>본문 {idxno}</p><p>둘째 문단</p></div></body></html>"
+        return web.Response(text=html, content_type="text/html")
+
+
+class VanishingLedger:
+    """조건부 헤더를 만든 뒤 이력이 지워진 상황을 흉내 내는 수집 이력."""
+
+    def __init__(self):
+        self.seen = set()
+        self.recorded = []
+
+    def get(self, url):
+        if url in self.seen:
+            return None
+        self.seen.add(url)
+        return {"etag": '"old"', "fetched_at": "2000-01-01T00:00:00", "record": None}
+
+    def is_fresh(self, entry):
+        return False
+
+    def conditional_headers(self, entry):
+        return {"If-None-Match": entry["etag"]} if entry else {}
+
+    def record(self, url, record, **kwargs):
+        self.recorded.append(url)
+        return True
+
+
+async def _run_source(fake, ledger=None, **config):
+    routes = [
+        web.get("/rss/allArticle.xml", fake.rss),
+        web.get("/sitemap.xml", fake.sitemap),
+        web.get("/news/articleView.html", fake.article)
+    ]
+    async with local_server(routes) as base:
+        source = AITimesSource(ledger=ledger, config={"feeds": [f"{base}/rss/allArticle.xml", f"{base}/sitemap.xml"], **config})
+        return source, await source.fetch()
+
+
+def test_date_filter_before_fetch():
+    """피드 발행 시각으로 기간 밖 기사를 요청 전에 제외하고, 20개 제한 없이 동시에 받는지 테스트."""
+    print("=== 피드 날짜 필터 / 동시 수집 테스트 ===")
+    # 30개는 7일 이내, 10개는 오래된 기사
+    fake = FakeAITimes(ages=[i * 0.2 for i in range(30)] + [8 + i for i in range(10)])
+    source, posts = asyncio.run(_run_source(fake, concurrency=4, per_host_min_interval=0))
+
+    assert len(posts) == 30
+    assert len(fake.article_requests) == 30
+    assert 1 < fake.peak_active <= 4
+    # RSS가 기간 전체를 덮으므로 사이트맵은 읽지 않음
+    assert not fake.sitemap_requested
+    first = next(post for post in posts if post["title"] == "기사 0")
+    assert first["content"] == "본문 0\n둘째 문단"
+    assert set(first) == {"title", "content", "author", "url", "date", "source"}
+    assert source.stats["fetched"] == 30
+    print(f"✅ {len(posts)}개 기사 수집 (오래된 기사 요청 0건), 최대 동시 요청 {fake.peak_active}")
+
+
+def test_304_without_ledger_entry_refetches():
+    """304를 받았는데 재사용할 이력이 없으면 조건부 헤더 없이 다시 받는지 테스트."""
+    print("=== 이력 없는 304 재요청 테스트 ===")
+    fake = FakeAITimes(ages=[0.1, 0.2, 0.3])
+    ledger = VanishingLedger()
+    source, posts = asyncio.run(_run_source(fake, ledger=ledger))
+
+    assert sorted(post["content"] for post in posts) == [f"본문 {i}\n둘째 문단" for i in range(3)]
+    # 기사마다 조건부 요청 1회(304) + 일반 요청 1회
+    assert len(fake.article_requests) == 6
+    assert len(ledger.recorded) == 3
+    assert source.stats["not_modified"] == 0
+    print(f"✅ 304 후 재요청으로 {len(posts)}개 기사 본문 수집")
+
+
+def test_parse_news_sitemap():
+    """Google News 사이트맵과 사이트맵 인덱스를 파싱하는지 테스트."""
+    print("=== 사이트맵 파싱 테스트 ===")
+    sitemap = """<?xml version="1.0" encoding="UTF-8"?>
+    <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+      <url><loc>https://www.aitimes.kr/news/articleView.html?idxno=1</loc>
+        <news:news><news:publication_date>2025-01-15T14:30:00+09:00</news:publication_date><news:title>뉴스 제목</news:title></news:news>
+      </url>
+      <url><loc>https://www.aitimes.kr/news/articleView.html?idxno=2</loc><lastmod>2025-01-14</lastmod></url>
+    </urlset>""".encode("utf-8")
+    items, sitemaps = parse_feed(sitemap)
+    assert [item[0][-1] for item in items] == ["1", "2"]
+    assert items[0][1] == "뉴스 제목" and items[0][2] is not None
+    assert items[1][1] is None and items[1][2] == datetime(2025, 1, 14)
+
+    index = b"""<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+      <sitemap><loc>https://www.aitimes.kr/sitemap-1.xml</loc><lastmod>2025-01-15</lastmod></sitemap>
+    </sitemapindex>"""
+    items, sitemaps = parse_feed(index)
+    assert items == [] and sitemaps == [("https://www.aitimes.kr/sitemap-1.xml", datetime(2025, 1, 15))]
+    print("✅ 사이트맵 / 사이트맵 인덱스 파싱")
+
+
+if __name__ == "__main__":
+    test_date_filter_before_fetch()
+    test_304_without_ledger_entry_refetches()
+    test_parse_news_sitemap()
+    print("\n🎉 모든 AI타임스 소스 테스트 통과")
@@ -0,0 +1,173 @@
+"""공유 headless 브라우저 서비스 테스트 스크립트 (가짜 WebDriver 사용, Chrome/selenium 불필요)."""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from aiohttp import web
+
+from agents.browser_service import BrowserService
+from agents.sources import PerplexitySource
+from local_test_server import local_server
+
+LOAD_DELAY = 0.05
+
+
+class FakeDriver:
+    """탭(윈도 핸들)별로 현재 URL과 로드 완료 시각을 기억하는 WebDriver 흉내."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.tabs = {"tab-0": None}
+        self.current_window_handle = "tab-0"
+        self.blocked_urls = {}
+        self.quit_called = False
+        self.switch_to = self
+
+    # driver.switch_to.*
+    def new_window(self, kind):
+        handle = f"tab-{len(self.tabs)}"
+        self.tabs[handle] = None
+        self.current_window_handle = handle
+
+    def window(self, handle):
+        self.current_window_handle = handle
+
+    def execute_cdp_cmd(self, command, params):
+        if command == "Network.setBlockedURLs":
+            self.blocked_urls[self.current_window_handle] = params["urls"]
+        return {}
+
+    def execute_script(self, script, *args):
+        handle = self.current_window_handle
+        if "window.location.href" in script:
+            self.tabs[handle] = (args[0], time.monotonic() + LOAD_DELAY)
+            return None
+        url, loaded_at = self.tabs[handle]
+        return time.monotonic() >= loaded_at
+
+    @property
+    def page_source(self):
+        url, _ = self.tabs[self.current_window_handle]
+        return self.pages.get(url, "<html><body></body></html>")
+
+    def quit(self):
+        self.quit_called = True
+
+
+def _service(pages, max_tabs=2):
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver(pages))
+        return drivers[-1]
+
+    service = BrowserService(config={"max_tabs": max_tabs, "poll_interval": 0.01}, driver_factory=factory)
+    return service, drivers
+
+
+def test_lazy_start_and_tab_reuse():
+    """브라우저는 처음 탭을 빌릴 때 한 번만 시작하고, 반납된 탭을 재사용하는지 테스트."""
+    print("=== 지연 시작 / 탭 재사용 테스트 ===")
+    service, drivers = _service({"https://example.com/a": "<html><body><p>A</p></body></html>"})
+    assert drivers == [] and service.stats["launches"] == 0
+
+    handles = []
+    for _ in range(3):
+        with service.tab() as tab:
+            handles.append(tab.handle)
+            html = tab.open("https://example.com/a")
+    assert "<p>A</p>" in html
+
+    assert len(drivers) == 1 and service.stats["launches"] == 1
+    assert handles == ["tab-0"] * 3
+    assert service.stats["tabs_created"] == 1 and service.stats["borrows"] == 3
+    assert drivers[0].blocked_urls["tab-0"] == service.config["blocked_url_patterns"]
+
+    service.shutdown()
+    assert drivers[0].quit_called
+    print(f"✅ 시작 {service.stats['launches']}회, 탭 {service.stats['tabs_created']}개로 {service.stats['borrows']}회 대여")
+
+
+def test_max_tabs_bounds_concurrent_borrows():
+    """동시에 빌린 탭이 max_tabs를 넘지 않고, 탭마다 요청 차단이 설정되는지 테스트."""
+    print("=== max_tabs 제한 테스트 ===")
+    service, drivers = _service({}, max_tabs=2)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def borrow():
+        nonlocal active, peak
+        with service.tab() as tab:
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            tab.open("https://example.com/slow")
+            with lock:
+                active -= 1
+
+    workers = [threading.Thread(target=borrow) for _ in range(6)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert peak == 2
+    assert service.stats["tabs_created"] == 2 and service.stats["borrows"] == 6
+    assert set(drivers[0].blocked_urls) == {"tab-0", "tab-1"}
+    service.shutdown()
+    print(f"✅ 동시 대여 최대 {peak}개 (max_tabs 2), 탭 {service.stats['tabs_created']}개 재사용")
+
+
+def test_js_citation_rendered_in_borrowed_tab():
+    """HTTP 본문이 비어 있는 인용 페이지만 브라우저 탭에서 렌더링하는지 테스트."""
+    print("=== JS 인용 페이지 렌더링 테스트 ===")
+    article = "렌더링된 본문 " * 40
+
+    async def completion(request):
+        base = f"http://{request.host}"
+        return web.json_response({
+            "choices": [{"message": {"content": "답변"}}],
+            "citations": [f"{base}/static", f"{base}/spa"]
+        })
+
+    async def static_page(request):
+        return web.Response(text=f"<html><body><article>{article}</article></body></html>", content_type="text/html")
+
+    async def spa_page(request):
+        return web.Response(text="<html><body><div id='root'></div><script>render()</script></body></html>", content_type="text/html")
+
+    async def run():
+        routes = [web.post("/chat/completions", completion), web.get("/static", static_page), web.get("/spa", spa_page)]
+        async with local_server(routes) as base:
+            service, drivers = _service({f"{base}/spa": f"<html><body><main>{article}</main></body></html>"})
+            source = PerplexitySource(
+                queries=["AI 에이전트"],
+                api_key="test-key",
+                config={"api_url": f"{base}/chat/completions"},
+                browser=service
+            )
+            return source, service, await source.fetch()
+
+    source, service, results = asyncio.run(run())
+    citations = {record["url"].rsplit("/", 1)[-1]: record for record in results if record["source"] == "perplexity_citation"}
+
+    assert citations["spa"]["content"].startswith("렌더링된 본문")
+    assert citations["static"]["content"].startswith("렌더링된 본문")
+    assert source.stats["citations_rendered"] == 1 and service.stats["borrows"] == 1
+    service.shutdown()
+    print(f"✅ 인용 {len(citations)}개 중 {source.stats['citations_rendered']}개만 브라우저로 렌더링")
+
+
+if __name__ == "__main__":
+    test_lazy_start_and_tab_reuse()
+    test_max_tabs_bounds_concurrent_borrows()
+    test_js_citation_rendered_in_borrowed_tab()
+    print("\n🎉 모든 브라우저 서비스 테스트 통과")
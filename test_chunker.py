@@ -0,0 +1,99 @@
+"""토큰 기준 문장 청킹 테스트 스크립트."""
+
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from agents.chunker import TokenChunker
+
+SMALL_CONFIG = {"chunk_size": 60, "chunk_overlap": 15, "min_chunk_size": 20, "max_chunk_size": 90}
+
+
+def _document(paragraphs=20):
+    sentences = [
+        f"{i}번째 문단에서 에이전트가 검색 결과를 요약했다. "
+        f"The retriever returned {i * 3} candidate passages for the query! "
+        f"임베딩 비용은 청크 크기에 비례한다?\n\n"
+        for i in range(paragraphs)
+    ]
+    return "".join(sentences)
+
+
+def test_chunks_respect_token_budget_and_offsets():
+    """청크가 토큰 한도를 지키고 오프셋이 원문 구간과 일치하는지 테스트."""
+    print("=== 토큰 한도 / 오프셋 테스트 ===")
+    text = _document()
+    chunker = TokenChunker("news_articles", config=SMALL_CONFIG)
+    chunks = chunker.split(text)
+
+    assert len(chunks) > 1
+    assert chunks[0].start == 0 and chunks[-1].end == len(text)
+    for chunk in chunks:
+        assert text[chunk.start:chunk.end] == chunk.text
+        assert chunker.count_tokens(chunk.text) <= SMALL_CONFIG["max_chunk_size"]
+    for previous, current in zip(chunks, chunks[1:]):
+        # 빈틈 없이 이어지고, 겹침은 chunk_overlap 토큰 이내
+        assert current.start <= previous.end < current.end
+        assert chunker.count_tokens(text[current.start:previous.end]) <= SMALL_CONFIG["chunk_overlap"]
+    # 청크 경계는 문장 구분자 뒤
+    assert all(text[chunk.end - 2:chunk.end] in ("\n\n", ". ", "! ", "? ") for chunk in chunks[:-1])
+    print(f"✅ {len(chunks)}개 청크, 최대 {max(chunk.tokens for chunk in chunks)} 토큰")
+
+
+def test_long_sentence_and_short_tail():
+    """구분자 없는 긴 문장은 단어 단위로 나누고, 짧은 마지막 청크는 앞 청크에 합치는지 테스트."""
+    print("=== 긴 문장 / 짧은 꼬리 테스트 ===")
+    chunker = TokenChunker(config=SMALL_CONFIG)
+    text = " ".join(f"word{i}" for i in range(300)) + ". 끝."
+    chunks = chunker.split(text)
+
+    assert all(chunker.count_tokens(chunk.text) <= SMALL_CONFIG["max_chunk_size"] for chunk in chunks)
+    assert all(text[chunk.start:chunk.end] == chunk.text for chunk in chunks)
+    assert chunks[-1].end == len(text)
+    assert chunks[-1].tokens >= SMALL_CONFIG["min_chunk_size"]
+    print(f"✅ {len(chunks)}개 청크, 마지막 청크 {chunks[-1].tokens} 토큰")
+
+
+def test_stream_matches_single_pass():
+    """블록 스트림으로 나눈 결과가 전체 텍스트를 한 번에 나눈 결과와 같은지 테스트."""
+    print("=== 스트리밍 청킹 테스트 ===")
+    text = _document(paragraphs=2000)
+    chunker = TokenChunker("research_papers")
+    blocks = (text[i:i + 997] for i in range(0, len(text), 997))
+
+    streamed = list(chunker.split_stream(blocks))
+    single = chunker.split(text)
+
+    assert [(c.start, c.end) for c in streamed] == [(c.start, c.end) for c in single]
+    assert all(text[chunk.start:chunk.end] == chunk.text for chunk in streamed)
+    print(f"✅ {len(text)}자 -> {len(streamed)}개 청크 (스트리밍 결과 일치)")
+
+
+def test_stream_unbroken_text_is_linear():
+    """구분자와 공백이 없는 긴 스트림도 버퍼를 다시 탐색하지 않고 빠르게 나누는지 테스트."""
+    print("=== 구분자 없는 스트림 청킹 테스트 ===")
+    text = "가나다라마바사아자차카타파하" * 150000  # 약 2.1M자, 공백/구분자 없음
+    chunker = TokenChunker("research_papers")
+    blocks = (text[i:i + 1024] for i in range(0, len(text), 1024))
+
+    started = time.perf_counter()
+    chunks = list(chunker.split_stream(blocks))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 10
+    assert all(text[chunk.start:chunk.end] == chunk.text for chunk in chunks)
+    assert all(chunk.tokens <= chunker.max_chunk_size for chunk in chunks)
+    assert chunks[0].start == 0 and chunks[-1].end == len(text)
+    print(f"✅ {len(text)}자 -> {len(chunks)}개 청크 ({elapsed:.2f}초)")
+
+
+if __name__ == "__main__":
+    test_chunks_respect_token_budget_and_offsets()
+    test_long_sentence_and_short_tail()
+    test_stream_matches_single_pass()
+    test_stream_unbroken_text_is_linear()
+    print("\n🎉 모든 청킹 테스트 통과")
@@ -0,0 +1,133 @@
+"""수집 문서 유사 중복 제거 테스트 스크립트."""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from agents.dedup import NearDuplicateDetector, deduplicate_documents
+
+ARTICLE = (
+    "오픈AI가 새로운 추론 모델을 공개했다. 이번 모델은 수학과 코딩 벤치마크에서 "
+    "기존 모델보다 높은 점수를 기록했으며, 긴 문맥을 처리하는 능력도 크게 향상되었다. "
+    "회사는 개발자를 위한 API도 함께 출시한다고 밝혔다. 업계에서는 경쟁사들의 대응에 "
+    "관심이 쏠리고 있으며, 국내 기업들도 관련 서비스 도입을 검토하고 있다."
+)
+
+
+def _random_article(rng):
+    words = ["모델", "데이터", "학습", "추론", "벤치마크", "GPU", "오픈소스", "논문", "에이전트", "멀티모달"]
+    return " ".join(rng.choice(words) + str(rng.randint(0, 999)) for _ in range(80))
+
+
+def test_repost_is_merged_into_canonical():
+    """다른 사이트에 재게시된 같은 기사가 하나로 합쳐지고 출처가 병합되는지 테스트."""
+    print("=== 재게시 기사 병합 테스트 ===")
+    documents = [
+        {"title": "[GN] 오픈AI 새 추론 모델 공개", "content": "GeekNews 요약\n" + ARTICLE,
+         "url": "https://discuss.pytorch.kr/t/1", "source": "pytorch_kr"},
+        {"title": "오픈AI, 새 추론 모델 공개", "content": ARTICLE,
+         "url": "https://www.aitimes.kr/news/1", "source": "aitimes_kr"},
+        {"title": "Perplexity 검색 결과: 최신 AI 트렌드", "content": _random_article(random.Random(0)),
+         "url": "https://www.perplexity.ai", "source": "perplexity"},
+    ]
+
+    unique, stats = deduplicate_documents(documents)
+
+    assert stats["duplicates_removed"] == 1
+    assert len(unique) == 2
+    canonical = unique[0]
+    assert canonical["source"] == "aitimes_kr"
+    assert canonical["sources"] == ["pytorch_kr", "aitimes_kr"]
+    assert canonical["urls"] == ["https://discuss.pytorch.kr/t/1", "https://www.aitimes.kr/news/1"]
+    assert "sources" not in documents[1]  # 입력 문서는 수정하지 않음
+    print(f"✅ 대표 문서: {canonical['url']} (출처 {canonical['sources']})")
+
+
+def test_merged_sources_survive_second_pass():
+    """이미 중복 제거된 결과에 새 문서를 합쳐 다시 중복 제거해도 이전에 병합한 출처가 유지되는지 테스트."""
+    print("=== 2단계 병합 테스트 ===")
+    crawled, _ = deduplicate_documents([
+        {"title": "[GN] 오픈AI 새 추론 모델 공개", "content": "GeekNews 요약\n" + ARTICLE,
+         "url": "https://discuss.pytorch.kr/t/1", "source": "pytorch_kr"},
+        {"title": "오픈AI, 새 추론 모델 공개", "content": ARTICLE,
+         "url": "https://www.aitimes.kr/news/1", "source": "aitimes_kr"},
+    ])
+    citation = {"title": "오픈AI 새 추론 모델", "content": ARTICLE,
+                "url": "https://example.com/openai", "source": "perplexity_citation"}
+
+    unique, stats = deduplicate_documents(crawled + [citation])
+
+    assert len(unique) == 1 and stats["duplicates_removed"] == 1
+    assert unique[0]["sources"] == ["pytorch_kr", "aitimes_kr", "perplexity_citation"]
+    assert unique[0]["urls"][-1] == "https://example.com/openai" and len(unique[0]["urls"]) == 3
+    assert unique[0]["duplicate_count"] == 2
+    print(f"✅ 출처 {unique[0]['sources']}")
+
+
+def test_distinct_documents_are_kept_at_scale():
+    """서로 다른 문서 수천 개에서 오탐 없이 선형 시간에 처리되는지 테스트."""
+    print("=== 대량 문서 테스트 ===")
+    rng = random.Random(42)
+    documents = [
+        {"title": f"기사 {i}", "content": _random_article(rng), "url": f"https://example.com/{i}", "source": "aitimes_kr"}
+        for i in range(3000)
+    ]
+    # 일부 문서는 끝에 문장 하나만 덧붙여 다시 게시
+    reposts = [
+        {**documents[i], "content": documents[i]["content"] + " 출처 표기.", "url": f"https://repost.example.com/{i}", "source": "pytorch_kr"}
+        for i in range(0, 3000, 100)
+    ]
+
+    started = time.perf_counter()
+    unique, stats = deduplicate_documents(documents + reposts)
+    elapsed = time.perf_counter() - started
+
+    assert stats["output"] == 3000
+    assert stats["clusters_merged"] == len(reposts)
+    print(f"✅ {stats['input']}개 -> {stats['output']}개 ({elapsed:.2f}초)")
+
+
+def test_signature_similarity_tracks_jaccard():
+    """서명 일치율이 실제 유사도를 반영하는지 테스트."""
+    print("=== MinHash 서명 테스트 ===")
+    detector = NearDuplicateDetector()
+    same = detector.signature(ARTICLE)
+    edited = detector.signature(ARTICLE.replace("높은 점수", "최고 점수"))
+    other = detector.signature(_random_article(random.Random(1)))
+
+    assert (same == detector.signature(ARTICLE)).all()
+    assert (same == edited).mean() > 0.8
+    assert (same == other).mean() < 0.1
+    print(f"✅ 수정본 일치율 {(same == edited).mean():.2f}, 무관 문서 일치율 {(same == other).mean():.2f}")
+
+
+def test_empty_documents_are_passed_through():
+    """제목과 본문이 모두 빈 문서끼리는 묶이지 않고 그대로 남는지 테스트."""
+    print("=== 빈 문서 통과 테스트 ===")
+    documents = [
+        {"title": "", "content": "", "url": "https://example.com/a", "source": "perplexity_citation"},
+        {"title": "오픈AI, 새 추론 모델 공개", "content": ARTICLE, "url": "https://www.aitimes.kr/news/1", "source": "aitimes_kr"},
+        {"title": " ", "content": "\n", "url": "https://example.com/b", "source": "perplexity_citation"},
+        {"title": "", "content": "", "url": "https://example.com/c", "source": "perplexity_citation"},
+    ]
+
+    unique, stats = deduplicate_documents(documents)
+
+    assert stats["duplicates_removed"] == 0
+    assert [document["url"] for document in unique] == [document["url"] for document in documents]
+    assert all("urls" not in document for document in unique)
+    print(f"✅ 빈 문서 {len(documents) - 1}개가 병합 없이 유지됨")
+
+
+if __name__ == "__main__":
+    test_repost_is_merged_into_canonical()
+    test_merged_sources_survive_second_pass()
+    test_distinct_documents_are_kept_at_scale()
+    test_signature_similarity_tracks_jaccard()
+    test_empty_documents_are_passed_through()
+    print("\n🎉 모든 중복 제거 테스트 통과")
@@ -0,0 +1,114 @@
+"""Discourse JSON API 소스 어댑터 테스트 스크립트 (로컬 테스트 서버 사용)."""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from aiohttp import web
+
+from agents.sources import DiscourseSource
+from local_test_server import local_server
+
+PAGE_SIZE = 5
+
+
+def _iso(days_ago):
+    return (datetime.now(timezone.utc) - timedelta(days=days_ago)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+class FakeDiscourse:
+    """최신 활동 순 토픽 목록과 토픽 본문을 돌려주는 Discourse 흉내 서버."""
+
+    def __init__(self, topic_ages, rate_limit_once=False):
+        self.topics = [
+            {"id": 100 + i, "slug": f"topic-{i}", "title": f"토픽 {i}", "created_at": _iso(age + 0.1), "bumped_at": _iso(age)}
+            for i, age in enumerate(topic_ages)
+        ]
+        # 오래된 고정 토픽은 항상 첫 페이지 상단에 위치
+        self.pinned = {"id": 1, "slug": "about", "title": "카테고리 소개", "bumped_at": _iso(400), "pinned": True}
+        self.rate_limit_once = rate_limit_once
+        self.pages_requested = []
+        self.topic_requests = 0
+        self.active = 0
+        self.peak_active = 0
+
+    async def category(self, request):
+        page = int(request.query.get("page", 0))
+        self.pages_requested.append(page)
+        topics = self.topics[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]
+        if page == 0:
+            topics = [self.pinned] + topics
+        more = (page + 1) * PAGE_SIZE < len(self.topics)
+        return web.json_response({"topic_list": {
+            "topics": topics,
+            "more_topics_url": f"/c/news?page={page + 1}" if more else None
+        }})
+
+    async def topic(self, request):
+        if self.rate_limit_once:
+            self.rate_limit_once = False
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        self.topic_requests += 1
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            self.active -= 1
+        topic_id = int(request.match_info["topic_id"])
+        return web.json_response({
+            "title": f"토픽 {topic_id - 100}",
+            "post_stream": {"posts": [{"username": "pytorch", "cooked": f"<p>본문 {topic_id}</p><p>둘째 문단</p>"}]}
+        })
+
+
+async def _run_source(fake, **config):
+    routes = [web.get("/c/news.json", fake.category), web.get("/t/{topic_id}.json", fake.topic)]
+    async with local_server(routes) as base:
+        source = DiscourseSource(config={"base_url": base, **config})
+        return source, await source.fetch()
+
+
+def test_paginates_until_cutoff():
+    """7일 이내 토픽만 수집하고 cutoff에 도달하면 목록 요청을 멈추는지 테스트."""
+    print("=== 목록 페이지네이션 / 기간 제한 테스트 ===")
+    # 0~11번 토픽은 7일 이내, 이후는 오래된 토픽 (총 5페이지 분량)
+    fake = FakeDiscourse(topic_ages=[i * 0.5 for i in range(12)] + [10 + i for i in range(13)])
+    # 3번 토픽은 30일 전 작성됐지만 최근 댓글로 목록 상단에 있음 (수집 제외)
+    fake.topics[3]["created_at"] = _iso(30)
+    source, posts = asyncio.run(_run_source(fake, concurrency=3))
+
+    assert len(posts) == 11
+    assert "토픽 3" not in {post["title"] for post in posts}
+    assert fake.pages_requested == [0, 1, 2]
+    assert fake.topic_requests == 11 and fake.peak_active <= 3
+    first = next(post for post in posts if post["title"] == "토픽 0")
+    assert first["content"] == "본문 100\n둘째 문단"
+    assert first["url"].endswith("/t/topic-0/100")
+    assert set(first) == {"title", "content", "author", "url", "date", "source"}
+    # date는 최근 활동 시각이 아닌 작성 시각
+    created = datetime.fromisoformat(fake.topics[0]["created_at"].replace("Z", "+00:00")).astimezone().replace(tzinfo=None)
+    assert first["date"] == created.isoformat()
+    assert source.stats["fetched"] == 11
+    print(f"✅ {len(posts)}개 토픽 수집, 목록 {len(fake.pages_requested)}페이지, 최대 동시 요청 {fake.peak_active}")
+
+
+def test_retries_after_rate_limit():
+    """429 응답 후 Retry-After만큼 기다렸다가 재시도하는지 테스트."""
+    print("=== 429 재시도 테스트 ===")
+    fake = FakeDiscourse(topic_ages=[1, 2], rate_limit_once=True)
+    _, posts = asyncio.run(_run_source(fake))
+
+    assert len(posts) == 2
+    print("✅ 요청 한도 초과 후 재시도로 모든 토픽 수집")
+
+
+if __name__ == "__main__":
+    test_paginates_until_cutoff()
+    test_retries_after_rate_limit()
+    print("\n🎉 모든 Discourse 소스 테스트 통과")
@@ -0,0 +1,61 @@
+"""LLM 응답 캐시 테스트 스크립트."""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from constants.llm_cache import LLMResponseCache
+
+
+def test_cache_hit_and_miss():
+    """동일한 요청은 캐시에서, 다른 요청은 미스로 처리되는지 테스트."""
+    print("=== 캐시 적중/미스 테스트 ===")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = LLMResponseCache(cache_path=f"{tmp_dir}/llm_cache.db")
+
+        key = LLMResponseCache.make_key("gpt-4", "system", "프롬프트", 0.3, 100)
+        other_key = LLMResponseCache.make_key("gpt-4", "system", "프롬프트", 0.7, 100)
+        assert key != other_key
+
+        assert cache.get(key) is None
+        cache.set(key, "응답", model="gpt-4")
+        assert cache.get(key) == "응답"
+        assert cache.get(other_key) is None
+
+        stats = cache.get_stats()
+        print(f"✅ 통계: {stats}")
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        cache.close()
+
+
+def test_cache_ttl_and_lru_eviction():
+    """TTL 만료와 항목 수 한도에 따른 LRU 제거를 테스트."""
+    print("=== TTL/LRU 테스트 ===")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = LLMResponseCache(cache_path=f"{tmp_dir}/llm_cache.db", ttl_seconds=0.2, max_entries=2)
+
+        cache.set("a", "A")
+        cache.set("b", "B")
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.set("c", "C")  # 가장 오래 사용되지 않은 b가 제거됨
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert cache.get("c") == "C"
+        print("✅ LRU 제거 확인")
+
+        time.sleep(0.3)
+        assert cache.get("a") is None
+        print("✅ TTL 만료 확인")
+        cache.close()
+
+
+if __name__ == "__main__":
+    test_cache_hit_and_miss()
+    test_cache_ttl_and_lru_eviction()
@@ -0,0 +1,98 @@
+"""Perplexity 다중 쿼리 검색 소스 테스트 스크립트 (로컬 테스트 서버 사용)."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from aiohttp import web
+
+from agents.sources import PerplexitySource
+from local_test_server import local_server
+
+LATENCY = 0.3
+
+
+class FakePerplexity:
+    """chat/completions 응답과 인용 페이지를 돌려주는 Perplexity 흉내 서버."""
+
+    def __init__(self, rate_limit_once=False):
+        self.rate_limit_once = rate_limit_once
+        self.completions = 0
+        self.page_requests = 0
+
+    async def completion(self, request):
+        if self.rate_limit_once:
+            self.rate_limit_once = False
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        body = await request.json()
+        assert request.headers["Authorization"] == "Bearer test-key"
+        self.completions += 1
+        await asyncio.sleep(LATENCY)
+        query = body["messages"][0]["content"].split(": ", 1)[1]
+        base = f"http://{request.host}"
+        return web.json_response({
+            "choices": [{"message": {"content": f"{query}에 대한 답변"}}],
+            "citations": [f"{base}/page/shared", f"{base}/page/{len(query)}"],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 20}
+        })
+
+    async def page(self, request):
+        self.page_requests += 1
+        name = request.match_info["name"]
+        html = f"<html><body><nav>메뉴</nav><article><p>인용 본문 {name}</p></article><script>x()</script></body></html>"
+        return web.Response(text=html, content_type="text/html")
+
+
+async def _run_source(fake, queries):
+    routes = [web.post("/chat/completions", fake.completion), web.get("/page/{name}", fake.page)]
+    async with local_server(routes) as base:
+        # 브라우저 렌더링 경로는 test_browser_service에서 가짜 드라이버로 확인
+        # (API와 인용 페이지가 모두 같은 로컬 호스트이므로 호스트별 요청 간격은 끔)
+        source = PerplexitySource(
+            queries=queries,
+            api_key="test-key",
+            config={"api_url": f"{base}/chat/completions", "render_js_citations": False, "per_host_min_interval": 0}
+        )
+        started = time.perf_counter()
+        results = await source.fetch()
+        return source, results, time.perf_counter() - started
+
+
+def test_queries_run_concurrently_with_citation_records():
+    """세 쿼리가 한 번의 왕복 시간 안에 끝나고 인용 URL이 중복 없이 별도 레코드가 되는지 테스트."""
+    print("=== 다중 쿼리 동시 검색 / 인용 레코드 테스트 ===")
+    fake = FakePerplexity()
+    queries = ["AI 에이전트", "멀티모달 모델", "온디바이스 LLM", "AI 에이전트", ""]
+    source, results, elapsed = asyncio.run(_run_source(fake, queries))
+
+    answers = [record for record in results if record["source"] == "perplexity"]
+    citations = [record for record in results if record["source"] == "perplexity_citation"]
+    assert fake.completions == 3 and len(answers) == 3
+    assert elapsed < LATENCY * 2
+    # 공유 인용 1개 + 쿼리 길이별 인용 (길이가 같은 쿼리는 같은 URL)
+    assert len(citations) == len({record["url"] for record in citations}) == fake.page_requests
+    assert all(record["content"].startswith("인용 본문") and "메뉴" not in record["content"] for record in citations)
+    assert answers[0]["citations"][0].endswith("/page/shared")
+    print(f"✅ 쿼리 {len(answers)}개 {elapsed:.2f}초 (1회 지연 {LATENCY}초), 인용 레코드 {len(citations)}개")
+
+
+def test_retry_after_rate_limit():
+    """429 응답 후 Retry-After를 지켜 재시도하는지 테스트."""
+    print("=== 429 재시도 테스트 ===")
+    fake = FakePerplexity(rate_limit_once=True)
+    source, results, _ = asyncio.run(_run_source(fake, ["AI 에이전트"]))
+
+    assert [record["content"] for record in results if record["source"] == "perplexity"] == ["AI 에이전트에 대한 답변"]
+    assert source.stats["queries"] == 1
+    print("✅ 요청 한도 초과 후 재시도로 답변 수집")
+
+
+if __name__ == "__main__":
+    test_queries_run_concurrently_with_citation_records()
+    test_retry_after_rate_limit()
+    print("\n🎉 모든 Perplexity 소스 테스트 통과")
@@ -29,7 +29,7 @@ else:
 # 이제 절대 임포트 사용
 from agents.personalize_agent import PersonalizeAgent
 from agents.query_writer_agent import QueryWriterAgent
-from state import WorkflowState
+from state import WorkflowState, apply_update
 
 
 async def test_personalize_agent():
@@ -54,7 +54,7 @@ async def test_personalize_agent():
     
     try:
         # 에이전트 실행
-        updated_state = await agent.process(state)
+        updated_state = apply_update(state, await agent.process(state))
         
         print("✅ PersonalizeAgent 실행 성공")
         print(f"개인 정보: {updated_state.personal_info}")
@@ -77,7 +77,7 @@ async def test_query_writer_agent(personalize_state):
     
     try:
         # 에이전트 실행
-        updated_state = await agent.process(personalize_state)
+        updated_state = apply_update(personalize_state, await agent.process(personalize_state))
         
         print("✅ QueryWriterAgent 실행 성공")
         print(f"Primary 쿼리: {updated_state.primary_query}")
@@ -0,0 +1,157 @@
+"""소스 동시 수집(deadline / 단계 예산) 테스트 스크립트."""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from aiohttp import web
+
+from agents.sources import SOURCE_REGISTRY, BaseSource, run_sources
+from local_test_server import local_server
+
+
+class FakeSource(BaseSource):
+    """delay초 뒤 레코드를 돌려주거나 error를 던지는 테스트용 소스."""
+
+    def __init__(self, name, delay, deadline=None, error=None):
+        self.name = name
+        super().__init__(config={"deadline": deadline} if deadline is not None else {})
+        self.delay = delay
+        self.error = error
+        self.cancelled = False
+
+    async def fetch(self):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        self._count("fetched")
+        return [{"title": self.name, "content": "", "url": f"https://example.com/{self.name}", "source": self.name}]
+
+
+class PageSource(BaseSource):
+    """같은 사이트의 페이지 count개를 동시에 요청하는 테스트용 소스."""
+
+    def __init__(self, name, base, count, **config):
+        self.name = name
+        super().__init__(config=config)
+        self.urls = [f"{base}/page/{name}-{i}" for i in range(count)]
+
+    async def fetch(self):
+        async with self._new_session() as session:
+            pages = await asyncio.gather(*(self._request(session, url) for url in self.urls))
+        return [{"title": url, "content": body, "url": url, "source": self.name} for url, (_, body, _) in zip(self.urls, pages)]
+
+
+def test_registry_order():
+    """기본 소스가 결과를 합칠 순서대로 등록되어 있는지 테스트."""
+    print("=== 소스 등록 순서 테스트 ===")
+    assert list(SOURCE_REGISTRY) == ["pytorch_kr", "aitimes_kr", "perplexity"]
+    # 쿼리가 필요한 소스만 쿼리 작성 후(QuerySearcherAgent) 수집
+    assert [name for name, source_cls in SOURCE_REGISTRY.items() if source_cls.needs_queries] == ["perplexity"]
+    print(f"✅ 등록된 소스: {', '.join(SOURCE_REGISTRY)}")
+
+
+def test_straggler_does_not_block_others():
+    """느린 소스는 deadline에 끊기고 실패한 소스와 무관하게 끝난 소스의 결과가 반환되는지 테스트."""
+    print("=== 느린 소스 / 실패한 소스 격리 테스트 ===")
+    slow = FakeSource("slow", delay=5, deadline=0.3)
+    sources = [FakeSource("fast", delay=0.1), slow, FakeSource("broken", delay=0.05, error=RuntimeError("boom"))]
+
+    started = time.perf_counter()
+    outcomes = asyncio.run(run_sources(sources, budget=2))
+    elapsed = time.perf_counter() - started
+
+    assert list(outcomes) == ["fast", "slow", "broken"]
+    assert outcomes["fast"]["status"] == "ok" and len(outcomes["fast"]["records"]) == 1
+    assert outcomes["fast"]["stats"]["fetched"] == 1
+    assert outcomes["slow"]["status"] == "timeout" and outcomes["slow"]["records"] == [] and slow.cancelled
+    assert outcomes["broken"]["status"] == "error" and outcomes["broken"]["error"] == "boom"
+    assert elapsed < 0.6
+    print(f"✅ 전체 {elapsed:.2f}초 (느린 소스 deadline 0.3초): " +
+          ", ".join(f"{name}={outcome['status']}" for name, outcome in outcomes.items()))
+
+
+def test_stage_budget_caps_deadlines():
+    """소스 deadline이 단계 예산보다 길어도 예산 안에 끝나는지 테스트."""
+    print("=== 단계 예산 테스트 ===")
+    slow = FakeSource("slow", delay=5, deadline=60)
+
+    started = time.perf_counter()
+    outcomes = asyncio.run(run_sources([FakeSource("fast", delay=0.05), slow], budget=0.3))
+    elapsed = time.perf_counter() - started
+
+    assert outcomes["fast"]["status"] == "ok"
+    assert outcomes["slow"]["status"] in ("timeout", "cancelled") and slow.cancelled
+    assert elapsed < 0.6
+    print(f"✅ 예산 0.3초 안에 종료 ({elapsed:.2f}초), 느린 소스 상태: {outcomes['slow']['status']}")
+
+
+def test_sources_share_host_limits():
+    """같은 호스트를 요청하는 소스들이 호스트별 동시 요청 수와 최소 간격을 함께 지키는지 테스트."""
+    print("=== 호스트별 요청 제한 테스트 ===")
+    started_at = []
+    active = 0
+    peak = 0
+
+    async def page(request):
+        nonlocal active, peak
+        started_at.append(time.perf_counter())
+        active += 1
+        peak = max(peak, active)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            active -= 1
+        return web.Response(text=request.match_info["name"])
+
+    async def run():
+        async with local_server([web.get("/page/{name}", page)]) as base:
+            limits = {"per_host_concurrency": 2, "per_host_min_interval": 0.03}
+            sources = [PageSource("first", base, 4, **limits), PageSource("second", base, 4, **limits)]
+            return await run_sources(sources, budget=5)
+
+    outcomes = asyncio.run(run())
+
+    assert all(outcome["status"] == "ok" and len(outcome["records"]) == 4 for outcome in outcomes.values())
+    assert peak == 2
+    gaps = [later - earlier for earlier, later in zip(started_at, started_at[1:])]
+    assert len(started_at) == 8 and min(gaps) >= 0.025
+    print(f"✅ 두 소스 합쳐 최대 동시 요청 {peak}개, 최소 요청 간격 {min(gaps):.3f}초")
+
+
+def test_stats_count_from_threads():
+    """여러 워커 스레드에서 집계해도 수집 통계가 누락되지 않는지 테스트."""
+    print("=== 스레드 안전 수집 통계 테스트 ===")
+    source = FakeSource("threaded", delay=0)
+
+    def work():
+        for _ in range(10000):
+            source._count("fetched")
+
+    workers = [threading.Thread(target=work) for _ in range(8)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert source.stats["fetched"] == 80000
+    print(f"✅ 스레드 8개 x 10000회 집계: {source.stats['fetched']}")
+
+
+if __name__ == "__main__":
+    test_registry_order()
+    test_straggler_does_not_block_others()
+    test_stage_budget_caps_deadlines()
+    test_sources_share_host_limits()
+    test_stats_count_from_threads()
+    print("\n🎉 모든 소스 동시 수집 테스트 통과")
@@ -0,0 +1,131 @@
+"""KoT5 배치 요약 테스트 스크립트 (가짜 토크나이저/모델 사용, 모델 다운로드 불필요)."""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.absolute()
+sys.path.insert(0, str(project_root))
+
+import torch
+
+from agents.summarizer_agent import KoT5Summarizer, SUMMARY_FAILED_MESSAGE
+
+PAD_ID = 0
+
+
+class StubEncoding(dict):
+    """BatchEncoding처럼 .to(device)를 지원하는 dict."""
+
+    def to(self, device):
+        return self
+
+
+class StubTokenizer:
+    """단어 하나를 토큰 하나로 바꾸는 토크나이저."""
+
+    def __init__(self):
+        self.words = ["<pad>"]
+        self.ids = {}
+
+    def __call__(self, text, max_length, truncation):
+        ids = []
+        for word in text.split()[:max_length]:
+            if word not in self.ids:
+                self.ids[word] = len(self.words)
+                self.words.append(word)
+            ids.append(self.ids[word])
+        return {"input_ids": ids}
+
+    def pad(self, features, return_tensors):
+        rows = features["input_ids"]
+        width = max(len(row) for row in rows)
+        input_ids = torch.tensor([row + [PAD_ID] * (width - len(row)) for row in rows])
+        return StubEncoding(input_ids=input_ids, attention_mask=(input_ids != PAD_ID).long())
+
+    def batch_decode(self, sequences, skip_special_tokens):
+        return [" ".join(self.words[i] for i in row.tolist() if i != PAD_ID) for row in sequences]
+
+
+class StubModel:
+    """입력을 그대로 '요약'으로 돌려주고, poison 토큰이 든 배치는 실패시키는 모델."""
+
+    def __init__(self, poison_id=None):
+        self.poison_id = poison_id
+        self.batch_shapes = []
+
+    def generate(self, input_ids, attention_mask, **kwargs):
+        self.batch_shapes.append(tuple(input_ids.shape))
+        if self.poison_id is not None and bool((input_ids == self.poison_id).any()):
+            raise RuntimeError("poisoned batch")
+        return input_ids
+
+
+def _summarizer(batch_size=3, max_batch_tokens=16, poison=None):
+    """_load_model 없이 가짜 토크나이저/모델을 쓰는 요약기."""
+    summarizer = KoT5Summarizer.__new__(KoT5Summarizer)
+    summarizer.model_name = "stub"
+    summarizer.batch_size = batch_size
+    summarizer.max_batch_tokens = max_batch_tokens
+    summarizer.tokenizer = StubTokenizer()
+    poison_id = summarizer.tokenizer(poison, max_length=1, truncation=True)["input_ids"][0] if poison else None
+    summarizer.model = StubModel(poison_id)
+    return summarizer
+
+
+def _texts(lengths):
+    return [" ".join(f"t{index}w{position}" for position in range(length)) for index, length in enumerate(lengths)]
+
+
+def test_make_batches_buckets_by_length():
+    """길이 내림차순으로 묶고 batch_size와 max_batch_tokens(패딩 포함)를 넘지 않는지 테스트."""
+    print("=== 길이별 배치 테스트 ===")
+    summarizer = _summarizer()
+    lengths = [2, 9, 4, 1, 7, 3, 8, 2]
+
+    batches = summarizer._make_batches(lengths, batch_size=3, max_batch_tokens=16)
+
+    flat = [index for batch in batches for index in batch]
+    assert sorted(flat) == list(range(len(lengths)))
+    assert [lengths[i] for i in flat] == sorted(lengths, reverse=True)
+    for batch in batches:
+        assert len(batch) <= 3
+        assert len(batch) == 1 or len(batch) * max(lengths[i] for i in batch) <= 16
+    assert batches == [[1], [6, 4], [2, 5, 0], [7, 3]]
+    print(f"✅ 길이 {lengths} -> 배치 {batches}")
+
+
+def test_summaries_keep_input_order():
+    """길이순으로 배치를 처리해도 요약이 입력 순서대로 반환되는지 테스트."""
+    print("=== 입력 순서 유지 테스트 ===")
+    summarizer = _summarizer()
+    texts = _texts([2, 9, 4, 1, 7, 3, 8, 2])
+
+    summaries = summarizer.summarize_batch(texts, show_progress=False)
+
+    assert summaries == texts
+    assert [rows for rows, _ in summarizer.model.batch_shapes] == [1, 2, 3, 2]
+    assert all(rows * width <= 16 or rows == 1 for rows, width in summarizer.model.batch_shapes)
+    print(f"✅ 요약 {len(summaries)}개, 배치 모양 {summarizer.model.batch_shapes}")
+
+
+def test_failed_batch_retries_items_one_by_one():
+    """배치가 실패하면 샘플을 하나씩 다시 요약하고, 단독으로도 실패한 샘플만 실패 처리하는지 테스트."""
+    print("=== 실패 배치 단일 재시도 테스트 ===")
+    texts = _texts([4, 4, 4, 2])
+    poison = texts[1].split()[0]
+    summarizer = _summarizer(batch_size=4, max_batch_tokens=64, poison=poison)
+
+    summaries = summarizer.summarize_batch(texts, show_progress=False)
+
+    assert summaries == [texts[0], SUMMARY_FAILED_MESSAGE, texts[2], texts[3]]
+    # 배치 1번 + 단일 재시도 4번
+    assert [rows for rows, _ in summarizer.model.batch_shapes] == [4, 1, 1, 1, 1]
+    print(f"✅ 4개 중 {summaries.count(SUMMARY_FAILED_MESSAGE)}개만 실패 처리")
+
+
+if __name__ == "__main__":
+    test_make_batches_buckets_by_length()
+    test_summaries_keep_input_order()
+    test_failed_batch_retries_items_one_by_one()
+    print("\n🎉 모든 요약 배치 테스트 통과")
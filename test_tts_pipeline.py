@@ -0,0 +1,185 @@
+"""TTS 청크 동시 합성 파이프라인 테스트 스크립트 (API 호출 없음)."""
+
+import asyncio
+import random
+import sys
+import tempfile
+import threading
+import time
+import wave
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.absolute()
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from agents.tts_pipeline import TTSPipeline, TTSSynthesisError
+from agents.audio_sink import AudioSink, normalize_wave
+from agents.tts_cache import TTSChunkCache
+
+
+class FakeTTSClient:
+    """google-genai 클라이언트의 models.generate_content를 흉내 내는 테스트 더블.
+
+    프롬프트를 그대로 바이트로 돌려주고, 임의의 지연으로 완료 순서를 섞으며,
+    fail_times에 지정한 프롬프트는 해당 횟수만큼 먼저 실패합니다.
+    """
+
+    def __init__(self, fail_times=None, max_delay=0.05):
+        self.models = self
+        self.fail_times = dict(fail_times or {})
+        self.max_delay = max_delay
+        self.calls = 0
+        self.active = 0
+        self.peak_active = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, model, contents, config=None):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+        try:
+            time.sleep(random.uniform(0, self.max_delay))
+            with self._lock:
+                remaining = self.fail_times.get(contents, 0)
+                if remaining:
+                    self.fail_times[contents] = remaining - 1
+                    raise RuntimeError("503 UNAVAILABLE")
+            part = SimpleNamespace(inline_data=SimpleNamespace(data=contents.encode("utf-8")))
+            return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))])
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_ordered_reassembly_with_bounded_concurrency():
+    """완료 순서와 관계없이 입력 순서대로 합쳐지고 동시 요청 수가 제한되는지 테스트."""
+    print("=== 순서 보존 / 동시성 제한 테스트 ===")
+    prompts = [f"chunk-{i}" for i in range(12)]
+    client = FakeTTSClient()
+    pipeline = TTSPipeline(client, max_concurrency=3, retry_base_delay=0)
+
+    segments = asyncio.run(pipeline.synthesize(prompts))
+
+    assert segments == [prompt.encode("utf-8") for prompt in prompts]
+    assert client.peak_active <= 3
+    print(f"✅ {len(segments)}개 청크 순서 보존, 최대 동시 요청 {client.peak_active}")
+
+
+def test_retry_then_success():
+    """일시적으로 실패한 청크가 재시도로 복구되어 빠지지 않는지 테스트."""
+    print("=== 청크 재시도 테스트 ===")
+    prompts = ["a", "b", "c"]
+    client = FakeTTSClient(fail_times={"b": 2})
+    pipeline = TTSPipeline(client, max_concurrency=2, max_retries=3, retry_base_delay=0)
+
+    segments = asyncio.run(pipeline.synthesize(prompts))
+
+    assert segments == [b"a", b"b", b"c"]
+    assert pipeline.stats["retries"] == 2
+    assert client.calls == 5
+    print(f"✅ 재시도 {pipeline.stats['retries']}회 후 모든 청크 합성")
+
+
+def test_exhausted_retries_raise():
+    """재시도를 모두 소진한 청크가 있으면 빈 구간을 남기지 않고 실패하는지 테스트."""
+    print("=== 재시도 소진 테스트 ===")
+    client = FakeTTSClient(fail_times={"b": 10})
+    pipeline = TTSPipeline(client, max_retries=1, retry_base_delay=0)
+
+    try:
+        asyncio.run(pipeline.synthesize(["a", "b", "c"]))
+    except TTSSynthesisError as e:
+        assert list(e.failed) == [1]
+        print(f"✅ 실패 청크 보고: {e}")
+    else:
+        raise AssertionError("TTSSynthesisError가 발생해야 합니다.")
+
+
+def test_cache_skips_unchanged_chunks():
+    """수정되지 않은 청크는 캐시에서 재사용되고 바뀐 청크만 합성되는지 테스트."""
+    print("=== TTS 청크 캐시 테스트 ===")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = TTSChunkCache(cache_dir=tmp_dir)
+        first = FakeTTSClient(max_delay=0)
+        asyncio.run(TTSPipeline(first, cache=cache).synthesize(["a", "b", "c", "d"]))
+        assert first.calls == 4
+
+        second = FakeTTSClient(max_delay=0)
+        pipeline = TTSPipeline(second, cache=cache)
+        segments = asyncio.run(pipeline.synthesize(["a", "b-수정", "c", "d"]))
+        assert segments == [b"a", "b-수정".encode("utf-8"), b"c", b"d"]
+        assert second.calls == 1
+        assert pipeline.stats["cache_hits"] == 3
+
+        # 음성 설정이 다르면 다른 키
+        other_voices = TTSChunkCache.make_key("a", "model", {"Joe": "Puck"})
+        assert other_voices != TTSChunkCache.make_key("a", "model", {"Joe": "Kore"})
+        print(f"✅ 변경된 청크만 합성: API 호출 {second.calls}회, 캐시 적중 {pipeline.stats['cache_hits']}회")
+
+
+def test_cache_lru_eviction_by_bytes():
+    """전체 크기 한도를 넘으면 가장 오래 사용되지 않은 청크부터 제거되는지 테스트."""
+    print("=== TTS 캐시 LRU 제거 테스트 ===")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = TTSChunkCache(cache_dir=tmp_dir, max_bytes=2500)
+        cache.set("a" * 64, b"x" * 1000)
+        time.sleep(0.01)
+        cache.set("b" * 64, b"x" * 1000)
+        time.sleep(0.01)
+        cache.get("a" * 64)  # a를 최근 사용으로 갱신
+        time.sleep(0.01)
+        cache.set("c" * 64, b"x" * 1000)  # 가장 오래 사용되지 않은 b가 제거됨
+
+        assert cache.get("b" * 64) is None
+        assert cache.get("a" * 64) is not None
+        assert cache.get("c" * 64) is not None
+        assert cache.get_stats()["total_bytes"] == 2000
+        print(f"✅ LRU 제거 확인: {cache.get_stats()}")
+
+
+def _tone_with_silence(seconds, amplitude=3000, rate=24000):
+    """앞뒤에 0.5초 무음이 붙은 220Hz 사인파 PCM을 만듭니다."""
+    t = np.arange(int(rate * seconds)) / rate
+    tone = (amplitude * np.sin(2 * np.pi * 220 * t)).astype("<i2")
+    silence = np.zeros(rate // 2, dtype="<i2")
+    return np.concatenate([silence, tone, silence]).tobytes()
+
+
+def test_streaming_sink_and_normalize():
+    """스트리밍 WAV 기록, 청크 경계 무음 제거/크로스페이드, 2-pass 정규화를 테스트."""
+    print("=== 스트리밍 WAV / 후처리 테스트 ===")
+    config = {"keep_silence_ms": 100, "crossfade_ms": 20, "target_rms_dbfs": -18.0}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = f"{tmp_dir}/episode.wav"
+        sink = AudioSink(path, config)
+        for _ in range(3):
+            sink.write_segment(_tone_with_silence(1.0))
+        stats = sink.close()
+
+        # 청크마다 1초 + 앞뒤 0.1초 무음, 경계 두 곳에서 0.02초씩 겹침
+        expected_frames = 3 * int(24000 * 1.2) - 2 * int(24000 * 0.02)
+        with wave.open(path, "rb") as wav:
+            assert wav.getnframes() == stats["frames"] == expected_frames
+        print(f"✅ 스트리밍 기록: {stats['duration_seconds']}초, RMS {stats['rms_dbfs']} dBFS")
+
+        gain_db = normalize_wave(path, stats, config)
+        with wave.open(path, "rb") as wav:
+            samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2") / 32768.0
+        rms_dbfs = 20 * np.log10(np.sqrt(np.mean(np.square(samples))))
+        assert abs(rms_dbfs - (-18.0)) < 0.1
+        print(f"✅ 정규화: 게인 {gain_db} dB, RMS {rms_dbfs:.2f} dBFS")
+
+
+if __name__ == "__main__":
+    test_ordered_reassembly_with_bounded_concurrency()
+    test_retry_then_success()
+    test_exhausted_retries_raise()
+    test_cache_skips_unchanged_chunks()
+    test_cache_lru_eviction_by_bytes()
+    test_streaming_sink_and_normalize()
+    print("\n🎉 모든 TTS 파이프라인 테스트 통과")
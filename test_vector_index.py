@@ -0,0 +1,88 @@
+"""로컬 IVF-Flat 벡터 인덱스 테스트 스크립트."""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from agents.vector_index import IVFFlatIndex, normalize_rows
+
+DIMENSION = 64
+
+
+def _clustered_vectors(count=4000, clusters=40, seed=0):
+    """주제별로 모인 임베딩을 흉내 낸 정규화된 벡터 (클러스터 중심 + 잡음)."""
+    rng = np.random.default_rng(seed)
+    centers = normalize_rows(rng.normal(size=(clusters, DIMENSION)).astype(np.float32))
+    labels = rng.integers(0, clusters, size=count)
+    vectors = centers[labels] + 0.2 * rng.normal(size=(count, DIMENSION)).astype(np.float32)
+    return normalize_rows(vectors.astype(np.float32))
+
+
+def test_build_and_search():
+    """인덱스에 넣은 벡터로 검색하면 자기 자신이 점수 1로 가장 먼저 나오는지 테스트."""
+    print("=== 구축 / 검색 테스트 ===")
+    vectors = _clustered_vectors(count=1000)
+    index = IVFFlatIndex(nprobe=4).build(vectors)
+
+    assert index.size == 1000
+    assert len(index.inverted_lists) == int(np.sqrt(1000))
+    assert sum(len(ids) for ids in index.inverted_lists) == 1000
+    for row in (0, 123, 999):
+        results = index.search(vectors[row], top_k=5)
+        assert len(results) == 5
+        assert results[0][0] == row and abs(results[0][1] - 1.0) < 1e-5
+        assert [score for _, score in results] == sorted((score for _, score in results), reverse=True)
+    print(f"✅ 벡터 {index.size}개, 클러스터 {len(index.inverted_lists)}개, 구축 {index.build_time * 1000:.0f}ms")
+
+
+def test_recall_against_exact_search():
+    """nprobe개 클러스터만 비교해도 정확한 검색(전수 비교)의 상위 결과를 대부분 찾는지 테스트."""
+    print("=== 재현율 테스트 ===")
+    # 같은 주제 분포에서 뽑은 벡터 중 100개는 인덱스에 넣지 않고 쿼리로 사용
+    vectors = _clustered_vectors(count=4100)
+    vectors, queries = vectors[:4000], vectors[4000:]
+    index = IVFFlatIndex(nprobe=8).build(vectors)
+
+    top_k = 10
+    exact = np.argsort(-(queries @ vectors.T), axis=1)[:, :top_k]
+    hits = 0
+    for query, expected in zip(queries, exact):
+        found = {row for row, _ in index.search(query, top_k=top_k)}
+        hits += len(found & set(expected.tolist()))
+    recall = hits / (len(queries) * top_k)
+
+    # nprobe를 클러스터 전체로 늘리면 전수 비교와 같은 결과
+    full = {row for row, _ in index.search(queries[0], top_k=top_k, nprobe=len(index.inverted_lists))}
+
+    assert recall >= 0.9
+    assert full == set(exact[0].tolist())
+    print(f"✅ recall@{top_k} = {recall:.3f} (nprobe {index.nprobe}/{len(index.inverted_lists)})")
+
+
+def test_empty_index():
+    """벡터가 없어도 구축/검색/저장/지연 측정이 오류 없이 빈 결과를 반환하는지 테스트."""
+    print("=== 빈 인덱스 테스트 ===")
+    empty = np.zeros((0, DIMENSION), dtype=np.float32)
+    index = IVFFlatIndex().build(empty)
+
+    assert index.size == 0 and index.inverted_lists == []
+    assert index.search(np.ones(DIMENSION, dtype=np.float32)) == []
+    assert index.measure_latency(np.ones((3, DIMENSION), dtype=np.float32))["queries"] == 0
+    with tempfile.TemporaryDirectory() as index_dir:
+        index.save(index_dir)
+        loaded = IVFFlatIndex.load(index_dir, empty)
+    assert loaded.size == 0 and loaded.search(np.ones(DIMENSION, dtype=np.float32)) == []
+    print("✅ 빈 인덱스 검색 결과 0개")
+
+
+if __name__ == "__main__":
+    test_build_and_search()
+    test_recall_against_exact_search()
+    test_empty_index()
+    print("\n🎉 모든 벡터 인덱스 테스트 통과")